@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Friday August 12th 2022 02:28:43 pm                                                 #
-# Modified   : Monday August 15th 2022 04:59:41 pm                                                 #
+# Modified   : Saturday October 17th 2026 01:10:00 am                                              #
 # ------------------------------------------------------------------------------------------------ #
 # License    : BSD 3-clause "New" or "Revised" License                                             #
 # Copyright  : (c) 2022 John James                                                                 #
@@ -19,9 +19,12 @@
 """Dataset Module"""
 import os
 import pandas as pd
+import pyarrow as pa
 import logging
 import logging.config
-from aes.utils.io import IO
+from typing import Iterator
+from aes.utils.io import IOFactory
+from aes.utils.memory import compact_dtypes, memory_report
 from aes.utils.config import LogConfig
 
 # ------------------------------------------------------------------------------------------------ #
@@ -39,6 +42,9 @@ class Dataset:
         stage (str): Stage of data processing, e.g.  'raw'. Optional, as None means pending acquisition.
         filepath (str): Path to file
         version (int): Numeric version number
+        stream (bool): If True, the file is not loaded into memory and is read batch by batch
+            with iter_batches. Requires a parquet file.
+        compact (bool): If True, columns are converted to the smallest safe dtypes on load.
     """
 
     __feature_names = [
@@ -57,14 +63,18 @@ class Dataset:
         stage: str = None,
         filepath: str = None,
         version: int = 1,
+        stream: bool = False,
+        compact: bool = True,
     ) -> None:
         self._name = name
         self._stage = stage
         self._filepath = filepath
-        self._fileformat = filepath.splitext()[1].replace(".", "")
+        self._fileformat = os.path.splitext(filepath)[1].replace(".", "")
         self._version = version
+        self._stream = stream
+        self._compact = compact
 
-        self._io = IO(self._fileformat)
+        self._io = IOFactory().io(self._fileformat)
 
         self._feature_names = Dataset.__feature_names
         self._primary_key = Dataset.__primary_key
@@ -72,8 +82,9 @@ class Dataset:
         self._text_var = Dataset.__text_var
 
         self._data = None
+        self._memory_report = None
 
-        if os.path.exists(self._filepath):
+        if os.path.exists(self._filepath) and not self._stream:
             self._load()
 
     @property
@@ -96,6 +107,10 @@ class Dataset:
     def version(self) -> str:
         return self._version
 
+    @property
+    def stream(self) -> bool:
+        return self._stream
+
     @property
     def columns(self) -> list:
         return self._columns
@@ -112,6 +127,11 @@ class Dataset:
     def text_var(self) -> list:
         return self._text_var
 
+    @property
+    def data(self) -> pd.DataFrame:
+        """Every column as read, including those that are not features, e.g. offsets."""
+        return self._data
+
     @property
     def features(self) -> pd.DataFrame:
         return self._data[self._feature_names]
@@ -124,5 +144,32 @@ class Dataset:
     def texts(self) -> pd.DataFrame:
         return self._data[[self._primary_key, self._text_var]]
 
+    def memory_report(self) -> pd.DataFrame:
+        """Returns the bytes used by each column as read from file and after compaction."""
+        if self._memory_report is None and self._data is not None:
+            return memory_report(self._data, self._data)
+        return self._memory_report
+
     def _load(self) -> None:
-        self._data = self._io.read(self._filepath)
+        data = self._io.read(self._filepath)
+        if self._compact:
+            self._data = compact_dtypes(data)
+            self._memory_report = memory_report(data, self._data)
+        else:
+            self._data = data
+
+    def iter_batches(
+        self, batch_size: int = 10000, columns: list = None
+    ) -> Iterator[pa.RecordBatch]:
+        """Yields the dataset as Arrow record batches without loading the whole file.
+
+        Args:
+            batch_size (int): Maximum number of rows per batch.
+            columns (list): Columns to read. Defaults to the primary key and text columns.
+        """
+        if not hasattr(self._io, "iter_batches"):
+            raise NotImplementedError(
+                "Streaming is not supported for {} files.".format(self._fileformat)
+            )
+        columns = columns or [self._primary_key, self._text_var]
+        return self._io.iter_batches(self._filepath, batch_size=batch_size, columns=columns)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /docbin.py                                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:28:53 am                                              #
+# Modified   : Saturday October 17th 2026 01:10:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Sharded DocBin cache of parsed corpora keyed by content hash and model."""
+import os
+import shutil
+import hashlib
+from datetime import datetime
+from typing import Iterable, Iterator
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig, SpacyConfig, resolve_path
+from aes.utils.io import YamlIO
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+MANIFEST = "manifest.yml"
+# ------------------------------------------------------------------------------------------------ #
+
+
+def model_version(model: str) -> str:
+    """Returns the version of an installed spaCy package or of a pipeline saved to disk."""
+    import spacy
+
+    if spacy.util.is_package(model):
+        return spacy.util.get_package_version(model)
+    meta = os.path.join(model, "meta.json")
+    if os.path.exists(meta):
+        return spacy.util.load_meta(meta).get("version")
+    return None
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         DOC CACHE                                                #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class DocCache:
+    """Parsed Docs serialized to sharded spaCy DocBin files, so that a corpus is parsed once.
+
+    Each cached parse is a directory named by its key, holding shard-NNNNN.spacy files of up to
+    shard_size Docs and a manifest. The key hashes the texts, their identifiers, the model name
+    and version, the excluded components and the spaCy version, so a change to any of them is a
+    cache miss. User data, including custom extensions such as doc._.discourse_id, is stored
+    with the Docs. Shards are written to a staging directory that is renamed into place only
+    once the last Doc is written, so an interrupted parse never leaves a partial entry.
+
+    Args:
+        directory (str): Root directory of the cache. Defaults to cache.directory in the spaCy
+            configuration, relative to the project root.
+        shard_size (int): Docs per shard. Defaults to cache.shard_size in the spaCy
+            configuration, or 1000.
+    """
+
+    def __init__(self, directory: str = None, shard_size: int = None) -> None:
+        config = SpacyConfig().config.get("cache", {})
+        self._directory = directory or resolve_path(config.get("directory"))
+        self._shard_size = shard_size or config.get("shard_size", 1000)
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(os.path.join(self._directory, key, MANIFEST))
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def shard_size(self) -> int:
+        return self._shard_size
+
+    @property
+    def keys(self) -> list:
+        """Keys of the complete entries in the cache."""
+        if not os.path.isdir(self._directory):
+            return []
+        return sorted(key for key in os.listdir(self._directory) if key in self)
+
+    def key(
+        self, texts: Iterable[str], model: str, exclude: list = None, ids: Iterable = None
+    ) -> str:
+        """Returns the cache key of a corpus parsed by a model.
+
+        Args:
+            texts (Iterable[str]): The texts, in order.
+            model (str): Name or path of the spaCy pipeline.
+            exclude (list): Components excluded when the pipeline was loaded.
+            ids (Iterable): Optional identifier of each text, e.g. its discourse_id.
+        """
+        import spacy
+
+        digest = hashlib.blake2b(digest_size=16)
+        name = os.path.basename(os.path.normpath(model))
+        header = [name, model_version(model), spacy.__version__]
+        header.extend(sorted(exclude or []))
+        digest.update("\x1f".join(str(value) for value in header).encode("utf-8"))
+        ids = iter(ids) if ids is not None else None
+        for text in texts:
+            digest.update(b"\x1e")
+            if ids is not None:
+                digest.update(str(next(ids)).encode("utf-8") + b"\x1f")
+            digest.update(str(text).encode("utf-8"))
+        return digest.hexdigest()
+
+    def manifest(self, key: str) -> dict:
+        """Returns the manifest of a cached parse: model, version, shard and Doc counts."""
+        return YamlIO().read(os.path.join(self._directory, key, MANIFEST))
+
+    def shards(self, key: str) -> list:
+        """Returns the shard filepaths of a cached parse in corpus order."""
+        directory = os.path.join(self._directory, key)
+        return [os.path.join(directory, shard) for shard in self.manifest(key)["shards"]]
+
+    def save(self, key: str, docs: Iterable, metadata: dict = None) -> Iterator:
+        """Writes Docs to the cache while passing them through.
+
+        The entry is complete, and visible to later runs, once the generator is exhausted.
+
+        Args:
+            key (str): Cache key of the corpus, from key().
+            docs (Iterable[Doc]): The parsed Docs, e.g. the output of nlp.pipe.
+            metadata (dict): Optional values recorded in the manifest, e.g. the model name.
+
+        Yields:
+            Each Doc in docs.
+        """
+        from spacy.tokens import DocBin
+
+        staging = os.path.join(self._directory, "{}.{}".format(key, os.getpid()))
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+        shards, n_docs, lang = [], 0, None
+        docbin = DocBin(store_user_data=True)
+        try:
+            for doc in docs:
+                lang = lang or doc.lang_
+                docbin.add(doc)
+                n_docs += 1
+                yield doc
+                if len(docbin) == self._shard_size:
+                    shards.append(self._write_shard(docbin, staging, len(shards)))
+                    docbin = DocBin(store_user_data=True)
+            if len(docbin) or not shards:
+                shards.append(self._write_shard(docbin, staging, len(shards)))
+        except BaseException:
+            # Includes GeneratorExit when the caller stops iterating early.
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        manifest = dict(metadata or {})
+        manifest.update(
+            {
+                "lang": lang or "en",
+                "docs": n_docs,
+                "shards": shards,
+                "created": datetime.now().isoformat(),
+            }
+        )
+        YamlIO().write(manifest, os.path.join(staging, MANIFEST))
+        destination = os.path.join(self._directory, key)
+        shutil.rmtree(destination, ignore_errors=True)
+        os.replace(staging, destination)
+        logger.info("Cached {} docs in {} shards at {}.".format(n_docs, len(shards), destination))
+
+    def load(self, key: str, vocab=None) -> Iterator:
+        """Yields the cached Docs lazily, reading one shard at a time.
+
+        Args:
+            key (str): Cache key of the corpus.
+            vocab (Vocab): Vocab of the Docs. Defaults to that of a blank pipeline for the
+                cached language, so the model need not be loaded.
+        """
+        for docs in self.iter_shards(key, vocab=vocab):
+            yield from docs
+
+    def iter_shards(self, key: str, vocab=None) -> Iterator[list]:
+        """Yields the Docs of each shard as a list, reading one shard at a time."""
+        import spacy
+        from spacy.tokens import DocBin
+
+        if vocab is None:
+            vocab = spacy.blank(self.manifest(key)["lang"]).vocab
+        for filepath in self.shards(key):
+            yield list(DocBin(store_user_data=True).from_disk(filepath).get_docs(vocab))
+
+    def invalidate(self, key: str) -> None:
+        """Removes a cached parse."""
+        shutil.rmtree(os.path.join(self._directory, key), ignore_errors=True)
+
+    def _write_shard(self, docbin, directory: str, index: int) -> str:
+        shard = "shard-{:05d}.spacy".format(index)
+        docbin.to_disk(os.path.join(directory, shard))
+        return shard
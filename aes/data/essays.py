@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /essays.py                                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:37:23 am                                              #
+# Modified   : Saturday October 17th 2026 01:10:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Essays of the Feedback Prize corpus and the character spans of their discourses."""
+import os
+import re
+import numpy as np
+import pandas as pd
+from typing import Iterable, Iterator
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig, DataConfig, resolve_path
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+def align(essay: str, texts: list) -> list:
+    """Returns the (start, end) character offsets of each discourse text within its essay.
+
+    Discourses appear in essay order, so each is searched for from the end of the previous
+    match, then from the start of the essay. Texts that differ from the essay only in
+    whitespace are matched by a whitespace insensitive search. Texts not found are None.
+
+    Args:
+        essay (str): The full text of the essay.
+        texts (list): The discourse texts of the essay, in essay order.
+    """
+    offsets = []
+    cursor = 0
+    for text in texts:
+        needle = text.strip()
+        if not needle:
+            offsets.append(None)
+            continue
+        start = essay.find(needle, cursor)
+        if start < 0:
+            start = essay.find(needle)
+        if start >= 0:
+            end = start + len(needle)
+        else:
+            pattern = re.compile(r"\s+".join(re.escape(word) for word in needle.split()))
+            match = pattern.search(essay, cursor) or pattern.search(essay)
+            if match is None:
+                offsets.append(None)
+                continue
+            start, end = match.span()
+        offsets.append((start, end))
+        cursor = end
+    return offsets
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        ESSAY STORE                                               #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class EssayStore:
+    """Full essay texts, one '<essay_id>.txt' file per essay as distributed with the corpus.
+
+    Args:
+        directory (str): Directory of the essay files. Defaults to essays.directory in the
+            data configuration, relative to the project root.
+    """
+
+    def __init__(self, directory: str = None) -> None:
+        self._directory = directory or resolve_path(DataConfig().config["essays"]["directory"])
+
+    def __contains__(self, essay_id: str) -> bool:
+        return os.path.exists(self._filepath(essay_id))
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def get(self, essay_id: str) -> str:
+        """Returns the text of the essay, or None if it has no file."""
+        filepath = self._filepath(essay_id)
+        if not os.path.exists(filepath):
+            return None
+        with open(filepath, encoding="utf-8") as file:
+            return file.read()
+
+    def _filepath(self, essay_id: str) -> str:
+        return os.path.join(self._directory, "{}.txt".format(essay_id))
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      DISCOURSE SPANS                                             #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class DiscourseSpans:
+    """Discourses located within the essays they were taken from.
+
+    Each essay is a parse unit, parsed once, and each of its discourses is a character span
+    of the essay's Doc. A discourse whose essay is unavailable, or whose text could not be
+    aligned with it, is its own parse unit spanning the whole of its text.
+
+    Args:
+        ids (list): Identifier of each discourse.
+        units (np.ndarray): Index of the parse unit holding each discourse.
+        starts (np.ndarray): Character offset of each discourse within its unit.
+        ends (np.ndarray): Character offset of the end of each discourse within its unit.
+        texts (list): Text of each parse unit.
+        unit_ids (list): Essay of each parse unit.
+        essay_ids (list): Essay of each discourse.
+        aligned (np.ndarray): Whether each discourse was located within its essay.
+    """
+
+    def __init__(
+        self,
+        ids: list,
+        units: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        texts: list,
+        unit_ids: list,
+        essay_ids: list,
+        aligned: np.ndarray,
+    ) -> None:
+        self._ids = ids
+        self._units = units
+        self._starts = starts
+        self._ends = ends
+        self._texts = texts
+        self._unit_ids = unit_ids
+        self._essay_ids = essay_ids
+        self._aligned = aligned
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def ids(self) -> list:
+        return self._ids
+
+    @property
+    def units(self) -> np.ndarray:
+        return self._units
+
+    @property
+    def starts(self) -> np.ndarray:
+        return self._starts
+
+    @property
+    def ends(self) -> np.ndarray:
+        return self._ends
+
+    @property
+    def texts(self) -> list:
+        """Text of each parse unit, in the order the units are first needed."""
+        return self._texts
+
+    @property
+    def unit_ids(self) -> list:
+        return self._unit_ids
+
+    @property
+    def aligned(self) -> np.ndarray:
+        """Whether each discourse was located within its essay, and so parsed in context."""
+        return self._aligned
+
+    @classmethod
+    def from_frame(
+        cls,
+        data: pd.DataFrame,
+        essays: EssayStore = None,
+        idvar: str = "discourse_id",
+        text_col: str = "discourse_text",
+        essay_col: str = "essay_id",
+        start_col: str = "discourse_start",
+        end_col: str = "discourse_end",
+    ) -> "DiscourseSpans":
+        """Locates every discourse of a DataFrame in its essay.
+
+        Offsets are read from the start and end columns where the data has them, as in the
+        2021 competition data. Otherwise each discourse text is aligned with its essay.
+
+        Args:
+            data (pd.DataFrame): Discourses with identifier, text and essay columns.
+            essays (EssayStore): Source of the essay texts. Defaults to the configured store.
+            idvar (str): The discourse identifier column.
+            text_col (str): The column containing the discourse texts.
+            essay_col (str): The column containing the essay identifiers.
+            start_col (str): The column of start offsets, if present.
+            end_col (str): The column of end offsets, if present.
+        """
+        essays = essays if essays is not None else EssayStore()
+        ids = data[idvar].tolist()
+        texts = data[text_col].tolist()
+        essay_ids = data[essay_col].tolist()
+        has_offsets = start_col in data.columns and end_col in data.columns
+
+        if has_offsets:
+            data_starts, data_ends = data[start_col].to_numpy(), data[end_col].to_numpy()
+
+        offsets = [None] * len(ids)
+        essay_texts = {}
+        for essay_id, rows in data.groupby(essay_col, sort=False).indices.items():
+            essay = essays.get(essay_id)
+            if essay is None:
+                continue
+            essay_texts[essay_id] = essay
+            if has_offsets:
+                located = [(int(data_starts[row]), int(data_ends[row])) for row in rows]
+            else:
+                located = align(essay, [texts[row] for row in rows])
+            for row, offset in zip(rows, located):
+                offsets[row] = offset
+
+        # Parse units are keyed by essay, or by discourse for those parsed on their own.
+        units = np.empty(len(ids), dtype=np.int64)
+        starts = np.zeros(len(ids), dtype=np.int64)
+        ends = np.zeros(len(ids), dtype=np.int64)
+        unit_texts, unit_ids, index = [], [], {}
+        for row, offset in enumerate(offsets):
+            if offset is None:
+                key, text = ("discourse", ids[row]), texts[row]
+                starts[row], ends[row] = 0, len(text)
+            else:
+                key, text = ("essay", essay_ids[row]), essay_texts[essay_ids[row]]
+                starts[row], ends[row] = offset
+            if key not in index:
+                index[key] = len(unit_texts)
+                unit_texts.append(text)
+                unit_ids.append(essay_ids[row])
+            units[row] = index[key]
+
+        aligned = np.array([offset is not None for offset in offsets], dtype=bool)
+        if not aligned.all():
+            logger.warning(
+                "{} of {} discourses could not be located in an essay and are parsed "
+                "without their context.".format(int((~aligned).sum()), len(ids))
+            )
+        return cls(ids, units, starts, ends, unit_texts, unit_ids, essay_ids, aligned)
+
+    def slice(self, docs: Iterable) -> Iterator:
+        """Yields a Doc for each discourse, sliced from the parsed Docs of the parse units.
+
+        The slices are yielded in discourse order. Docs of the parse units are consumed as
+        they are needed and released once all their discourses have been yielded, so only a
+        few are held at a time when the discourses of an essay are contiguous.
+
+        Args:
+            docs (Iterable): A spaCy Doc for each parse unit, in the order of texts.
+        """
+        from spacy.tokens import Doc
+
+        for name in ["discourse_id", "essay_id"]:
+            if not Doc.has_extension(name):
+                Doc.set_extension(name, default=None)
+
+        docs = iter(docs)
+        loaded = {}
+        remaining = np.bincount(self._units, minlength=len(self._texts))
+        n_loaded = 0
+        for row, unit in enumerate(self._units):
+            while unit not in loaded:
+                loaded[n_loaded] = next(docs)
+                n_loaded += 1
+            doc = loaded[unit]
+            span = doc.char_span(
+                int(self._starts[row]), int(self._ends[row]), alignment_mode="expand"
+            )
+            sliced = (span if span is not None else doc[0:0]).as_doc()
+            sliced._.discourse_id = self._ids[row]
+            sliced._.essay_id = self._essay_ids[row]
+            yield sliced
+            remaining[unit] -= 1
+            if remaining[unit] == 0:
+                del loaded[unit]
+        # Exhaust the Docs so that a generator writing them, e.g. to the cache, completes.
+        for _ in docs:
+            pass
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /models.py                                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:33:55 am                                              #
+# Modified   : Saturday October 17th 2026 12:33:55 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Tiers of spaCy pipelines and selection of the cheapest installed pipeline for a task."""
+import os
+from typing import Iterable
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig, SpacyConfig
+from aes.data.docbin import model_version
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ModelTier:
+    """A spaCy pipeline at a given level of annotation quality.
+
+    Args:
+        name (str): Name of the tier, e.g. 'sm'.
+        model (str): Name of the installed package, or path of the pipeline on disk.
+        rank (int): Position of the tier from cheapest and least accurate, 0, upwards.
+    """
+
+    def __init__(self, name: str, model: str, rank: int) -> None:
+        self._name = name
+        self._model = model
+        self._rank = rank
+
+    def __repr__(self) -> str:
+        return "ModelTier(name={}, model={}, rank={})".format(self._name, self._model, self._rank)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    @property
+    def rank(self) -> int:
+        return self._rank
+
+    @property
+    def installed(self) -> bool:
+        """Whether the pipeline is an installed package or a saved pipeline directory."""
+        import spacy
+
+        if spacy.util.is_package(self._model):
+            return True
+        return os.path.exists(os.path.join(self._model, "meta.json"))
+
+    def provenance(self) -> dict:
+        """Returns the tier, model and model version, for recording alongside its output."""
+        return {"tier": self._name, "model": self._model, "version": model_version(self._model)}
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       MODEL SELECTOR                                             #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ModelSelector:
+    """Picks the cheapest installed spaCy pipeline that meets every requested quality.
+
+    Tiers are listed from cheapest to most accurate under models.tiers in the spaCy
+    configuration, e.g. sm, md and trf. The selected tier is the first installed tier at or
+    above the highest requested quality. If none is installed, the most accurate installed
+    tier below it is used instead and a warning is logged.
+
+    Args:
+        tiers (list): Dictionaries with the name and model of each tier, cheapest first.
+            Defaults to models.tiers in the spaCy configuration, or a single tier holding
+            models.trained.
+    """
+
+    def __init__(self, tiers: list = None) -> None:
+        if tiers is None:
+            config = SpacyConfig().config["models"]
+            tiers = config.get("tiers") or [{"name": "trained", "model": config["trained"]}]
+        self._tiers = [
+            ModelTier(name=tier["name"], model=tier["model"], rank=rank)
+            for rank, tier in enumerate(tiers)
+        ]
+
+    @property
+    def tiers(self) -> list:
+        return self._tiers
+
+    def tier(self, name: str) -> ModelTier:
+        """Returns the named tier."""
+        for tier in self._tiers:
+            if tier.name == name:
+                return tier
+        msg = "Model tier {} is not configured. Tiers are {}.".format(
+            name, [tier.name for tier in self._tiers]
+        )
+        logger.error(msg)
+        raise ValueError(msg)
+
+    def select(self, qualities: Iterable[str] = None) -> ModelTier:
+        """Returns the cheapest installed tier meeting every quality.
+
+        Args:
+            qualities (Iterable[str]): Minimum tier names required, e.g. ['sm', 'md']. None
+                entries place no requirement.
+
+        Raises:
+            OSError if no configured pipeline is installed.
+        """
+        ranks = [self.tier(quality).rank for quality in qualities or [] if quality]
+        required = max(ranks, default=0)
+        for tier in self._tiers[required:]:
+            if tier.installed:
+                logger.debug("Selected spaCy model {}.".format(tier))
+                return tier
+        for tier in reversed(self._tiers[:required]):
+            if tier.installed:
+                logger.warning(
+                    "No spaCy model of tier {} or above is installed. Falling back to {}.".format(
+                        self._tiers[required].name, tier.model
+                    )
+                )
+                return tier
+        msg = "None of the spaCy models {} is installed.".format(
+            [tier.model for tier in self._tiers]
+        )
+        logger.error(msg)
+        raise OSError(msg)
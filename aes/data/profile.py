@@ -10,7 +10,7 @@
 # URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Wednesday August 3rd 2022 05:21:41 am                                               #
-# Modified   : Monday August 15th 2022 04:59:41 pm                                                 #
+# Modified   : Saturday October 17th 2026 01:10:00 am                                              #
 # ------------------------------------------------------------------------------------------------ #
 # License    : BSD 3-clause "New" or "Revised" License                                             #
 # Copyright  : (c) 2022 John James                                                                 #
@@ -26,12 +26,18 @@ import logging.config
 import matplotlib.pyplot as plt
 import seaborn as sns
 from copy import copy
+from typing import Iterator
+import time
 import spacy
 from spacy.tokens import Doc
 
 # ------------------------------------------------------------------------------------------------ #
 from aes.utils.config import LogConfig, SpacyConfig
 from aes.data.dataset import Dataset
+from aes.data.docbin import DocCache, model_version
+from aes.data.essays import DiscourseSpans, EssayStore
+from aes.data.models import ModelSelector
+from aes.data.token_table import TokenTable
 
 # ------------------------------------------------------------------------------------------------ #
 logging.config.dictConfig(LogConfig().config)
@@ -44,12 +50,17 @@ class Profile:
 
     Args:
         dataset (Dataset): The Dataset object the profile represents
-        metadata (pd.DataFrame): Token level metadata
+        token_table (TokenTable): Token level metadata in columnar form
+        model (dict): Tier, name and version of the spaCy model that produced the metadata
 
     """
 
-    def __init__(self, dataset: Dataset) -> None:
+    def __init__(
+        self, dataset: Dataset, token_table: TokenTable = None, model: dict = None
+    ) -> None:
         self._dataset = dataset
+        self._token_table = token_table
+        self._model = model
         self._token_data = None
         self._created = datetime.now()
 
@@ -61,18 +72,150 @@ class Profile:
     def filepath(self) -> str:
         return self._dataset.filepath
 
+    @property
+    def token_table(self) -> TokenTable:
+        return self._token_table
+
+    @property
+    def model(self) -> dict:
+        return self._model
+
+    @property
+    def token_data(self) -> pd.DataFrame:
+        """Token level metadata as a DataFrame, materialized from the token table on request."""
+        if self._token_data is None and self._token_table is not None:
+            self._token_data = self._token_table.to_pandas()
+        return self._token_data
+
+    @property
+    def created(self) -> datetime:
+        return self._created
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                   COMPONENT REQUIREMENTS                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Pipeline components that set each token attribute. Attributes not listed, e.g. token.text or
+# token.is_alpha, are lexical and are set by the tokenizer alone.
+ATTRIBUTE_COMPONENTS = {
+    "pos": ["tagger", "attribute_ruler", "morphologizer"],
+    "tag": ["tagger"],
+    "morph": ["morphologizer", "attribute_ruler"],
+    "lemma": ["tagger", "attribute_ruler", "morphologizer", "lemmatizer"],
+    "dep": ["parser"],
+    "head": ["parser"],
+    "sent": ["senter"],
+    "is_sent_start": ["senter"],
+    "is_sent_end": ["senter"],
+    "ent_type": ["ner"],
+    "ent_iob": ["ner"],
+}
+# Minimum model tier for attributes needing more than part-of-speech accuracy. Other attributes
+# set by a trained component need the 'sm' tier, and lexical attributes need no model at all.
+ATTRIBUTE_QUALITY = {"dep": "md", "head": "md", "ent_type": "md", "ent_iob": "md"}
+# Components that only feed other components. They are kept if any component they feed is.
+EMBEDDING_COMPONENTS = ["tok2vec", "transformer"]
+# Trained and rule based components of the spaCy English pipelines, excluded unless required.
+PIPELINE_COMPONENTS = set(
+    [name for names in ATTRIBUTE_COMPONENTS.values() for name in names]
+    + EMBEDDING_COMPONENTS
+    + ["entity_ruler", "entity_linker", "textcat", "textcat_multilabel", "spancat"]
+)
+# ------------------------------------------------------------------------------------------------ #
+
+
+def attribute_name(attribute: str) -> str:
+    """Returns the spaCy attribute of a configured name, e.g. 'pos' for 'token.pos_'."""
+    return attribute.split(".")[-1].rstrip("_")
+
+
+def required_components(attributes: list) -> set:
+    """Returns the pipeline components needed to set the given token attributes."""
+    components = set()
+    for attribute in attributes:
+        components.update(ATTRIBUTE_COMPONENTS.get(attribute_name(attribute), []))
+    if components:
+        components.update(EMBEDDING_COMPONENTS)
+    return components
+
+
+def required_quality(attributes: list) -> str:
+    """Returns the minimum model tier for the given token attributes, or None if no model."""
+    qualities = set()
+    for attribute in attributes:
+        name = attribute_name(attribute)
+        if name in ATTRIBUTE_QUALITY:
+            qualities.add(ATTRIBUTE_QUALITY[name])
+        elif name in ATTRIBUTE_COMPONENTS:
+            qualities.add("sm")
+    return "md" if "md" in qualities else ("sm" if qualities else None)
+
 
 # ------------------------------------------------------------------------------------------------ #
 
 
 class ProfileBuilder:
-    """Constructs a Profile for a dataset"""
+    """Constructs a Profile for a dataset
+
+    Only the pipeline components needed for the configured token attributes are loaded. The
+    rest, e.g. the named entity recognizer when no entity attribute is requested, are
+    excluded when the model is loaded. Sentence boundaries are taken from the parser only
+    when a dependency attribute requires it. Parsed Docs are stored in the DocCache, and a
+    later build of the same corpus with the same model and components reads them from the
+    cache without loading the model. Unless a model is given, the cheapest installed model
+    tier meeting the quality the token attributes require is used, and recorded in the
+    Profile.
+
+    Discourses are parsed one by one, or, with unit 'essay', each essay is parsed once and
+    every discourse is sliced from its essay's Doc by character offsets. Slices keep the
+    sentence boundaries and parse of the full essay, and far fewer texts go through the
+    pipeline. Discourses that cannot be located in their essay are parsed on their own.
 
-    def __init__(self) -> None:
+    Args:
+        n_process (int): Number of processes used by nlp.pipe. Defaults to the profile
+            pipeline's n_process in the spaCy configuration, or 1.
+        batch_size (int): Number of texts per batch in nlp.pipe. Defaults to the profile
+            pipeline's batch_size in the spaCy configuration, or 256.
+        model (str): Name or path of the spaCy pipeline. Defaults to the model selected from
+            the configured tiers.
+        cache (DocCache): Cache of parsed Docs. Defaults to the configured DocCache.
+        selector (ModelSelector): Chooses the model tier. Defaults to the configured tiers.
+        unit (str): Either 'discourse' or 'essay', the text passed to the pipeline. Defaults
+            to the profile pipeline's unit in the spaCy configuration, or 'discourse'.
+        essays (EssayStore): Source of the essay texts when the unit is 'essay'. Defaults to
+            the configured store.
+    """
 
+    def __init__(
+        self,
+        n_process: int = None,
+        batch_size: int = None,
+        model: str = None,
+        cache: DocCache = None,
+        selector: ModelSelector = None,
+        unit: str = None,
+        essays: EssayStore = None,
+    ) -> None:
+        self._dataset = None
+        self._essays = essays
+        self._spans = None
+        self._cache = cache if cache is not None else DocCache()
+        self._selector = selector
+        self._model = model  # The requested model, or None to select one on each build.
+        self._selected = None  # Name or path of the model used by the last build.
+        self._provenance = None
+        self._token_attributes = None
+        self._n_process = None
+        self._batch_size = None
+        self._unit = None
+        self._get_config()
+        self._n_process = n_process or self._n_process
+        self._batch_size = batch_size or self._batch_size
+        self._unit = unit or self._unit
+        if self._unit not in ["discourse", "essay"]:
+            raise ValueError("Parse unit must be 'discourse' or 'essay', not {}.".format(unit))
 
         self.reset()
-        self._get_config()
 
     @property
     def dataset(self) -> Dataset:
@@ -81,46 +224,99 @@ class ProfileBuilder:
     @dataset.setter
     def dataset(self, dataset: Dataset) -> None:
         self._dataset = dataset
-        self._reset()
+        self.reset()
 
     @property
     def profile(self) -> Profile:
         return self._profile
 
+    @property
+    def throughput(self) -> float:
+        """Documents per second processed by the last pipeline run."""
+        return self._throughput
+
+    @property
+    def disabled(self) -> list:
+        """Components excluded or disabled in the last pipeline run."""
+        return self._disabled
+
+    @property
+    def model(self) -> dict:
+        """Tier, name and version of the spaCy model used by the last build."""
+        return self._provenance
+
+    @property
+    def unit(self) -> str:
+        return self._unit
+
+    @property
+    def spans(self) -> DiscourseSpans:
+        """Discourses located in their essays by the last build with unit 'essay'."""
+        return self._spans
+
+    @property
+    def cached(self) -> bool:
+        """Whether the Docs of the last build were read from the cache."""
+        return self._cached
+
     def build(self) -> None:
         """Obtains data from dataset and orchestrates build process."""
 
-        # Convert texts to a list of tuples of the format (text,{'discourse_id': discourse_id}).
-        # The second tuple element will be added to the spacy document as context.
+        # Convert texts to a list of tuples of the format (text,{'discourse_id': discourse_id}),
+        # or (text,{'essay_id': essay_id}) when essays are parsed. The second tuple element
+        # will be added to the spacy document as context.
         texts = self._get_texts_with_metadata()
 
+        # Choose the cheapest installed model meeting the quality the attributes require.
+        self._select_model()
+
         # Run the pipeline and add 'discourse_id' to document object as custom attribute.
         docs = self._run_pipeline(texts)
 
+        # Slice each discourse from the Doc of its essay.
+        if self._spans is not None:
+            docs = self._spans.slice(docs)
+
         # Create token_level metadata from data extracted from the doc objects.
-        token_data = self._extract_token_data(docs)
+        token_table = self._extract_token_data(docs)
+        self._profile = Profile(
+            dataset=self._dataset, token_table=token_table, model=self._provenance
+        )
 
     def reset(self) -> None:
-        """Resets the profile object."""
-        self._dataset = None
+        """Resets the profile built from the dataset."""
         self._profile = None
-        self._model = None
-        self._pipeline = None
-        self._token_attributes = None
-
-        self._token_data = None
-        self._sentence_data = None
+        self._throughput = None
+        self._disabled = None
+        self._cached = None
+        self._spans = None
+
+    def _select_model(self) -> None:
+        if self._model is not None:
+            self._selected = self._model
+            self._provenance = {
+                "tier": None,
+                "model": self._model,
+                "version": model_version(self._model),
+            }
+            return
+        selector = self._selector if self._selector is not None else ModelSelector()
+        tier = selector.select([required_quality(self._token_attributes)])
+        self._provenance = tier.provenance()
+        self._selected = tier.model
 
     def _get_config(self) -> None:
-        """Obtains spaCy model and pipeline configurations."""
+        """Obtains the profile pipeline configuration."""
         config = SpacyConfig().config
         try:
-            self._model = config["models"]["trained"]
-            self._pipeline = config["pipelines"]["profile"]['components']
-            self._token_attributes = config['pipelines']['profile']['token_attributes']
+            pipeline = config["pipelines"]["profile"]
+            self._token_attributes = pipeline["token_attributes"]
         except KeyError as e:
-            logger.error("The required trained model not found in spaCy configuration file.")
+            logger.error("The profile pipeline is not found in the spaCy configuration file.")
             raise (e)
+        self._n_process = pipeline.get("n_process", 1)
+        self._batch_size = pipeline.get("batch_size", 256)
+        self._unit = pipeline.get("unit", "discourse")
 
     def _get_texts_with_metadata(self) -> list:
         """Returns text as a list of tuples including text and 'discourse_id'.
@@ -132,60 +328,125 @@ class ProfileBuilder:
 
         Source:https://spacy.io/usage/processing-pipelines
 
+        When the unit is 'essay', the texts are those of the essays holding the discourses,
+        each identified by its 'essay_id'.
         """
-        texts = self._dataset.get_texts(with_id=True)
-        recs = texts.to_dict(orient="records")
-        texts = []
-        for d in recs:
-            text = (d["discourse_text"], {"discourse_id": d["discourse_id"]})
-            texts.append(text)
-        return texts
-
-    def _run_pipeline(self, texts: list) -> None:
-        """Executes a spaCy pipeline."""
-
-        # Load the trained model and run the pipeline
-        nlp = spacy.load(self._model)
-        doc_tuples = nlp.pipe(texts, as_tuples=True)
-
-        # Add the 'discourse_id' from context to the document object.
-        docs = []
+        if self._unit == "essay":
+            # The full frame carries the discourse_start and discourse_end offsets, if any.
+            self._spans = DiscourseSpans.from_frame(self._dataset.data, essays=self._essays)
+            logger.info(
+                "Located {} of {} discourses in {} essays.".format(
+                    int(self._spans.aligned.sum()), len(self._spans), len(self._spans.texts)
+                )
+            )
+            return list(
+                zip(
+                    self._spans.texts,
+                    ({"essay_id": essay_id} for essay_id in self._spans.unit_ids),
+                )
+            )
+        texts = self._dataset.texts
+        return list(
+            zip(
+                texts["discourse_text"].tolist(),
+                ({"discourse_id": discourse_id} for discourse_id in texts["discourse_id"].tolist()),
+            )
+        )
+
+    def _load(self) -> spacy.language.Language:
+        """Loads the model without the components the token attributes do not need."""
+        required = required_components(self._token_attributes)
+        exclude = self._exclude()
+        nlp = spacy.load(self._selected, exclude=exclude)
+
+        # Sentence boundaries come from the parser if it is loaded anyway, otherwise from the
+        # sentence recognizer or, for pipelines without one, the rule based sentencizer.
+        if "senter" in required and "parser" not in nlp.pipe_names:
+            if "senter" in nlp.disabled:
+                nlp.enable_pipe("senter")
+            elif "senter" not in nlp.pipe_names:
+                nlp.add_pipe("sentencizer")
+        self._disabled = sorted(set(exclude) | set(nlp.disabled))
+        logger.info(
+            "Loaded {} with components {}. Excluded {}.".format(
+                self._selected, nlp.pipe_names, self._disabled
+            )
+        )
+        return nlp
+
+    def _exclude(self) -> list:
+        """Returns the components not needed for the token attributes."""
+        return sorted(PIPELINE_COMPONENTS - required_components(self._token_attributes))
+
+    def _parse(self, texts: list) -> Iterator[Doc]:
+        """Parses the texts, adding the identifier from context to each Doc."""
+        nlp = self._load()
+        doc_tuples = nlp.pipe(
+            texts, as_tuples=True, batch_size=self._batch_size, n_process=self._n_process
+        )
         for doc, context in doc_tuples:
-            doc._.discourse_id = context[
-                "discourse_id"
-            ]  # The underscore is required for the addition of custom attributes.
-            docs.append(doc)
-
-        return docs
-
-    def _extract_token_data(self, docs: list) -> pd.DataFrame:
-        """Extracts token data from each document and creates token level data frame."""
-        doc_arrays = []
-        for doc in docs:
-            doc.to_array(attr_ids = self._token_attributes)
-        return [
-        (d.doc._.discourse_id,
-        d.i,
-        d.vocab,
-        d.text,
-        d.sent,
-        d.is_alpha,
-        d.is_ascii,
-        d.is_digit,
-        d.is_lower,
-        d.is_upper,
-        d.is_title,
-        d.is_punct,
-        d.is_left_punct,
-        d.is_right_punct,
-        d.is_sent_start,
-        d.is_sent_end,
-        d.is_space,
-        d.is_bracket,
-        d.is_quote,
-        d.is_currency,
-        d.like_url,
-        d.like_num,
-        d.like_email,
-        d.is_oov,
-        d.is_stop) for d in doc:
+            for name, value in context.items():
+                # The underscore is required for the addition of custom attributes.
+                doc._.set(name, value)
+            yield doc
+
+    def _run_pipeline(self, texts: list) -> Iterator[Doc]:
+        """Yields the Docs of the texts, parsed or read from the cache a shard at a time.
+
+        Docs are streamed rather than collected, so only a shard of them is held in memory.
+        Docs per second are reported as they are consumed, and throughput once exhausted.
+        """
+        for name in ["discourse_id", "essay_id"]:
+            if not Doc.has_extension(name):
+                Doc.set_extension(name, default=None)
+
+        exclude = self._exclude()
+        key = self._cache.key(
+            (text for text, _ in texts),
+            self._selected,
+            exclude=exclude,
+            ids=(value for _, context in texts for value in context.values()),
+        )
+        self._cached = key in self._cache
+        if self._cached:
+            logger.info("Reading parsed documents from cache entry {}.".format(key))
+            self._disabled = exclude
+            doc_iter = self._cache.load(key)
+        else:
+            metadata = {
+                "model": self._selected,
+                "version": model_version(self._selected),
+                "exclude": exclude,
+            }
+            doc_iter = self._cache.save(key, self._parse(texts), metadata=metadata)
+
+        n_docs = 0
+        started = time.perf_counter()
+        for doc in doc_iter:
+            n_docs += 1
+            yield doc
+            if n_docs % self._batch_size == 0:
+                elapsed = time.perf_counter() - started
+                logger.info(
+                    "Processed {} of {} documents at {:.1f} docs/sec.".format(
+                        n_docs, len(texts), n_docs / elapsed
+                    )
+                )
+
+        elapsed = time.perf_counter() - started
+        self._throughput = n_docs / elapsed if elapsed > 0 else float("nan")
+        logger.info(
+            "Processed {} documents in {:.1f} seconds with {} processes: {:.1f} docs/sec.".format(
+                n_docs, elapsed, 1 if self._cached else self._n_process, self._throughput
+            )
+        )
+
+    def _extract_token_data(self, docs: Iterator[Doc]) -> TokenTable:
+        """Exports the token attributes of every document into a columnar token table."""
+        token_table = TokenTable.from_docs(docs, self._token_attributes)
+        logger.debug(
+            "Extracted {} attributes of {} tokens in {} bytes.".format(
+                len(token_table.columns), len(token_table), token_table.nbytes
+            )
+        )
+        return token_table
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /token_table.py                                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:30:47 am                                              #
+# Modified   : Saturday October 17th 2026 01:10:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Columnar token table exported with Doc.to_array and stored as memory-mapped files."""
+import os
+from typing import Iterable
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig
+from aes.utils.io import YamlIO
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+# Token attributes exported with Doc.to_array: attribute -> (spaCy attribute id name, kind).
+# String attributes are exported as StringStore hashes and decoded on demand.
+EXPORTED = {
+    "text": ("ORTH", "string"),
+    "lower": ("LOWER", "string"),
+    "norm": ("NORM", "string"),
+    "shape": ("SHAPE", "string"),
+    "lemma": ("LEMMA", "string"),
+    "pos": ("POS", "string"),
+    "tag": ("TAG", "string"),
+    "dep": ("DEP", "string"),
+    "ent_type": ("ENT_TYPE", "string"),
+    "ent_iob": ("ENT_IOB", "int"),
+    "head": ("HEAD", "int"),
+    "idx": ("IDX", "int"),
+    "is_sent_start": ("SENT_START", "bool"),
+}
+for _flag in [
+    "is_alpha",
+    "is_ascii",
+    "is_digit",
+    "is_lower",
+    "is_upper",
+    "is_title",
+    "is_punct",
+    "is_left_punct",
+    "is_right_punct",
+    "is_space",
+    "is_bracket",
+    "is_quote",
+    "is_currency",
+    "like_url",
+    "like_num",
+    "like_email",
+    "is_stop",
+]:
+    EXPORTED[_flag] = (_flag.upper(), "bool")
+# Attributes computed from the exported columns and the document offsets.
+DERIVED = {"i": None, "sent": "is_sent_start", "is_sent_end": "is_sent_start"}
+_DTYPES = {"string": np.uint64, "int": np.int32, "bool": np.bool_}
+# ------------------------------------------------------------------------------------------------ #
+
+
+def _name(attribute: str) -> str:
+    """Returns the column of a configured attribute, e.g. 'pos' for 'token.pos_'."""
+    return attribute.split(".")[-1].rstrip("_")
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        TOKEN TABLE                                               #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class TokenTable:
+    """Token attributes of a parsed corpus as contiguous per-attribute NumPy columns.
+
+    Every Doc is exported once with Doc.to_array. The tokens of document d occupy rows
+    offsets[d]:offsets[d + 1] of every column. String attributes are stored as uint64
+    StringStore hashes and the strings they refer to are kept in a separate table, so
+    decoding is one lookup per distinct value. Saved tables are a directory of .npy columns
+    and Arrow IPC files that are memory mapped when opened, so opening costs no reads.
+
+    Args:
+        columns (dict): Column arrays keyed by attribute name.
+        offsets (np.ndarray): Offsets of the first token of each document, plus the total.
+        ids (pa.Array): Identifier of each document, e.g. its discourse_id.
+        strings (dict): Strings keyed by hash, for every hash in the string columns.
+        attributes (list): The configured attributes, e.g. 'token.pos_', in output order.
+    """
+
+    def __init__(
+        self,
+        columns: dict,
+        offsets: np.ndarray,
+        ids: pa.Array,
+        strings: dict,
+        attributes: list,
+    ) -> None:
+        self._columns = columns
+        self._offsets = offsets
+        self._ids = ids
+        self._strings = strings
+        self._attributes = attributes
+
+    def __len__(self) -> int:
+        return int(self._offsets[-1])
+
+    @property
+    def columns(self) -> list:
+        return list(self._columns.keys())
+
+    @property
+    def offsets(self) -> np.ndarray:
+        return self._offsets
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.diff(self._offsets)
+
+    @property
+    def ids(self) -> pa.Array:
+        return self._ids
+
+    @property
+    def n_docs(self) -> int:
+        return len(self._offsets) - 1
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self._columns.values()) + self._offsets.nbytes
+
+    def column(self, name: str) -> np.ndarray:
+        """Returns a column by attribute name, e.g. 'pos'. String columns hold hashes."""
+        return self._columns[_name(name)]
+
+    def decode(self, name: str) -> pd.Categorical:
+        """Returns a string column as a Categorical of its distinct strings."""
+        values = self.column(name)
+        uniques, codes = np.unique(values, return_inverse=True)
+        categories = [self._strings.get(int(value), "") for value in uniques]
+        return pd.Categorical.from_codes(codes.ravel(), categories=pd.Index(categories))
+
+    # -------------------------------------------------------------------------------------------- #
+    @classmethod
+    def from_docs(cls, docs: Iterable, attributes: list, id_attribute: str = "discourse_id"):
+        """Exports the token attributes of each Doc once with Doc.to_array.
+
+        Args:
+            docs (Iterable): Parsed Docs sharing a Vocab, e.g. a generator streaming them.
+            attributes (list): Configured attributes, e.g. 'token.pos_'. Attributes that are not
+                scalar or cannot be exported, e.g. 'token.vocab', are skipped.
+            id_attribute (str): Doc extension holding the document identifier.
+        """
+        names = []
+        for attribute in attributes:
+            name = _name(attribute)
+            if not attribute.startswith("token."):
+                continue
+            if name in EXPORTED or name in DERIVED:
+                names.append(name)
+            else:
+                logger.debug("Token attribute {} cannot be exported. Skipped.".format(attribute))
+        names = list(dict.fromkeys(names))
+        exported = [DERIVED.get(name, name) if name in DERIVED else name for name in names]
+        exported = [name for name in dict.fromkeys(exported) if name is not None]
+        attr_ids = [EXPORTED[name][0] for name in exported]
+
+        # A single pass over the Docs, so they may be streamed and released one at a time.
+        arrays, ids, vocab = [], [], None
+        for doc in docs:
+            arrays.append(doc.to_array(attr_ids).reshape(-1, len(attr_ids)))
+            ids.append(getattr(doc._, id_attribute, None))
+            vocab = doc.vocab
+        counts = np.array([len(array) for array in arrays], dtype=np.int64)
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        if arrays:
+            array = np.concatenate(arrays)
+        else:
+            array = np.empty((0, len(attr_ids)), dtype=np.uint64)
+        ids = pa.array(ids)
+
+        columns, strings = {}, {}
+        for j, name in enumerate(exported):
+            kind = EXPORTED[name][1]
+            values = array[:, j]
+            if name == "is_sent_start":
+                values = values.astype(np.int64) == 1
+                values[offsets[:-1][counts > 0]] = True
+            elif kind == "int":
+                values = values.astype(np.int64)
+            columns[name] = np.ascontiguousarray(values.astype(_DTYPES[kind]))
+            if kind == "string" and vocab is not None:
+                for value in np.unique(values):
+                    strings[int(value)] = vocab.strings[int(value)] if value else ""
+        columns.update(cls._derive(names, columns, offsets))
+        return cls(
+            columns={name: columns[name] for name in names},
+            offsets=offsets,
+            ids=ids,
+            strings=strings,
+            attributes=[a for a in attributes if a.startswith("token.") and _name(a) in names],
+        )
+
+    @staticmethod
+    def _derive(names: list, columns: dict, offsets: np.ndarray) -> dict:
+        derived = {}
+        counts = np.diff(offsets)
+        positions = np.arange(offsets[-1], dtype=np.int64)
+        if "i" in names:
+            derived["i"] = (positions - np.repeat(offsets[:-1], counts)).astype(np.int32)
+        if "sent" in names:
+            # Position of the first token of each token's sentence within its document.
+            starts = np.where(columns["is_sent_start"], positions, 0)
+            first = np.maximum.accumulate(starts) if len(starts) else starts
+            derived["sent"] = (first - np.repeat(offsets[:-1], counts)).astype(np.int32)
+        if "is_sent_end" in names:
+            ends = np.zeros(len(positions), dtype=np.bool_)
+            ends[:-1] = columns["is_sent_start"][1:]
+            ends[offsets[1:][counts > 0] - 1] = True
+            derived["is_sent_end"] = ends
+        return derived
+
+    # -------------------------------------------------------------------------------------------- #
+    def to_pandas(self, id_column: str = "discourse_id") -> pd.DataFrame:
+        """Returns the table as a DataFrame with one row per token.
+
+        String attributes configured with a trailing underscore, e.g. 'token.pos_', and
+        'token.text' are decoded to Categoricals. Others, e.g. 'token.pos', hold the hash.
+        """
+        data = {id_column: np.repeat(self._ids.to_numpy(zero_copy_only=False), self.counts)}
+        for attribute in self._attributes:
+            name = attribute.split(".")[-1]
+            kind = EXPORTED.get(_name(name), (None, None))[1]
+            if kind == "string" and (name.endswith("_") or name == "text"):
+                data[name] = self.decode(name)
+            else:
+                data[name] = np.asarray(self.column(name))
+        return pd.DataFrame(data)
+
+    def save(self, directory: str) -> None:
+        """Writes each column as .npy and the identifiers and strings as Arrow IPC files."""
+        os.makedirs(directory, exist_ok=True)
+        for name, column in self._columns.items():
+            np.save(os.path.join(directory, name + ".npy"), column)
+        np.save(os.path.join(directory, "offsets.npy"), self._offsets)
+        self._write_arrow(pa.table({"id": self._ids}), os.path.join(directory, "ids.arrow"))
+        strings = pa.table(
+            {
+                "hash": pa.array(list(self._strings.keys()), type=pa.uint64()),
+                "string": pa.array(list(self._strings.values()), type=pa.string()),
+            }
+        )
+        self._write_arrow(strings, os.path.join(directory, "strings.arrow"))
+        YamlIO().write(
+            {"attributes": self._attributes, "columns": self.columns, "tokens": len(self)},
+            os.path.join(directory, "table.yml"),
+        )
+        logger.info("Saved token table of {} tokens to {}.".format(len(self), directory))
+
+    @classmethod
+    def open(cls, directory: str) -> "TokenTable":
+        """Opens a saved table with every column memory mapped."""
+        meta = YamlIO().read(os.path.join(directory, "table.yml"))
+        columns = {
+            name: np.load(os.path.join(directory, name + ".npy"), mmap_mode="r")
+            for name in meta["columns"]
+        }
+        offsets = np.load(os.path.join(directory, "offsets.npy"), mmap_mode="r")
+        ids = cls._read_arrow(os.path.join(directory, "ids.arrow")).column("id").combine_chunks()
+        strings = cls._read_arrow(os.path.join(directory, "strings.arrow"))
+        hashes, values = strings.column("hash").to_pylist(), strings.column("string").to_pylist()
+        strings = dict(zip(hashes, values))
+        return cls(columns, offsets, ids, strings, list(meta["attributes"]))
+
+    @staticmethod
+    def _write_arrow(table: pa.Table, filepath: str) -> None:
+        with pa.OSFile(filepath, "wb") as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    @staticmethod
+    def _read_arrow(filepath: str) -> pa.Table:
+        with pa.memory_map(filepath, "r") as source:
+            return ipc.open_file(source).read_all()
@@ -11,12 +11,13 @@
 # URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Wednesday August 10th 2022 04:30:42 am                                              #
-# Modified   : Monday August 15th 2022 04:59:41 pm                                                 #
+# Modified   : Saturday October 17th 2026 12:53:00 am                                              #
 # ------------------------------------------------------------------------------------------------ #
 # License    : BSD 3-clause "New" or "Revised" License                                             #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 """Defines Base classes for Feature classes throughout the package."""
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import logging
@@ -24,9 +25,10 @@ import logging.config
 from typing import Union
 
 # ------------------------------------------------------------------------------------------------ #
-from aes.utils.config import LogConfig
+from aes.utils.config import LogConfig, DataConfig
 from aes.visualization.visualize import Histogram, Boxplot
 from aes.features.extraction.base import FeatureExtractorFactory, FeatureExtractor
+from aes.features.extraction.context import ExtractionContext
 
 # ------------------------------------------------------------------------------------------------ #
 logging.config.dictConfig(LogConfig().config)
@@ -48,11 +50,20 @@ class Feature:
     def __init__(self, name: str, category: str) -> None:
         self._name = name
         self._category = category
-        self._values = None  # DataFrame containing the id_var and feature values.
+        self._idvar = DataConfig().config["columns"]["idvar"]
+        self._index = None  # Index of the idvar values, shared with the other features in a set.
+        self._values = None  # Array of feature values, a column view when bound to a FeatureSet.
+        self._dtype = None  # The dtype returned by the extractor, e.g. int64 for counts.
 
     @property
-    def values(self) -> pd.DataFrame:
-        return self._values
+    def values(self) -> pd.Series:
+        if self._values is None:
+            return None
+        return pd.Series(self._values, index=self._index, name=self._name, copy=False)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
 
     @property
     def name(self) -> None:
@@ -60,16 +71,53 @@ class Feature:
 
     @property
     def category(self) -> None:
-        self._category
-
-    def extract(self, data: pd.DataFrame, **kwargs) -> None:
-        self._values = data[self._idvars].to_frame()
-        extractor = self._extractor_factory()
-        self._values[self._name] = extractor.extract(data, kwargs)
+        return self._category
+
+    def bind(self, index: pd.Index, values: np.ndarray) -> None:
+        """Binds the feature to storage owned by a FeatureSet.
+
+        Args:
+            index (pd.Index): The idvar index shared by all features in the set.
+            values (np.ndarray): One dimensional view into the set's block, written in place.
+        """
+        self._index = index
+        self._values = values
+
+    def extract(
+        self,
+        data: pd.DataFrame,
+        context: ExtractionContext = None,
+        factory: FeatureExtractorFactory = None,
+        text_col: str = None,
+        category_col: str = None,
+        **kwargs
+    ) -> None:
+        """Extracts the feature values from the data.
+
+        If the feature is bound to a FeatureSet, values are written into the bound column.
+
+        Args:
+            data (pd.DataFrame): DataFrame containing the idvar and text columns.
+            context (ExtractionContext): Intermediates shared with other features in the run.
+            factory (FeatureExtractorFactory): Factory shared with other features in the run.
+                A new one is created if not given.
+            text_col (str): The column containing the texts. Defaults to the configured column.
+            category_col (str): The column containing the discourse types. Defaults to the
+                configured column.
+        """
+        extractor = self._extractor_factory(factory)
+        values = extractor.extract(
+            data, context=context, text_col=text_col, category_col=category_col, **kwargs
+        ).to_numpy()
+        self._dtype = values.dtype
+        if self._values is None or len(self._values) != len(values):
+            self._index = pd.Index(data[self._idvar])
+            self._values = np.empty(len(values), dtype=np.float32)
+        self._values[:] = values
 
     def describe(self, by: str = None) -> pd.DataFrame:
         """Returns a DataFrame with descriptive statistics for the feature at the 'by' level of aggregation"""
-        return self._values.describe[self._name].describe().to_frame().T
+        return self.values.describe().to_frame().T
 
     def hist(
         self, by: str = None, title: str = None, xlab: str = None, ylab: str = None
@@ -84,7 +132,7 @@ class Feature:
         ylab = "Counts"
         visualizer = Histogram()
         fig, ax = visualizer.plot(
-            data=self._values, x=self._name, title=title, xlab=xlab, ylab=ylab
+            data=self.values.to_frame(), x=self._name, title=title, xlab=xlab, ylab=ylab
         )
         plt.tight_layout()
         plt.show()
@@ -100,10 +148,10 @@ class Feature:
         )
         xlab = self._name
         visualizer = Boxplot()
-        fig, ax = visualizer.plot(data=self._values, x=self._name, title=title, xlab=xlab)
+        fig, ax = visualizer.plot(data=self.values.to_frame(), x=self._name, title=title, xlab=xlab)
         plt.tight_layout()
         plt.show()
 
-    def _extractor_factory(self) -> FeatureExtractor:
-        factory = FeatureExtractorFactory()
-        return factory.create_extractor(category=self._category, name=self._name)
+    def _extractor_factory(self, factory: FeatureExtractorFactory = None) -> FeatureExtractor:
+        factory = factory or FeatureExtractorFactory()
+        return factory.create_extractor(name=self._name)
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /cache.py                                                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 09:40:00 pm                                                #
+# Modified   : Saturday October 17th 2026 01:08:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Persistent feature cache and incremental extraction keyed by text content hash."""
+import os
+import time
+import hashlib
+import sqlite3
+import numpy as np
+import pandas as pd
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig, DataConfig, resolve_path
+from aes.features.extraction.registry import REGISTRY
+from aes.features.extraction.planner import ExtractionPlanner
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+def content_hash(text: str, category: str = None) -> bytes:
+    """Returns a 128 bit digest of the text content and, if given, its discourse type."""
+    content = str(text) if category is None else "{}\x1f{}".format(category, text)
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+def model_key(provenance: dict = None, exemplars: str = None) -> str:
+    """Returns the spaCy model and version recorded in provenance, e.g. 'en_core_web_md==3.8.0'.
+
+    Features computed without a spaCy pipeline have an empty key. Features searching the
+    exemplar index append the index's fingerprint, e.g. 'exemplars@<fingerprint>'.
+    """
+    key = "{}=={}".format(provenance["model"], provenance["version"]) if provenance else ""
+    if exemplars:
+        key = "{}exemplars@{}".format(key + "+" if key else "", exemplars)
+    return key
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      FEATURE CACHE                                               #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class FeatureCache:
+    """SQLite backed cache of feature values keyed by (content hash, extractor, version, model).
+
+    Each extractor's current version is recorded. When a different version is seen, every
+    value computed by the previous implementation is deleted. The model is the spaCy
+    pipeline and version that produced the value, and the fingerprint of the exemplar index
+    it was compared with, as returned by model_key. It is empty for features that use
+    neither. Values from different pipelines or exemplar indexes are kept apart.
+
+    The size of the cache is checked every check_every inserted values. Once it holds more
+    than max_size values, the least recently used values are evicted.
+
+    Args:
+        filepath (str): Path to the SQLite database. Defaults to feature_cache.filepath in the
+            data configuration, relative to the project root.
+        max_size (int): Maximum number of cached values. Defaults to feature_cache.max_size.
+        check_every (int): Number of inserted values between checks of the cache size.
+            Defaults to feature_cache.check_every.
+    """
+
+    __schema = [
+        """CREATE TABLE IF NOT EXISTS features (
+            text_hash BLOB NOT NULL,
+            extractor TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            model TEXT NOT NULL DEFAULT '',
+            value REAL,
+            last_access REAL NOT NULL,
+            PRIMARY KEY (text_hash, extractor, version, model)
+        ) WITHOUT ROWID""",
+        "CREATE INDEX IF NOT EXISTS features_last_access ON features (last_access)",
+        """CREATE TABLE IF NOT EXISTS extractors (
+            extractor TEXT PRIMARY KEY,
+            version INTEGER NOT NULL,
+            dtype TEXT
+        )""",
+    ]
+
+    def __init__(self, filepath: str = None, max_size: int = None, check_every: int = None) -> None:
+        config = DataConfig().config["feature_cache"]
+        self._filepath = filepath or resolve_path(config["filepath"])
+        self._max_size = max_size or config["max_size"]
+        self._check_every = check_every or config.get("check_every", 10000)
+        self._inserted = 0  # Values inserted since the size was last checked.
+        if os.path.dirname(self._filepath):
+            os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
+        self._connection = sqlite3.connect(self._filepath)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        with self._connection:
+            self._migrate()
+            for statement in FeatureCache.__schema:
+                self._connection.execute(statement)
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM features").fetchone()[0]
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def get(self, extractor: str, version: int, hashes: list, model: str = "") -> dict:
+        """Returns the cached values for the given content hashes.
+
+        Args:
+            extractor (str): Canonical feature name.
+            version (int): Extractor implementation version.
+            hashes (list): Content hashes to look up.
+            model (str): The spaCy model and version producing the feature, if any.
+
+        Returns:
+            Dictionary mapping the hashes found in the cache to their values.
+        """
+        self._check_version(extractor, version)
+        with self._connection:
+            self._stage_hashes(hashes)
+            rows = self._connection.execute(
+                """SELECT f.text_hash, f.value FROM features f
+                JOIN temp.lookup l ON f.text_hash = l.text_hash
+                WHERE f.extractor = ? AND f.version = ? AND f.model = ?""",
+                (extractor, version, model),
+            ).fetchall()
+            self._connection.execute(
+                """UPDATE features SET last_access = ?
+                WHERE extractor = ? AND version = ? AND model = ?
+                AND text_hash IN (SELECT text_hash FROM temp.lookup)""",
+                (time.time(), extractor, version, model),
+            )
+        return dict(rows)
+
+    def put(
+        self, extractor: str, version: int, hashes: list, values: np.ndarray, model: str = ""
+    ) -> None:
+        """Stores values computed by an extractor version, evicting if due and over capacity."""
+        self._check_version(extractor, version, dtype=str(np.asarray(values).dtype))
+        now = time.time()
+        rows = [
+            (h, extractor, version, model, None if pd.isna(v) else float(v), now)
+            for h, v in zip(hashes, values)
+        ]
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO features VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+        self._inserted += len(rows)
+        if self._inserted >= self._check_every:
+            self.evict()
+
+    def dtype(self, extractor: str) -> str:
+        """Returns the dtype of the values last stored for an extractor, if known."""
+        row = self._connection.execute(
+            "SELECT dtype FROM extractors WHERE extractor = ?", (extractor,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def invalidate(self, extractor: str = None) -> None:
+        """Deletes the cached values for an extractor, or every value if none is given."""
+        with self._connection:
+            if extractor is None:
+                self._connection.execute("DELETE FROM features")
+                self._connection.execute("DELETE FROM extractors")
+            else:
+                self._connection.execute("DELETE FROM features WHERE extractor = ?", (extractor,))
+                self._connection.execute(
+                    "DELETE FROM extractors WHERE extractor = ?", (extractor,)
+                )
+
+    def evict(self) -> None:
+        """Evicts the least recently used values until the cache is within max_size."""
+        self._inserted = 0
+        excess = len(self) - self._max_size
+        if excess > 0:
+            logger.debug("Evicting {} values from the feature cache.".format(excess))
+            with self._connection:
+                self._connection.execute(
+                    """DELETE FROM features WHERE (text_hash, extractor, version, model) IN (
+                        SELECT text_hash, extractor, version, model FROM features
+                        ORDER BY last_access LIMIT ?
+                    )""",
+                    (excess,),
+                )
+
+    def _migrate(self) -> None:
+        """Drops a cache created before values were keyed by model, as none can be reused."""
+        columns = [
+            row[1] for row in self._connection.execute("PRAGMA table_info(features)").fetchall()
+        ]
+        if columns and "model" not in columns:
+            logger.info(
+                "Recreating the feature cache in {} with model keys.".format(self._filepath)
+            )
+            self._connection.execute("DROP TABLE features")
+            self._connection.execute("DROP TABLE IF EXISTS extractors")
+
+    def _check_version(self, extractor: str, version: int, dtype: str = None) -> None:
+        """Drops values from other versions of the extractor and records the current one."""
+        row = self._connection.execute(
+            "SELECT version, dtype FROM extractors WHERE extractor = ?", (extractor,)
+        ).fetchone()
+        if row is not None and row[0] == version and (dtype is None or row[1] == dtype):
+            return
+        with self._connection:
+            if row is not None and row[0] != version:
+                logger.info(
+                    "Extractor {} changed from version {} to {}. Invalidating its values.".format(
+                        extractor, row[0], version
+                    )
+                )
+                self._connection.execute(
+                    "DELETE FROM features WHERE extractor = ? AND version != ?",
+                    (extractor, version),
+                )
+            dtype = dtype or (row[1] if row is not None else None)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO extractors VALUES (?, ?, ?)", (extractor, version, dtype)
+            )
+
+    def _stage_hashes(self, hashes: list) -> None:
+        """Loads the hashes into a temporary table so a lookup is a single join."""
+        self._connection.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS lookup (text_hash BLOB PRIMARY KEY) WITHOUT ROWID"
+        )
+        self._connection.execute("DELETE FROM temp.lookup")
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO temp.lookup VALUES (?)", ((h,) for h in hashes)
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                  INCREMENTAL EXTRACTOR                                           #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class IncrementalExtractor:
+    """Extracts features, computing only the texts that are not already in the FeatureCache.
+
+    Texts are identified by the hash of their content and, when the data has a category
+    column, their discourse type, which the semantic features depend on. Unchanged
+    discourses are served from the cache, new or edited discourses are computed, and
+    duplicates are computed once. Features parsed with spaCy are cached under the pipeline
+    the planner selects for the full list of names, and missing values are computed with it.
+    Features searching the exemplar index are cached under its fingerprint, so rebuilding
+    the index with different exemplars recomputes them.
+
+    Args:
+        names (list): Canonical names of the features to extract.
+        cache (FeatureCache): The persistent cache. Defaults to the configured cache.
+        idvar (str): The identifier column carried into the output.
+        text_col (str): The column containing the discourse texts.
+        category_col (str): The column containing the discourse types, if present.
+        **kwargs: Passed to the ExtractionPlanner that computes the missing values.
+    """
+
+    def __init__(
+        self,
+        names: list,
+        cache: FeatureCache = None,
+        idvar: str = "discourse_id",
+        text_col: str = "discourse_text",
+        category_col: str = "discourse_type",
+        **kwargs,
+    ) -> None:
+        self._names = list(names)
+        self._cache = cache if cache is not None else FeatureCache()
+        self._idvar = idvar
+        self._text_col = text_col
+        self._category_col = category_col
+        self._planner_kwargs = kwargs
+        self._planner = ExtractionPlanner(names=self._names, **kwargs)
+        self._versions = {name: REGISTRY.get(name).version for name in self._names}
+        self._models = None  # Model key per feature, resolved on first extraction.
+
+    @property
+    def provenance(self) -> dict:
+        """Tier, model and version of the spaCy pipeline producing each feature that uses one."""
+        return self._planner.provenance
+
+    def extract(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Extracts the features from the data.
+
+        Args:
+            data (pd.DataFrame): DataFrame containing the idvar and text columns, and the
+                category column if the features require it.
+
+        Returns:
+            DataFrame with the idvar and one column per feature, in the order of data.
+        """
+        if self._models is None:
+            self._models = self._model_keys()
+        texts = data[self._text_col].fillna("").to_numpy(dtype=object)
+        categories = (
+            data[self._category_col].to_numpy(dtype=object)
+            if self._category_col in data.columns
+            else None
+        )
+        if categories is None:
+            hashes = [content_hash(text) for text in texts]
+        else:
+            hashes = [content_hash(text, category) for text, category in zip(texts, categories)]
+        unique = list(dict.fromkeys(hashes))
+
+        values, missing = {}, {}
+        for name in self._names:
+            values[name] = self._cache.get(
+                name, self._versions[name], unique, model=self._models[name]
+            )
+            missing[name] = [h for h in unique if h not in values[name]]
+
+        stale = set().union(*missing.values())
+        stale = [h for h in unique if h in stale]
+        logger.info(
+            "{} of {} distinct texts require extraction.".format(len(stale), len(unique))
+        )
+        if stale:
+            self._compute(texts, categories, hashes, stale, missing, values)
+
+        features = data[[self._idvar]].copy()
+        for name in self._names:
+            column = np.array([values[name][h] for h in hashes], dtype=float)
+            dtype = self._cache.dtype(name)
+            if dtype and not np.isnan(column).any():
+                column = column.astype(dtype)
+            features[name] = column
+        return features
+
+    def _compute(
+        self,
+        texts: np.ndarray,
+        categories: np.ndarray,
+        hashes: list,
+        stale: list,
+        missing: dict,
+        values: dict,
+    ) -> None:
+        """Runs the planner over the stale texts and stores the new values in the cache."""
+        position = {h: i for i, h in enumerate(hashes)}
+        rows = [position[h] for h in stale]
+        names = [name for name in self._names if missing[name]]
+        planner = ExtractionPlanner(
+            names=names, **{**self._planner_kwargs, "model": self._planner.model}
+        )
+        results = planner.run(
+            texts[rows], categories=categories[rows] if categories is not None else None
+        )
+        for name in names:
+            computed = dict(zip(stale, results[name]))
+            new = missing[name]
+            self._cache.put(
+                name,
+                self._versions[name],
+                new,
+                [computed[h] for h in new],
+                model=self._models[name],
+            )
+            values[name].update((h, computed[h]) for h in new)
+
+    def _model_keys(self) -> dict:
+        """Returns the key of the pipeline and exemplar index producing each feature."""
+        provenance = self.provenance
+        semantic = [name for name in self._names if "exemplars" in REGISTRY.get(name).requires]
+        exemplars = None
+        if semantic:
+            # Imported here so that features without exemplars do not load the index.
+            from aes.features.extraction.semantic import exemplar_fingerprint
+
+            exemplars = exemplar_fingerprint()
+        return {
+            name: model_key(provenance.get(name), exemplars if name in semantic else None)
+            for name in self._names
+        }
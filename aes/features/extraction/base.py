@@ -11,23 +11,23 @@
 # URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Wednesday August 10th 2022 05:03:22 pm                                              #
-# Modified   : Monday August 15th 2022 04:59:41 pm                                                 #
+# Modified   : Saturday October 17th 2026 01:12:00 am                                              #
 # ------------------------------------------------------------------------------------------------ #
 # License    : BSD 3-clause "New" or "Revised" License                                             #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 """Base Feature Extraction Module"""
 from abc import ABC, abstractmethod
-import os
-import importlib
+import numpy as np
 import pandas as pd
 import logging
 import logging.config
 
 # ------------------------------------------------------------------------------------------------ #
-from aes.utils.config import LogConfig
-from aes.utils.config import Config
-from aes.utils.metacode import class_list_from_file
+from aes.utils.config import LogConfig, DataConfig
+from aes.features.extraction.columnar import TextColumn
+from aes.features.extraction.context import ExtractionContext
+from aes.features.extraction.registry import REGISTRY, ExtractorRegistry, ExtractorSpec
 
 # ------------------------------------------------------------------------------------------------ #
 logging.config.dictConfig(LogConfig().config)
@@ -37,10 +37,10 @@ logger = logging.getLogger(__name__)
 
 class FeatureExtractor(ABC):
     def __init__(self) -> None:
-        self._config = Config(filepath="aes/data/config.yaml")
-        config = self._config.read()
+        config = DataConfig().config
         self._idvar = config["columns"]["idvar"]  # The idvar in the data.
         self._text_col = config["columns"]["text"]  # The name of the text column in the data.
+        self._category_col = config["columns"]["category"]  # The discourse type column.
         self._name = None  # The canonical name for the feature assigned in subclasses.
         self._category = None  # The feature category assigned by subclasses.
 
@@ -52,62 +52,97 @@ class FeatureExtractor(ABC):
     def category(self) -> str:
         return self._category
 
-    @abstractmethod
-    def extract(self, data: pd.DataFrame, **kwargs) -> pd.DataFrame:
-        """Extracts the features from the dataset and returns a Feature object.
+    @property
+    def requires(self) -> list:
+        """Shared intermediates consumed by the extractor, as declared in the registry."""
+        return REGISTRY.get(self._name).requires if self._name in REGISTRY else []
+
+    def extract(
+        self,
+        data: pd.DataFrame,
+        context: ExtractionContext = None,
+        text_col: str = None,
+        category_col: str = None,
+        **kwargs
+    ) -> pd.Series:
+        """Extracts the feature from the dataset.
 
         Args:
             data (pd.DataFrame): DataFrame containing the idvar and the text data (only) to be analyzed.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
+            text_col (str): The column containing the texts. Defaults to the configured column.
+            category_col (str): The column containing the discourse types. Defaults to the
+                configured column.
+
+        Returns:
+            pd.Series containing the feature values, aligned with the index of data.
+        """
+        text_col = text_col or self._text_col
+        category_col = category_col or self._category_col
+        if context is None and category_col in data.columns:
+            context = ExtractionContext(data[text_col], categories=data[category_col])
+        values = self.extract_batch(data[text_col], context=context, **kwargs)
+        return pd.Series(values, index=data.index, name=self._name)
+
+    @abstractmethod
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts with a vectorized implementation.
+
+        Args:
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
+            **kwargs: Extractor specific options. Options an extractor does not use are ignored.
 
         Returns:
-            pd.DataFrame containing the idvar and the feature values.
+            Contiguous NumPy array with one feature value per text.
         """
         pass
 
+    def _get_context(
+        self, texts: TextColumn, context: ExtractionContext = None
+    ) -> ExtractionContext:
+        """Returns the run context, or a private one when the extractor is used on its own."""
+        return context if context is not None else ExtractionContext(texts)
+
 
 # ------------------------------------------------------------------------------------------------ #
 class FeatureExtractorFactory:
-    """Constructs a feature extractor using the canonical name of the feature."""
+    """Constructs a feature extractor using the canonical name of the feature.
 
-    __modules = [
-        "aes.features.extraction.length",
-        "aes.features.extraction.word",
-        "aes.features.extraction.semantic",
-        "aes.features.extraction.syntactic",
-        "aes.features.extraction.readability",
-    ]
+    Extractors are looked up in the registry, and their modules are imported and the extractor
+    constructed only on the first request for that feature. Later requests return the same
+    instance.
 
-    def __init__(self) -> None:
+    Args:
+        registry (ExtractorRegistry): Registry of extractor metadata. Defaults to the package
+            catalog.
+    """
 
-        self._extractor_index = {}
-        self._build_index()
+    def __init__(self, registry: ExtractorRegistry = None) -> None:
+        self._registry = registry or REGISTRY
+        self._extractors = {}
 
     @property
     def categories(self) -> list:
-        return [category for category in self._extractor_index.keys()]
+        return self._registry.categories
+
+    def list_extractors(self, category: str = None) -> list:
+        return self._registry.list_extractors(category=category)
 
-    def list_extractors(self) -> list:
-        return [e for e in self._extractor_index.keys()]
+    def get_spec(self, name: str) -> ExtractorSpec:
+        """Returns the registered metadata for an extractor without constructing it."""
+        return self._registry.get(name)
 
     def create_extractor(self, name: str) -> FeatureExtractor:
-        try:
-            return self._extractor_index[name]
-        except KeyError as e:
-            logger.error(
-                "Invalid category or name. Check the category and name properties for valid options."
-            )
-            raise KeyError(e)
-
-    def _build_index(self) -> None:
-
-        for module_name in FeatureExtractorFactory.__modules:
-            module = importlib.import_module(name=module_name)  # Get the module object.
-            module_name_parts = module_name.split(".")
-            module_path = os.path.join(*module_name_parts) + ".py"
-            classlist = class_list_from_file(
-                module_path
-            )  # Obtain a list of class names in the module
-            for klass in classlist:
-                extractor = getattr(module, klass)
-                extractor = extractor()
-                self._extractor_index[extractor.name] = extractor
+        if name not in self._extractors:
+            try:
+                spec = self._registry.get(name)
+            except KeyError as e:
+                logger.error(
+                    "Invalid category or name. Check the category and name properties for valid options."
+                )
+                raise KeyError(e)
+            self._extractors[name] = spec.load()()
+        return self._extractors[name]
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /charclass.py                                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 09:00:00 am                                                #
+# Modified   : Saturday October 17th 2026 12:47:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Single-pass character class counting for the length feature extractors."""
+import re
+from collections import Counter
+import numpy as np
+import pandas as pd
+from typing import Iterable
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.data import specials, punctuation
+from aes.features.extraction.columnar import TextColumn, to_numpy
+
+# ------------------------------------------------------------------------------------------------ #
+# The specials and punctuation dictionaries hold regex patterns. The engine counts literals, so the
+# escapes are stripped once here. Every symbol is a single character except the ellipsis.
+SPECIAL_SYMBOLS = {k: re.sub(r"\\(.)", r"\1", v) for k, v in specials.items()}
+PUNCTUATION_SYMBOLS = {k: re.sub(r"\\(.)", r"\1", v) for k, v in punctuation.items()}
+SYMBOLS = {**SPECIAL_SYMBOLS, **PUNCTUATION_SYMBOLS}
+ELLIPSIS = "elipses"
+
+# Maps the canonical feature names to the totals computed by the engine.
+CHARACTER_FEATURES = [
+    "alphabetic_character_count",
+    "number_character_count",
+    "special_character_count",
+    "punctuation_count",
+    "commas_count",
+    "exclamation_mark_count",
+    "question_mark_count",
+]
+_SYMBOL_FEATURES = {
+    "commas_count": "comma",
+    "exclamation_mark_count": "exclamation point",
+    "question_mark_count": "question mark",
+}
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    CHARACTER COUNTS                                              #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class CharacterCounts:
+    """Character class counts for a collection of discourses.
+
+    Args:
+        alpha (np.ndarray): Alphabetic character counts, one per discourse.
+        digit (np.ndarray): Numeric character counts, one per discourse.
+        breakdown (np.ndarray): Matrix of counts with one row per discourse and one column per symbol.
+        symbols (list): Symbol names corresponding to the breakdown columns.
+    """
+
+    def __init__(
+        self, alpha: np.ndarray, digit: np.ndarray, breakdown: np.ndarray, symbols: list
+    ) -> None:
+        self._alpha = alpha
+        self._digit = digit
+        self._breakdown = breakdown
+        self._symbols = symbols
+        self._columns = {symbol: i for i, symbol in enumerate(symbols)}
+
+    def __len__(self) -> int:
+        return self._breakdown.shape[0]
+
+    @property
+    def symbols(self) -> list:
+        return self._symbols
+
+    @property
+    def breakdown(self) -> np.ndarray:
+        return self._breakdown
+
+    @property
+    def alpha(self) -> np.ndarray:
+        return self._alpha
+
+    @property
+    def digit(self) -> np.ndarray:
+        return self._digit
+
+    @property
+    def special(self) -> np.ndarray:
+        return self._total(SPECIAL_SYMBOLS.keys())
+
+    @property
+    def punctuation(self) -> np.ndarray:
+        return self._total(PUNCTUATION_SYMBOLS.keys())
+
+    def symbol(self, name: str) -> np.ndarray:
+        """Returns the counts for a single symbol, e.g. 'comma'."""
+        return np.ascontiguousarray(self._breakdown[:, self._columns[name]])
+
+    def get(self, name: str) -> np.ndarray:
+        """Returns the counts for a feature by its canonical name, e.g. 'commas_count'."""
+        if name == "alphabetic_character_count":
+            return self._alpha
+        elif name == "number_character_count":
+            return self._digit
+        elif name == "special_character_count":
+            return self.special
+        elif name == "punctuation_count":
+            return self.punctuation
+        elif name in _SYMBOL_FEATURES:
+            return self.symbol(_SYMBOL_FEATURES[name])
+        raise KeyError("{} is not a character count feature.".format(name))
+
+    def to_frame(self, index: pd.Index = None) -> pd.DataFrame:
+        """Returns all character count features as a DataFrame."""
+        return pd.DataFrame({name: self.get(name) for name in CHARACTER_FEATURES}, index=index)
+
+    def totals(self, symbols: Iterable = None) -> pd.DataFrame:
+        """Returns corpus level symbol counts in descending order."""
+        symbols = list(symbols or self._symbols)
+        counts = [int(self.symbol(symbol).sum()) for symbol in symbols]
+        return pd.DataFrame(data={"Count": counts}, index=symbols).sort_values(
+            by="Count", ascending=False
+        )
+
+    def _total(self, symbols: Iterable) -> np.ndarray:
+        return self._breakdown[:, [self._columns[s] for s in symbols]].sum(axis=1)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                CHARACTER CLASS ENGINE                                            #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class CharacterClassEngine:
+    """Counts alphabetic, numeric, special and punctuation characters in one scan per text.
+
+    ASCII texts are encoded to bytes and processed a chunk of discourses at a time: the chunk
+    is concatenated into a single buffer and a segmented byte histogram is computed with one
+    bincount. Every character class total and the per-symbol breakdown are read off that
+    histogram. Texts containing non-ASCII characters are counted with a Counter over the string
+    and only the distinct characters are classified.
+
+    Args:
+        chunksize (int): Number of discourses histogrammed together on the ASCII path.
+    """
+
+    __alpha = np.array([chr(i).isalpha() for i in range(256)], dtype=bool)
+    __alpha[128:] = False
+    __digit = np.array([chr(i).isdigit() for i in range(256)], dtype=bool)
+    __digit[128:] = False
+
+    def __init__(self, chunksize: int = 2048) -> None:
+        self._chunksize = chunksize
+        self._symbols = list(SYMBOLS.keys())
+        self._single = [s for s in self._symbols if s != ELLIPSIS]
+        self._codes = np.array([ord(SYMBOLS[s]) for s in self._single], dtype=np.intp)
+        self._single_index = np.array([self._symbols.index(s) for s in self._single])
+        self._ellipsis_index = self._symbols.index(ELLIPSIS)
+
+    @property
+    def symbols(self) -> list:
+        return self._symbols
+
+    def count(self, texts: TextColumn) -> CharacterCounts:
+        """Counts character classes for each text.
+
+        Args:
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+
+        Returns:
+            CharacterCounts object with totals and the per-symbol breakdown.
+        """
+        texts = [str(text) for text in to_numpy(texts)]
+        n = len(texts)
+        alpha = np.zeros(n, dtype=np.int64)
+        digit = np.zeros(n, dtype=np.int64)
+        breakdown = np.zeros((n, len(self._symbols)), dtype=np.int64)
+
+        ascii_rows = []
+        for i, text in enumerate(texts):
+            if text.isascii():
+                ascii_rows.append(i)
+            else:
+                self._count_text(text, i, alpha, digit, breakdown)
+
+        for start in range(0, len(ascii_rows), self._chunksize):
+            rows = np.array(ascii_rows[start : start + self._chunksize], dtype=np.intp)
+            self._count_ascii([texts[i] for i in rows], rows, alpha, digit, breakdown)
+
+        return CharacterCounts(alpha=alpha, digit=digit, breakdown=breakdown, symbols=self._symbols)
+
+    def _count_ascii(
+        self,
+        texts: list,
+        rows: np.ndarray,
+        alpha: np.ndarray,
+        digit: np.ndarray,
+        breakdown: np.ndarray,
+    ) -> None:
+        """Byte histogram fast path for a chunk of ASCII texts."""
+        lengths = np.fromiter((len(text) for text in texts), dtype=np.intp, count=len(texts))
+        buffer = np.frombuffer("".join(texts).encode("ascii"), dtype=np.uint8)
+        segment = np.repeat(np.arange(len(texts), dtype=np.intp), lengths)
+
+        histogram = np.bincount(segment * 256 + buffer, minlength=len(texts) * 256).reshape(
+            len(texts), 256
+        )
+        alpha[rows] = histogram[:, CharacterClassEngine.__alpha].sum(axis=1)
+        digit[rows] = histogram[:, CharacterClassEngine.__digit].sum(axis=1)
+        breakdown[np.ix_(rows, self._single_index)] = histogram[:, self._codes]
+        breakdown[rows, self._ellipsis_index] = self._count_ellipses(buffer, segment, lengths)
+
+    def _count_ellipses(
+        self, buffer: np.ndarray, segment: np.ndarray, lengths: np.ndarray
+    ) -> np.ndarray:
+        """Counts non-overlapping '...' sequences from the runs of periods in each text."""
+        n = len(lengths)
+        dots = buffer == ord(".")
+        if not dots.any():
+            return np.zeros(n, dtype=np.int64)
+        starts = np.zeros(len(buffer), dtype=bool)
+        starts[np.cumsum(lengths)[:-1][lengths[1:] > 0]] = True
+        starts[0] = True
+        previous = np.concatenate(([False], dots[:-1])) & ~starts
+        run_starts = dots & ~previous
+        run_id = np.cumsum(run_starts)[dots] - 1
+        run_lengths = np.bincount(run_id)
+        run_segment = segment[run_starts]
+        return np.bincount(run_segment, weights=run_lengths // 3, minlength=n).astype(np.int64)
+
+    def _count_text(
+        self,
+        text: str,
+        row: int,
+        alpha: np.ndarray,
+        digit: np.ndarray,
+        breakdown: np.ndarray,
+    ) -> None:
+        """General path for texts containing non-ASCII characters."""
+        counts = Counter(text)
+        alpha[row] = sum(c for ch, c in counts.items() if ch.isalpha())
+        digit[row] = sum(c for ch, c in counts.items() if ch.isdigit())
+        for i, symbol in zip(self._single_index, self._single):
+            breakdown[row, i] = counts.get(SYMBOLS[symbol], 0)
+        breakdown[row, self._ellipsis_index] = text.count(SYMBOLS[ELLIPSIS])
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+def build_characters(context) -> CharacterCounts:
+    """Builds the 'characters' intermediate for an ExtractionContext."""
+    return CharacterClassEngine().count(context.texts)
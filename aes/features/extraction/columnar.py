@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /columnar.py                                                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:00:00 am                                                #
+# Modified   : Saturday October 17th 2026 01:14:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Conversions and vectorized helpers for columns of discourse texts."""
+import hashlib
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import Union
+
+# ------------------------------------------------------------------------------------------------ #
+TextColumn = Union[pa.Array, pa.ChunkedArray, np.ndarray, pd.Series, list]
+# ------------------------------------------------------------------------------------------------ #
+
+
+def to_arrow(texts: TextColumn) -> pa.Array:
+    """Returns the texts as an Arrow string array with nulls replaced by empty strings.
+
+    Args:
+        texts (TextColumn): Arrow string array, NumPy object array, pandas Series or list.
+    """
+    if isinstance(texts, pa.ChunkedArray):
+        texts = texts.combine_chunks()
+    elif not isinstance(texts, pa.Array):
+        texts = np.asarray(texts, dtype=object)
+        texts = pa.array(texts, type=pa.large_string(), from_pandas=True)
+    if not (pa.types.is_string(texts.type) or pa.types.is_large_string(texts.type)):
+        texts = texts.cast(pa.large_string())
+    return pc.fill_null(texts, "")
+
+
+def to_numpy(texts: TextColumn) -> np.ndarray:
+    """Returns the texts as a NumPy object array of Python strings, with nulls as empty strings.
+
+    Args:
+        texts (TextColumn): Arrow string array, NumPy object array, pandas Series or list.
+    """
+    if isinstance(texts, (pa.Array, pa.ChunkedArray)):
+        texts = to_arrow(texts).to_numpy(zero_copy_only=False)
+    elif isinstance(texts, pd.Series):
+        texts = texts.fillna("").to_numpy(dtype=object)
+    else:
+        texts = np.asarray(texts, dtype=object)
+        nulls = pd.isna(texts)
+        if nulls.any():
+            texts = np.where(nulls, "", texts).astype(object)
+    return texts
+
+
+def split_tokens(texts: TextColumn, pattern: str = " ") -> tuple:
+    """Splits each text on a literal pattern and flattens the tokens.
+
+    Args:
+        texts (TextColumn): Column of texts.
+        pattern (str): Literal separator. Defaults to a single space, matching str.split(" ").
+
+    Returns:
+        Tuple containing the flat Arrow array of tokens and a NumPy array mapping each token
+        to the position of its text in the column.
+    """
+    texts = to_arrow(texts)
+    tokens = pc.split_pattern(texts, pattern=pattern)
+    counts = pc.list_value_length(tokens).to_numpy(zero_copy_only=False)
+    segment = np.repeat(np.arange(len(texts), dtype=np.intp), counts)
+    return tokens.flatten(), segment
+
+
+def token_lengths(tokens: pa.Array) -> np.ndarray:
+    """Returns the length in characters of each token."""
+    return pc.utf8_length(tokens).to_numpy(zero_copy_only=False).astype(np.int64)
+
+
+def hash_strings(strings: list) -> np.ndarray:
+    """Returns a stable, nonzero 64 bit hash of each string.
+
+    The hash depends only on the string, so it is the same across processes and corpora.
+    Zero is reserved to mark empty slots in hash tables.
+    """
+    keys = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little")
+            for s in strings
+        ),
+        dtype=np.uint64,
+        count=len(strings),
+    )
+    keys[keys == 0] = 1
+    return keys
+
+
+def mix_hashes(keys: np.ndarray) -> np.ndarray:
+    """Finalizes 64 bit keys with the splitmix64 mixer so that every bit affects the low bits."""
+    keys = keys ^ (keys >> np.uint64(30))
+    keys = keys * np.uint64(0xBF58476D1CE4E5B9)
+    keys = keys ^ (keys >> np.uint64(27))
+    keys = keys * np.uint64(0x94D049BB133111EB)
+    return keys ^ (keys >> np.uint64(31))
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /context.py                                                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 11:20:00 am                                                #
+# Modified   : Saturday October 17th 2026 12:46:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Extraction context holding the intermediates shared by extractors during a run."""
+import importlib
+import threading
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig
+from aes.data.essays import DiscourseSpans
+from aes.features.extraction.columnar import TextColumn
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+# Shared intermediates, the intermediates each one is derived from, and the function that builds
+# it from an ExtractionContext. Builders are referenced as 'module:function' and imported only
+# when the intermediate is first built.
+INTERMEDIATES = {
+    "characters": {
+        "requires": [],
+        "builder": "aes.features.extraction.charclass:build_characters",
+    },
+    "tokens": {
+        "requires": [],
+        "builder": "aes.features.extraction.tokens:build_tokens",
+    },
+    "sentences": {
+        "requires": [],
+        "builder": "aes.features.extraction.tokens:build_sentences",
+    },
+    "parse": {
+        "requires": [],
+        "builder": "aes.features.extraction.syntactic:build_parse",
+    },
+    "syntax": {
+        "requires": ["parse"],
+        "builder": "aes.features.extraction.syntactic:build_syntax",
+    },
+    "readability": {
+        "requires": ["tokens", "sentences"],
+        "builder": "aes.features.extraction.readability:build_readability",
+    },
+    "spelling": {
+        "requires": ["tokens"],
+        "builder": "aes.features.extraction.spelling:build_spelling",
+    },
+    "vocabulary": {
+        "requires": ["tokens"],
+        "builder": "aes.features.extraction.vocabulary:build_vocabulary",
+    },
+    "ngrams": {
+        "requires": ["vocabulary"],
+        "builder": "aes.features.extraction.ngrams:build_ngrams",
+    },
+    "embeddings": {
+        "requires": ["vocabulary"],
+        "builder": "aes.features.extraction.semantic:build_embeddings",
+    },
+    "exemplars": {
+        "requires": ["embeddings"],
+        "builder": "aes.features.extraction.semantic:build_exemplars",
+    },
+}
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ExtractionContext:
+    """Computes each shared intermediate once per extraction run and hands it to every extractor.
+
+    Intermediates are built lazily on first request and kept until released or until the
+    context is discarded. Concurrent requests for the same intermediate wait for a single build.
+
+    Args:
+        texts (TextColumn): The column of texts being processed in this run.
+        categories (TextColumn): Optional discourse type of each text, for the intermediates
+            that compare a discourse with others of the same type.
+        model (str): Optional spaCy pipeline used by the intermediates built from a parse.
+            Defaults to models.trained in the spaCy configuration.
+        spans (DiscourseSpans): Optional location of each text within its essay. When given,
+            the parse is of the essays, sliced into the texts.
+    """
+
+    def __init__(
+        self,
+        texts: TextColumn,
+        categories: TextColumn = None,
+        model: str = None,
+        spans: DiscourseSpans = None,
+    ) -> None:
+        self._texts = texts
+        self._categories = categories
+        self._model = model
+        self._spans = spans
+        self._intermediates = {}
+        self._lock = threading.Lock()
+        self._locks = {}
+
+    @property
+    def texts(self) -> TextColumn:
+        return self._texts
+
+    @property
+    def categories(self) -> TextColumn:
+        return self._categories
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    @property
+    def spans(self) -> DiscourseSpans:
+        return self._spans
+
+    @property
+    def intermediates(self) -> list:
+        """Names of the intermediates currently held by the context."""
+        return list(self._intermediates.keys())
+
+    def get(self, name: str) -> object:
+        """Returns the named intermediate, computing it if this is its first request.
+
+        Args:
+            name (str): Name of the intermediate, e.g. 'tokens'.
+        """
+        if name not in self._intermediates:
+            with self._lock:
+                lock = self._locks.setdefault(name, threading.Lock())
+            with lock:
+                if name not in self._intermediates:
+                    self._intermediates[name] = self._builder(name)(self)
+        return self._intermediates[name]
+
+    def release(self, name: str) -> None:
+        """Frees the named intermediate."""
+        self._intermediates.pop(name, None)
+
+    def _builder(self, name: str) -> callable:
+        try:
+            module_name, function = INTERMEDIATES[name]["builder"].split(":")
+        except KeyError as e:
+            logger.error("Intermediate {} is not supported.".format(name))
+            raise KeyError(e)
+        return getattr(importlib.import_module(module_name), function)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /executor.py                                                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 02:00:00 pm                                                #
+# Modified   : Saturday October 17th 2026 01:13:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Parallel execution of feature extractors over chunks of a dataset."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig
+from aes.data.essays import EssayStore
+from aes.data.models import ModelTier
+from aes.features.extraction.planner import ExtractionPlanner
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+# The extraction planner is constructed once per worker process by the pool initializer.
+_planner = None
+# ------------------------------------------------------------------------------------------------ #
+
+
+def _initialize_worker(names: list, model: ModelTier = None) -> None:
+    global _planner
+    _planner = ExtractionPlanner(names=names, max_workers=1, model=model)
+
+
+def _extract_chunk(
+    chunk: int, positions: np.ndarray, data: pd.DataFrame, essays: EssayStore = None, **kwargs
+) -> tuple:
+    """Runs the extraction plan over the rows of one chunk.
+
+    Args:
+        chunk (int): Index of the chunk.
+        positions (np.ndarray): Row positions of the chunk in the dataset.
+        data (pd.DataFrame): The rows of the chunk.
+        essays (EssayStore): Optional source of the essay texts.
+        **kwargs: Column names passed to ExtractionPlanner.extract.
+    """
+    features = _planner.extract(data, essays=essays, **kwargs)
+    return chunk, positions, {name: features[name].to_numpy() for name in _planner.plan.features}
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                   PARALLEL EXTRACTOR                                             #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ParallelExtractor:
+    """Runs a set of feature extractors over a dataset on a pool of worker processes.
+
+    The dataset is split into chunks of roughly chunksize rows without splitting any group,
+    so all discourses of an essay are processed together. Each chunk is extracted by one
+    worker running an ExtractionPlanner, so shared intermediates are computed once per chunk.
+    Results are written back by row position, so the output is in the original order and
+    identical for any number of workers. The spaCy pipeline is selected once for the full
+    list of names and used by every worker, and the output records its provenance.
+
+    Args:
+        names (list): Canonical names of the features to extract.
+        workers (int): Number of worker processes. Defaults to the number of CPUs.
+            A value of 1 runs in the calling process.
+        chunksize (int): Approximate number of rows per chunk.
+        group_by (str): Column whose groups are never split across chunks, e.g. 'essay_id'.
+            Rows are chunked individually if the column is absent.
+        idvar (str): The identifier column carried into the output.
+        text_col (str): The column containing the discourse texts.
+        category_col (str): The column containing the discourse types, forwarded with each
+            chunk to the features that compare a discourse to exemplars of its type.
+        essay_col (str): The column containing the essay identifiers, used to locate the
+            discourses in their essays when essays are given to extract.
+        **kwargs: Passed to the ExtractionPlanner selecting the spaCy pipeline, e.g. model.
+    """
+
+    def __init__(
+        self,
+        names: list,
+        workers: int = None,
+        chunksize: int = 5000,
+        group_by: str = "essay_id",
+        idvar: str = "discourse_id",
+        text_col: str = "discourse_text",
+        category_col: str = "discourse_type",
+        essay_col: str = "essay_id",
+        **kwargs,
+    ) -> None:
+        self._names = list(names)
+        self._workers = workers or os.cpu_count()
+        self._chunksize = chunksize
+        self._group_by = group_by
+        self._idvar = idvar
+        self._text_col = text_col
+        self._category_col = category_col
+        self._essay_col = essay_col
+        self._planner = ExtractionPlanner(names=self._names, **kwargs)
+
+    @property
+    def names(self) -> list:
+        return self._names
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def provenance(self) -> dict:
+        """Tier, model and version of the spaCy pipeline producing each feature that uses one."""
+        return self._planner.provenance
+
+    def extract(self, data: pd.DataFrame, essays: EssayStore = None) -> pd.DataFrame:
+        """Extracts the features from the data.
+
+        Args:
+            data (pd.DataFrame): DataFrame containing the idvar and text columns.
+            essays (EssayStore): Optional source of the essay texts. When given, each essay
+                is parsed once and its discourses are sliced from the parse. Chunks are then
+                best grouped by essay, the default.
+
+        Returns:
+            DataFrame with the idvar and one column per feature, in the order of data. Its
+            attrs hold the provenance of the features parsed with spaCy, which the stores
+            record.
+        """
+        data = data.assign(**{self._text_col: data[self._text_col].fillna("")})
+        columns = [self._idvar, self._text_col, self._category_col, self._essay_col]
+        columns.extend(["discourse_start", "discourse_end"])
+        data = data[[column for column in dict.fromkeys(columns) if column in data.columns]]
+        kwargs = {
+            "idvar": self._idvar,
+            "text_col": self._text_col,
+            "category_col": self._category_col,
+            "essay_col": self._essay_col,
+        }
+        model = self._planner.model
+        chunks = self._chunk(data)
+        logger.info(
+            "Extracting {} features from {} rows in {} chunks on {} workers.".format(
+                len(self._names), len(data), len(chunks), self._workers
+            )
+        )
+        results = {}
+        if self._workers == 1:
+            _initialize_worker(self._names, model)
+            for i, positions in enumerate(chunks):
+                _, _, results[i] = _extract_chunk(
+                    i, positions, data.iloc[positions], essays, **kwargs
+                )
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self._workers,
+                initializer=_initialize_worker,
+                initargs=(self._names, model),
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        _extract_chunk, i, positions, data.iloc[positions], essays, **kwargs
+                    )
+                    for i, positions in enumerate(chunks)
+                ]
+                for future in futures:
+                    chunk, _, values = future.result()
+                    results[chunk] = values
+
+        features = self._assemble(data, chunks, results)
+        features.attrs["provenance"] = self.provenance
+        return features
+
+    def _chunk(self, data: pd.DataFrame) -> list:
+        """Returns a list of arrays of row positions, one array per chunk."""
+        n = len(data)
+        if self._group_by in data.columns:
+            codes, _ = pd.factorize(data[self._group_by], sort=False)
+        else:
+            codes = np.arange(n)
+        order = np.argsort(codes, kind="stable")
+        sorted_codes = codes[order]
+        group_starts = np.flatnonzero(np.diff(sorted_codes, prepend=-2))
+        chunks, start = [], 0
+        for boundary in group_starts[1:]:
+            if boundary - start >= self._chunksize:
+                chunks.append(order[start:boundary])
+                start = boundary
+        if start < n:
+            chunks.append(order[start:])
+        return chunks
+
+    def _assemble(self, data: pd.DataFrame, chunks: list, results: dict) -> pd.DataFrame:
+        """Writes the chunk results back into the original row order."""
+        features = data[[self._idvar]].copy()
+        for name in self._names:
+            first = np.asarray(results[0][name]) if results else np.empty(0)
+            column = np.empty(len(data), dtype=first.dtype)
+            for i, positions in enumerate(chunks):
+                column[positions] = results[i][name]
+            features[name] = column
+        return features
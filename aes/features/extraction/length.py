@@ -11,25 +11,24 @@
 # URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Tuesday August 9th 2022 08:44:14 pm                                                 #
-# Modified   : Monday August 15th 2022 04:59:41 pm                                                 #
+# Modified   : Saturday October 17th 2026 01:12:00 am                                              #
 # ------------------------------------------------------------------------------------------------ #
 # License    : BSD 3-clause "New" or "Revised" License                                             #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 """Defines Length Textual Features and Behaviors for Extraction and Summarization"""
 #%%
-import re
 import pandas as pd
 import numpy as np
-import statistics
 import logging
 import logging.config
-from nltk.tokenize import sent_tokenize, word_tokenize
 
 # ------------------------------------------------------------------------------------------------ #
 from aes.utils.config import LogConfig
-from aes.data import specials, punctuation
 from aes.features.extraction.base import FeatureExtractor
+from aes.features.extraction.columnar import TextColumn
+from aes.features.extraction.context import ExtractionContext
+from aes.features.extraction.charclass import SPECIAL_SYMBOLS, PUNCTUATION_SYMBOLS
 
 # ------------------------------------------------------------------------------------------------ #
 logging.config.dictConfig(LogConfig().config)
@@ -38,10 +37,8 @@ logger.setLevel(logging.DEBUG)
 # ------------------------------------------------------------------------------------------------ #
 
 # ------------------------------------------------------------------------------------------------ #
-#                                  ALPHABETIC CHARACTERS                                           #
+#                                      ALPHABETIC CHARACTERS                                       #
 # ------------------------------------------------------------------------------------------------ #
-
-
 class AlphaCharacters(FeatureExtractor):
     """Counts the number of alphabetic characters"""
 
@@ -50,17 +47,21 @@ class AlphaCharacters(FeatureExtractor):
         self._name = "alphabetic_character_count"
         self._category = "length"
 
-    def extract(self, data: pd.DataFrame, idvar: str = "discourse_id") -> None:
-        """Extracts the feature from the dataset.
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the text data to be analyzed.
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
         """
-        return data[self._text_col].apply(lambda x: len([i for i in x if i.isalpha()]))
+        counts = self._get_context(texts, context).get("characters")
+        return counts.get(self._name)
 
 
 # ------------------------------------------------------------------------------------------------ #
-#                                    NUMBER CHARACTERS                                             #
+#                                        NUMBER CHARACTERS                                         #
 # ------------------------------------------------------------------------------------------------ #
 class NumberCharacters(FeatureExtractor):
     """Counts the number of numeric characters"""
@@ -70,17 +71,21 @@ class NumberCharacters(FeatureExtractor):
         self._name = "number_character_count"
         self._category = "length"
 
-    def extract(self, data: pd.DataFrame, **kwargs) -> None:
-        """Extracts the feature from the dataset.
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the text data to be analyzed.
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
         """
-        return data[self._text_col].apply(lambda x: len([x for x in x.split() if x.isdigit()]))
+        counts = self._get_context(texts, context).get("characters")
+        return counts.get(self._name)
 
 
 # ------------------------------------------------------------------------------------------------ #
-#                                    SPECIAL CHARACTERS                                            #
+#                                        SPECIAL CHARACTERS                                        #
 # ------------------------------------------------------------------------------------------------ #
 class SpecialCharacters(FeatureExtractor):
     """Counts the number of special characters"""
@@ -89,35 +94,29 @@ class SpecialCharacters(FeatureExtractor):
         super(SpecialCharacters, self).__init__()
         self._name = "special_character_count"
         self._category = "length"
-        self._counts_dict = {}
+        self._counts = None
 
-    def extract(self, data: pd.DataFrame, **kwargs) -> None:
-        """Extracts the feature from the dataset.
+    @property
+    def counts(self) -> pd.DataFrame:
+        """Corpus level counts for each symbol from the most recent extraction."""
+        return self._counts
+
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the text data to be analyzed.
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
         """
-        self._initialize_counts()
-        return data[self._text_col].apply(lambda x: self._count_feature(x))
-        self._counts = pd.DataFrame.from_dict(
-            data=self._counts_dict, orient="index", columns=["Count"]
-        ).sort_values(by="Count", ascending=False)
-
-    def _initialize_counts(self) -> None:
-        for k, v in specials.items():
-            self._counts_dict[k] = 0
-
-    def _count_feature(self, discourse: str) -> int:
-        total = 0
-        for k, v in specials.items():
-            count = len(re.findall(v, discourse))
-            self._counts_dict[k] += count
-            total += count
-        return total
+        counts = self._get_context(texts, context).get("characters")
+        self._counts = counts.totals(symbols=SPECIAL_SYMBOLS.keys())
+        return counts.get(self._name)
 
 
 # ------------------------------------------------------------------------------------------------ #
-#                                      PUNCTUATION                                                 #
+#                                           PUNCTUATION                                            #
 # ------------------------------------------------------------------------------------------------ #
 class Punctuation(FeatureExtractor):
     """Counts punctuation marks"""
@@ -126,35 +125,29 @@ class Punctuation(FeatureExtractor):
         super(Punctuation, self).__init__()
         self._name = "punctuation_count"
         self._category = "length"
-        self._counts_dict = {}
+        self._counts = None
+
+    @property
+    def counts(self) -> pd.DataFrame:
+        """Corpus level counts for each symbol from the most recent extraction."""
+        return self._counts
 
-    def extract(self, data: pd.DataFrame, **kwargs) -> None:
-        """Extracts the feature from the dataset.
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the text data to be analyzed.
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
         """
-        self._initialize_counts()
-        return data[self._text_col].apply(lambda x: self._count_feature(x))
-        self._counts = pd.DataFrame.from_dict(
-            data=self._counts_dict, orient="index", columns=["Count"]
-        ).sort_values(by="Count", ascending=False)
-
-    def _initialize_counts(self) -> None:
-        for k, v in punctuation.items():
-            self._counts_dict[k] = 0
-
-    def _count_feature(self, discourse: str) -> int:
-        total = 0
-        for k, v in punctuation.items():
-            count = len(re.findall(v, discourse))
-            self._counts_dict[k] += count
-            total += count
-        return total
+        counts = self._get_context(texts, context).get("characters")
+        self._counts = counts.totals(symbols=PUNCTUATION_SYMBOLS.keys())
+        return counts.get(self._name)
 
 
 # ------------------------------------------------------------------------------------------------ #
-#                                        COMMAS                                                    #
+#                                              COMMAS                                              #
 # ------------------------------------------------------------------------------------------------ #
 class Commas(FeatureExtractor):
     """Counts commas"""
@@ -164,41 +157,65 @@ class Commas(FeatureExtractor):
         self._name = "commas_count"
         self._category = "length"
 
-    def extract(self, data: pd.DataFrame, **kwargs) -> None:
-        """Extracts the feature from the dataset.
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the text data to be analyzed.
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
         """
-        return data[self._text_col].apply(lambda x: self._count_feature(x))
+        counts = self._get_context(texts, context).get("characters")
+        return counts.get(self._name)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        EXCLAMATION MARKS                                         #
+# ------------------------------------------------------------------------------------------------ #
+class ExclamationMarks(FeatureExtractor):
+    """Counts exclamation marks"""
+
+    def __init__(self) -> None:
+        super(ExclamationMarks, self).__init__()
+        self._name = "exclamation_mark_count"
+        self._category = "length"
 
-    def _count_feature(self, discourse: str) -> int:
-        pattern = punctuation["comma"]
-        return len(re.findall(pattern, discourse))
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
+
+        Args:
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
+        """
+        counts = self._get_context(texts, context).get("characters")
+        return counts.get(self._name)
 
 
 # ------------------------------------------------------------------------------------------------ #
-#                                     QUESTION MARKS                                               #
+#                                          QUESTION MARKS                                          #
 # ------------------------------------------------------------------------------------------------ #
 class QuestionMarks(FeatureExtractor):
-    """Counts commas"""
+    """Counts question marks"""
 
     def __init__(self) -> None:
         super(QuestionMarks, self).__init__()
         self._name = "question_mark_count"
         self._category = "length"
 
-    def extract(self, data: pd.DataFrame, **kwargs) -> None:
-        """Extracts the feature from the dataset.
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the text data to be analyzed.
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
         """
-        return data[self._text_col].apply(lambda x: self._count_feature(x))
-
-    def _count_feature(self, discourse: str) -> int:
-        pattern = punctuation["question mark"]
-        return len(re.findall(pattern, discourse))
+        counts = self._get_context(texts, context).get("characters")
+        return counts.get(self._name)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -211,66 +228,107 @@ class WordCount(FeatureExtractor):
         super(WordCount, self).__init__()
         self._name = "word_count"
         self._category = "length"
+        self._min_length = 0
 
-    def extract(self, data: pd.DataFrame, min_length: int = 0) -> None:
-        """Extracts the feature from the dataset.
+    def extract_batch(
+        self,
+        texts: TextColumn,
+        context: ExtractionContext = None,
+        min_length: int = None,
+        **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the text data to be analyzed.
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
+            min_length (int): Only words longer than min_length characters are counted.
         """
-        return data[self._text_col].apply(lambda x: self._count_features(x, min_length))
+        min_length = self._min_length if min_length is None else min_length
+        tokens = self._get_context(texts, context).get("tokens")
+        return tokens.word_lengths.count_greater(min_length)
+
+
+class WordCountGT5(WordCount):
+    """Counts words longer than five characters."""
+
+    def __init__(self) -> None:
+        super(WordCountGT5, self).__init__()
+        self._name = "word_count_gt_5"
+        self._min_length = 5
+
+
+class WordCountGT6(WordCount):
+    """Counts words longer than six characters."""
+
+    def __init__(self) -> None:
+        super(WordCountGT6, self).__init__()
+        self._name = "word_count_gt_6"
+        self._min_length = 6
 
-    def _count_features(self, x: str, min_length: int = 0) -> int:
-        tokens = str(x).split(" ")
-        return len([token for token in tokens if len(token) > min_length])
+
+class WordCountGT7(WordCount):
+    """Counts words longer than seven characters."""
+
+    def __init__(self) -> None:
+        super(WordCountGT7, self).__init__()
+        self._name = "word_count_gt_7"
+        self._min_length = 7
+
+
+class WordCountGT8(WordCount):
+    """Counts words longer than eight characters."""
+
+    def __init__(self) -> None:
+        super(WordCountGT8, self).__init__()
+        self._name = "word_count_gt_8"
+        self._min_length = 8
 
 
 # ------------------------------------------------------------------------------------------------ #
 #                                      AVG WORD LENGTH                                             #
 # ------------------------------------------------------------------------------------------------ #
 class AvgWordLength(FeatureExtractor):
-    """Counts Words. Also provides counts for words exceeding a minimum length."""
+    """Computes the average word length in characters."""
 
     def __init__(self) -> None:
         super(AvgWordLength, self).__init__()
         self._name = "avg_word_length"
         self._category = "length"
 
-    def extract(self, data: pd.DataFrame, min_length: int = 0) -> None:
-        """Extracts the feature from the dataset.
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the text data to be analyzed.
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
         """
-        return data[self._text_col].apply(lambda x: self._average_word_length(x))
-
-    def _average_word_length(self, discourse: str) -> float:
-        words = discourse.split(" ")
-        return sum(len(word) for word in words) / len(words)
+        return self._get_context(texts, context).get("tokens").word_lengths.mean()
 
 
 # ------------------------------------------------------------------------------------------------ #
 #                                      STD WORD LENGTH                                             #
 # ------------------------------------------------------------------------------------------------ #
 class StdWordLength(FeatureExtractor):
-    """Counts Words. Also provides counts for words exceeding a minimum length."""
+    """Computes the standard deviation of word length in characters."""
 
     def __init__(self) -> None:
         super(StdWordLength, self).__init__()
         self._name = "std_word_length"
         self._category = "length"
 
-    def extract(self, data: pd.DataFrame, min_length: int = 0) -> None:
-        """Extracts the feature from the dataset.
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the text data to be analyzed.
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
         """
-        return data[self._text_col].apply(lambda x: np.std(self._word_length(x)))
-
-    def _word_length(self, discourse: str) -> float:
-        words = discourse.split(" ")
-        return [len(word) for word in words]
+        return self._get_context(texts, context).get("tokens").word_lengths.std()
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -284,17 +342,39 @@ class VocabularySize(FeatureExtractor):
         self._name = "vocabulary_size"
         self._category = "length"
 
-    def extract(self, data: pd.DataFrame, **kwargs) -> None:
-        """Extracts the feature from the dataset.
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the text data to be analyzed.
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
         """
-        return data[self._text_col].apply(lambda x: self._count_vocabulary(x))
+        return self._get_context(texts, context).get("tokens").word_ids.nunique()
 
-    def _count_vocabulary(self, discourse: str) -> int:
-        tokens = discourse.split(" ")
-        return len(set(tokens))
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          LEMMAS                                                  #
+# ------------------------------------------------------------------------------------------------ #
+class Lemmas(FeatureExtractor):
+    """Counts the distinct lemmas in the discourse."""
+
+    def __init__(self) -> None:
+        super(Lemmas, self).__init__()
+        self._name = "lemmas_count"
+        self._category = "length"
+
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
+
+        Args:
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
+        """
+        return self._get_context(texts, context).get("vocabulary").view("lemma").nunique()
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -308,41 +388,39 @@ class SentenceCount(FeatureExtractor):
         self._name = "sentence_count"
         self._category = "length"
 
-    def extract(self, data: pd.DataFrame, **kwargs) -> None:
-        """Extracts the feature from the dataset.
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the text data to be analyzed.
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
         """
-        return data[self._text_col].apply(lambda x: len(sent_tokenize(x)))
+        return self._get_context(texts, context).get("sentences").counts
 
 
 # ------------------------------------------------------------------------------------------------ #
 #                                    AVG SENTENCE LENGTH                                           #
 # ------------------------------------------------------------------------------------------------ #
 class AvgSentenceLength(FeatureExtractor):
-    """Counts sentences in the discourse."""
+    """Computes the average sentence length in words."""
 
     def __init__(self) -> None:
         super(AvgSentenceLength, self).__init__()
         self._name = "avg_sentence_length"
         self._category = "length"
 
-    def extract(self, data: pd.DataFrame, **kwargs) -> None:
-        """Extracts the feature from the dataset.
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the text data to be analyzed.
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
         """
-        return data[self._text_col].apply(lambda x: self._ave_sentence_length(x))
-
-    def _ave_sentence_length(self, discourse: str) -> float:
-        sentences = sent_tokenize(discourse)
-        sentence_lengths = [len(word_tokenize(sentence)) for sentence in sentences]
-        if len(sentence_lengths) < 2:
-            return sentence_lengths[0]
-        else:
-            return statistics.stdev(sentence_lengths)
+        return self._get_context(texts, context).get("sentences").lengths.mean()
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -356,21 +434,18 @@ class StdSentenceLength(FeatureExtractor):
         self._name = "std_sentence_length"
         self._category = "length"
 
-    def extract(self, data: pd.DataFrame, min_length: int = 0) -> None:
-        """Extracts the feature from the dataset.
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
+
+        Discourses with fewer than two sentences have a standard deviation of zero.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the text data to be analyzed.
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
         """
-        return data[self._text_col].apply(lambda x: self._std_sentence_length(x))
-
-    def _std_sentence_length(self, discourse: str) -> float:
-        sentences = sent_tokenize(discourse)
-        sentence_lengths = [len(word_tokenize(sentence)) for sentence in sentences]
-        if len(sentence_lengths) < 2:
-            return 0.0
-        else:
-            return statistics.stdev(sentence_lengths)
+        return self._get_context(texts, context).get("sentences").lengths.std(ddof=1)
 
 
 # %%
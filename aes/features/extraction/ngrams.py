@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /ngrams.py                                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:18:32 am                                              #
+# Modified   : Saturday October 17th 2026 01:14:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Hashed n-gram counting over the shared tokenization."""
+import os
+import numpy as np
+from scipy import sparse
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig
+from aes.features.extraction.columnar import mix_hashes
+from aes.features.extraction.vocabulary import InternedTokens
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+# Multiplier of the polynomial rolling hash, an odd 64 bit constant.
+_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+# ------------------------------------------------------------------------------------------------ #
+#                                        NGRAM COUNTS                                              #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class NgramCounts:
+    """Sparse n-gram count matrix with one row per discourse and one column per hashed n-gram.
+
+    Args:
+        matrix (sparse.csr_matrix): Counts of each hashed n-gram in each discourse.
+    """
+
+    def __init__(self, matrix: sparse.csr_matrix) -> None:
+        self._matrix = matrix
+
+    def __len__(self) -> int:
+        return self._matrix.shape[0]
+
+    @property
+    def matrix(self) -> sparse.csr_matrix:
+        return self._matrix
+
+    @property
+    def totals(self) -> np.ndarray:
+        """Number of n-grams in each discourse."""
+        return np.asarray(self._matrix.sum(axis=1)).ravel().astype(np.int64)
+
+    @property
+    def distinct(self) -> np.ndarray:
+        """Number of distinct n-grams in each discourse."""
+        return np.diff(self._matrix.indptr).astype(np.int64)
+
+    def save(self, filepath: str) -> None:
+        """Saves the matrix in compressed .npz format for reuse as a model input."""
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        sparse.save_npz(filepath, self._matrix)
+
+    @classmethod
+    def load(cls, filepath: str) -> "NgramCounts":
+        return cls(sparse.load_npz(filepath).tocsr())
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        NGRAM ENGINE                                              #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class NgramEngine:
+    """Counts word and stemmed word n-grams for every discourse in one pass over the tokens.
+
+    Tokens are read as vocabulary ids, so each unique normalized form, and each unique stem,
+    is hashed once to a stable 64 bit id and gathered per token. N-gram keys are combined
+    from the ids of consecutive tokens with a polynomial rolling hash, vectorized over the
+    corpus, and never span two discourses. Keys are reduced to n_features columns (the
+    hashing trick). Columns therefore do not depend on the corpus, and matrices built from
+    different corpora can be used together.
+
+    Args:
+        orders (tuple): N-gram lengths to count.
+        n_features (int): Number of hashed columns in each matrix.
+    """
+
+    def __init__(self, orders: tuple = (2, 3), n_features: int = 2**20) -> None:
+        self._orders = tuple(orders)
+        self._n_features = n_features
+
+    @property
+    def n_features(self) -> int:
+        return self._n_features
+
+    def count(self, tokens: InternedTokens) -> dict:
+        """Counts n-grams of words and of stemmed words.
+
+        Args:
+            tokens (InternedTokens): The token stream as vocabulary ids.
+
+        Returns:
+            Dictionary of NgramCounts keyed by (n, stemmed), e.g. (2, False) for bigrams.
+        """
+        vocabulary = tokens.vocabulary
+        words = tokens.view("normalized")
+        ids = {
+            False: vocabulary.hashes("normalized")[words.values],
+            True: vocabulary.hashes("stem")[tokens.view("stem").values],
+        }
+        results = {}
+        for n in self._orders:
+            rows, starts = self._starts(words.offsets, n)
+            for stemmed, token_ids in ids.items():
+                results[(n, stemmed)] = self._count(token_ids, rows, starts, n, len(words))
+        return results
+
+    def _starts(self, offsets: np.ndarray, n: int) -> tuple:
+        """Returns the discourse and the position of the first token of every n-gram."""
+        counts = np.maximum(np.diff(offsets) - n + 1, 0)
+        rows = np.repeat(np.arange(len(counts), dtype=np.int64), counts)
+        exclusive = np.cumsum(counts) - counts
+        within = np.arange(len(rows), dtype=np.int64) - np.repeat(exclusive, counts)
+        return rows, np.repeat(offsets[:-1], counts) + within
+
+    def _count(
+        self, token_ids: np.ndarray, rows: np.ndarray, starts: np.ndarray, n: int, n_rows: int
+    ) -> NgramCounts:
+        keys = token_ids[starts]
+        for k in range(1, n):
+            keys = keys * _MULTIPLIER + token_ids[starts + k]
+        columns = (mix_hashes(keys) % np.uint64(self._n_features)).astype(np.int64)
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, columns)),
+            shape=(n_rows, self._n_features),
+        )
+        matrix.sum_duplicates()
+        return NgramCounts(matrix)
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+def build_ngrams(context) -> dict:
+    """Builds the 'ngrams' intermediate: bigram and trigram counts of words and stems."""
+    return NgramEngine().count(context.get("vocabulary"))
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /planner.py                                                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 03:30:00 pm                                                #
+# Modified   : Saturday October 17th 2026 01:00:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Dependency-aware planning and execution of feature extraction."""
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import numpy as np
+import pandas as pd
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig
+from aes.data.essays import DiscourseSpans, EssayStore
+from aes.data.models import ModelSelector, ModelTier
+from aes.features.extraction.base import FeatureExtractorFactory
+from aes.features.extraction.columnar import TextColumn
+from aes.features.extraction.context import ExtractionContext, INTERMEDIATES
+from aes.features.extraction.registry import REGISTRY
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+INTERMEDIATE = "intermediate"
+FEATURE = "feature"
+# ------------------------------------------------------------------------------------------------ #
+#                                    EXTRACTION PLAN                                               #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ExtractionPlan:
+    """Directed acyclic graph of the intermediates and features needed for a set of features.
+
+    Nodes are (kind, name) tuples where kind is 'intermediate' or 'feature'. An edge runs from
+    each intermediate to every node that consumes it.
+
+    Args:
+        extractors (dict): Feature extractors keyed by canonical feature name.
+    """
+
+    def __init__(self, extractors: dict) -> None:
+        self._extractors = extractors
+        self._dependencies = {}
+        self._consumers = {}
+        self._build()
+
+    @property
+    def nodes(self) -> list:
+        return list(self._dependencies.keys())
+
+    @property
+    def features(self) -> list:
+        return [name for kind, name in self._dependencies if kind == FEATURE]
+
+    @property
+    def intermediates(self) -> list:
+        return [name for kind, name in self._dependencies if kind == INTERMEDIATE]
+
+    def dependencies(self, node: tuple) -> set:
+        """Returns the nodes the given node consumes."""
+        return self._dependencies[node]
+
+    def consumers(self, node: tuple) -> set:
+        """Returns the nodes that consume the given node."""
+        return self._consumers[node]
+
+    def stages(self) -> list:
+        """Returns the nodes grouped into stages. Nodes in a stage are mutually independent."""
+        remaining = {node: set(deps) for node, deps in self._dependencies.items()}
+        stages = []
+        while remaining:
+            stage = sorted(node for node, deps in remaining.items() if not deps)
+            if not stage:
+                raise ValueError("The extraction plan contains a cycle: {}".format(remaining))
+            for node in stage:
+                del remaining[node]
+            for deps in remaining.values():
+                deps.difference_update(stage)
+            stages.append(stage)
+        return stages
+
+    def _build(self) -> None:
+        for name, extractor in self._extractors.items():
+            self._add((FEATURE, name), extractor.requires)
+        self.stages()  # Validates that the graph is acyclic.
+
+    def _add(self, node: tuple, requires: list) -> None:
+        self._dependencies[node] = {(INTERMEDIATE, r) for r in requires}
+        self._consumers.setdefault(node, set())
+        for name in requires:
+            dependency = (INTERMEDIATE, name)
+            if dependency not in self._dependencies:
+                try:
+                    self._add(dependency, INTERMEDIATES[name]["requires"])
+                except KeyError:
+                    logger.error("Intermediate {} is not supported.".format(name))
+                    raise
+            self._consumers[dependency].add(node)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                  EXTRACTION PLANNER                                              #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ExtractionPlanner:
+    """Plans and runs the extraction of a list of features.
+
+    Each intermediate in the plan is computed exactly once, and only after the intermediates it
+    derives from. It is released as soon as its last consumer finishes. Nodes whose dependencies
+    are satisfied run concurrently on a thread pool, so independent branches, e.g. the character
+    counts and the tokenization, overlap.
+
+    Features that need spaCy annotations declare a minimum model tier in the registry. The run
+    parses with the cheapest installed pipeline meeting every requested tier, and the pipeline
+    used for each such feature is recorded in provenance.
+
+    Args:
+        names (list): Canonical names of the features to extract.
+        max_workers (int): Number of threads used to run independent nodes. Defaults to 4.
+        extractors (dict): Optional pre-built extractors keyed by feature name. If omitted,
+            extractors are obtained from the FeatureExtractorFactory.
+        selector (ModelSelector): Chooses the spaCy pipeline. Defaults to the configured tiers.
+        model (ModelTier): Pipeline to parse with, overriding the selection, e.g. to compute
+            some features with the pipeline chosen for a larger set.
+    """
+
+    def __init__(
+        self,
+        names: list,
+        max_workers: int = 4,
+        extractors: dict = None,
+        selector: ModelSelector = None,
+        model: ModelTier = None,
+    ) -> None:
+        if extractors is None:
+            factory = FeatureExtractorFactory()
+            extractors = {name: factory.create_extractor(name=name) for name in names}
+        self._extractors = {name: extractors[name] for name in names}
+        self._plan = ExtractionPlan(self._extractors)
+        self._max_workers = max_workers
+        self._costs = {name: REGISTRY.get(name).cost for name in names if name in REGISTRY}
+        self._qualities = {
+            name: REGISTRY.get(name).quality
+            for name in names
+            if name in REGISTRY and REGISTRY.get(name).quality
+        }
+        self._selector = selector
+        self._model = model
+
+    @property
+    def plan(self) -> ExtractionPlan:
+        return self._plan
+
+    @property
+    def model(self) -> ModelTier:
+        """The spaCy pipeline selected for the features, or None if none needs one."""
+        if self._model is None and self._qualities:
+            selector = self._selector if self._selector is not None else ModelSelector()
+            self._model = selector.select(self._qualities.values())
+        return self._model
+
+    @property
+    def provenance(self) -> dict:
+        """Tier, model and version of the spaCy pipeline producing each feature that uses one."""
+        if not self._qualities:
+            return {}
+        provenance = self.model.provenance()
+        return {name: dict(provenance) for name in self._qualities}
+
+    def run(
+        self, texts: TextColumn, categories: TextColumn = None, spans: DiscourseSpans = None
+    ) -> dict:
+        """Executes the plan over a column of texts.
+
+        Args:
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            categories (TextColumn): Optional discourse type of each text. Required by the
+                semantic features.
+            spans (DiscourseSpans): Optional location of each text within its essay. When
+                given, features derived from a parse are computed from slices of the essays'
+                parses.
+
+        Returns:
+            Dictionary of NumPy arrays keyed by feature name.
+        """
+        model = self.model.model if self.model is not None else None
+        context = ExtractionContext(texts, categories=categories, model=model, spans=spans)
+        remaining = {node: set(self._plan.dependencies(node)) for node in self._plan.nodes}
+        unfinished = {node: len(self._plan.consumers(node)) for node in self._plan.nodes}
+        results = {}
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            pending = {}
+
+            def submit(node: tuple) -> None:
+                pending[pool.submit(self._execute, node, context)] = node
+
+            ready = [node for node, deps in remaining.items() if not deps]
+            for node in sorted(ready, key=self._priority):
+                submit(node)
+
+            while pending:
+                done, _ = wait(list(pending.keys()), return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = pending.pop(future)
+                    kind, name = node
+                    value = future.result()
+                    if kind == FEATURE:
+                        results[name] = value
+                    for dependency in self._plan.dependencies(node):
+                        unfinished[dependency] -= 1
+                        if unfinished[dependency] == 0:
+                            logger.debug("Releasing intermediate {}.".format(dependency[1]))
+                            context.release(dependency[1])
+                    for consumer in sorted(self._plan.consumers(node), key=self._priority):
+                        remaining[consumer].discard(node)
+                        if not remaining[consumer]:
+                            submit(consumer)
+
+        return {name: results[name] for name in self._extractors}
+
+    def extract(
+        self,
+        data: pd.DataFrame,
+        idvar: str = "discourse_id",
+        text_col: str = "discourse_text",
+        category_col: str = "discourse_type",
+        essay_col: str = "essay_id",
+        essays: EssayStore = None,
+    ) -> pd.DataFrame:
+        """Extracts the features from a DataFrame.
+
+        Args:
+            data (pd.DataFrame): DataFrame containing the idvar and text columns.
+            idvar (str): The identifier column carried into the output.
+            text_col (str): The column containing the discourse texts.
+            category_col (str): The column containing the discourse types, if present.
+            essay_col (str): The column containing the essay identifiers.
+            essays (EssayStore): Optional source of the essay texts. When given, each essay
+                is parsed once and its discourses are sliced from the parse.
+
+        Returns:
+            DataFrame with the idvar and one column per feature. Its attrs hold the
+            provenance of the features parsed with spaCy, which the stores record.
+        """
+        features = data[[idvar]].copy()
+        categories = data[category_col] if category_col in data.columns else None
+        spans = None
+        if essays is not None and "parse" in self._plan.intermediates:
+            spans = DiscourseSpans.from_frame(
+                data, essays=essays, idvar=idvar, text_col=text_col, essay_col=essay_col
+            )
+        results = self.run(data[text_col], categories=categories, spans=spans)
+        for name, values in results.items():
+            features[name] = values
+        features.attrs["provenance"] = self.provenance
+        return features
+
+    def _priority(self, node: tuple) -> tuple:
+        """Orders ready nodes so that the most expensive features are started first."""
+        kind, name = node
+        return (-self._costs.get(name, 0) if kind == FEATURE else 0, node)
+
+    def _execute(self, node: tuple, context: ExtractionContext) -> np.ndarray:
+        kind, name = node
+        if kind == INTERMEDIATE:
+            context.get(name)
+            return None
+        return self._extractors[name].extract_batch(context.texts, context=context)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /ragged.py                                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 12:40:00 pm                                                #
+# Modified   : Friday October 16th 2026 12:40:00 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Ragged arrays and segmented reductions over per-discourse token data."""
+import numpy as np
+from typing import Sequence, Union
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+class RaggedArray:
+    """Variable length rows stored as one flat array plus row offsets.
+
+    Row i occupies values[offsets[i]:offsets[i + 1]]. Each reduction is computed for all rows
+    at once with a segmented bincount, so statistics for the whole corpus cost a handful of
+    NumPy calls regardless of the number of discourses. Empty rows reduce to zero.
+
+    Args:
+        values (np.ndarray): Flat array of values, e.g. token lengths in corpus order.
+        offsets (np.ndarray): Array of len(rows) + 1 offsets into values.
+    """
+
+    def __init__(self, values: np.ndarray, offsets: np.ndarray) -> None:
+        self._values = np.asarray(values)
+        self._offsets = np.asarray(offsets, dtype=np.int64)
+        self._segment = None
+
+    @classmethod
+    def from_counts(cls, values: np.ndarray, counts: np.ndarray) -> "RaggedArray":
+        """Builds a RaggedArray from the flat values and the number of values in each row."""
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        return cls(values=values, offsets=offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> np.ndarray:
+        return self._values[self._offsets[i] : self._offsets[i + 1]]
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    @property
+    def offsets(self) -> np.ndarray:
+        return self._offsets
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.diff(self._offsets)
+
+    @property
+    def segment(self) -> np.ndarray:
+        """The row each value belongs to."""
+        if self._segment is None:
+            self._segment = np.repeat(np.arange(len(self), dtype=np.intp), self.counts)
+        return self._segment
+
+    def sum(self) -> np.ndarray:
+        """Returns the sum of each row."""
+        return np.bincount(self.segment, weights=self._values, minlength=len(self))
+
+    def mean(self) -> np.ndarray:
+        """Returns the mean of each row."""
+        counts = self.counts
+        return np.divide(self.sum(), counts, out=np.zeros(len(self)), where=counts > 0)
+
+    def std(self, ddof: int = 0) -> np.ndarray:
+        """Returns the standard deviation of each row. Rows with ddof values or fewer return 0.
+
+        Args:
+            ddof (int): Delta degrees of freedom, 0 for the population and 1 for the sample.
+        """
+        counts = self.counts
+        deviations = (self._values - self.mean()[self.segment]) ** 2
+        squares = np.bincount(self.segment, weights=deviations, minlength=len(self))
+        return np.sqrt(
+            np.divide(squares, counts - ddof, out=np.zeros(len(self)), where=counts > ddof)
+        )
+
+    def count_greater(self, thresholds: Union[int, Sequence[int]]) -> np.ndarray:
+        """Counts the values in each row greater than each threshold.
+
+        Args:
+            thresholds (int, Sequence[int]): A threshold or a sequence of thresholds.
+
+        Returns:
+            Array of counts per row, or a matrix with one column per threshold.
+        """
+        if np.isscalar(thresholds):
+            return np.bincount(self.segment[self._values > thresholds], minlength=len(self))
+        return np.column_stack([self.count_greater(threshold) for threshold in thresholds])
+
+    def nunique(self) -> np.ndarray:
+        """Counts the distinct values in each row. Values must be non-negative integers."""
+        if len(self._values) == 0:
+            return np.zeros(len(self), dtype=np.int64)
+        width = np.int64(self._values.max()) + 1
+        keys = np.unique(self.segment.astype(np.int64) * width + self._values)
+        return np.bincount(keys // width, minlength=len(self))
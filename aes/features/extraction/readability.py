@@ -11,8 +11,429 @@
 # URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Wednesday August 10th 2022 06:28:56 pm                                              #
-# Modified   : Wednesday August 10th 2022 06:29:00 pm                                              #
+# Modified   : Saturday October 17th 2026 12:54:00 am                                              #
 # ------------------------------------------------------------------------------------------------ #
 # License    : BSD 3-clause "New" or "Revised" License                                             #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
+"""Defines Readability Features computed from per-discourse sufficient statistics."""
+import os
+import re
+import pickle
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig, DataConfig, resolve_path
+from aes.features.extraction.base import FeatureExtractor
+from aes.features.extraction.columnar import TextColumn
+from aes.features.extraction.context import ExtractionContext
+from aes.features.extraction.ragged import RaggedArray
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+READABILITY_FEATURES = [
+    "automated_readibility_index",
+    "Coleman-Liau index",
+    "Dale-Chall readability score",
+    "Difficult word count",
+    "Flesch reading ease",
+    "Flesch-Kincaid grade",
+    "Gunning fog",
+    "Linsear write formula",
+    "Smog index",
+    "Syllables count",
+]
+# ------------------------------------------------------------------------------------------------ #
+# Vowels include their accented forms, e.g. 'café' and 'naïve'.
+_VOWEL_GROUPS = re.compile(r"[aeiouyàáâãäåæèéêëìíîïòóôõöøœùúûüýÿ]+")
+# Characters other than letters and digits, in any script, are stripped from words.
+_NON_WORD = r"[^\p{L}\p{N}]"
+
+
+def count_syllables(word: str) -> int:
+    """Estimates the number of syllables in a lowercase word from its vowel groups."""
+    syllables = len(_VOWEL_GROUPS.findall(word))
+    if syllables > 1 and word.endswith("e") and not word.endswith(("le", "ee")):
+        syllables -= 1  # Silent final e, e.g. 'make'.
+    elif syllables > 1 and word.endswith("ed") and not word.endswith(("ted", "ded")):
+        syllables -= 1  # Silent e in the past tense, e.g. 'jumped'.
+    return max(1, syllables) if word else 0
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      SYLLABLE LEXICON                                            #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class SyllableLexicon:
+    """Memo table of syllable counts per unique word, persisted between runs.
+
+    Args:
+        filepath (str): Path to the pickled memo table. Defaults to readability.syllables in
+            the data configuration. If None, the table is kept in memory only.
+    """
+
+    def __init__(self, filepath: str = None) -> None:
+        self._filepath = filepath
+        self._syllables = {}
+        self._added = {}
+        if self._filepath and os.path.exists(self._filepath):
+            with open(self._filepath, "rb") as file:
+                self._syllables = pickle.load(file)
+
+    def __len__(self) -> int:
+        return len(self._syllables)
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    @property
+    def modified(self) -> bool:
+        """True if words were added since the table was loaded or last saved."""
+        return bool(self._added)
+
+    def lookup(self, words: np.ndarray) -> np.ndarray:
+        """Returns the syllable count of each word, syllabifying only words not yet memoized.
+
+        Args:
+            words (np.ndarray): Unique lowercase words.
+        """
+        counts = np.empty(len(words), dtype=np.int64)
+        for i, word in enumerate(words):
+            count = self._syllables.get(word)
+            if count is None:
+                count = self._syllables[word] = self._added[word] = count_syllables(word)
+            counts[i] = count
+        return counts
+
+    def save(self) -> None:
+        """Writes the words added since the table was loaded, merged with the stored table."""
+        if not self._filepath or not self.modified:
+            return
+        syllables = {}
+        if os.path.exists(self._filepath):
+            with open(self._filepath, "rb") as file:
+                syllables = pickle.load(file)
+        syllables.update(self._added)
+        os.makedirs(os.path.dirname(self._filepath) or ".", exist_ok=True)
+        staging = "{}.{}".format(self._filepath, os.getpid())
+        with open(staging, "wb") as file:
+            pickle.dump(syllables, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(staging, self._filepath)
+        logger.debug("Saved {} new words to {}.".format(len(self._added), self._filepath))
+        self._added = {}
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                 READABILITY STATISTICS                                           #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ReadabilityStatistics:
+    """Per-discourse sufficient statistics from which every readability feature is evaluated.
+
+    Each argument is an array with one value per discourse. Features are undefined, and
+    returned as NaN, for discourses without words or sentences.
+
+    Args:
+        characters (np.ndarray): Letters and digits in words.
+        words (np.ndarray): Words containing at least one letter or digit.
+        sentences (np.ndarray): Sentences.
+        syllables (np.ndarray): Syllables in words.
+        polysyllables (np.ndarray): Words of three or more syllables.
+        difficult (np.ndarray): Dale-Chall difficult words.
+    """
+
+    def __init__(
+        self,
+        characters: np.ndarray,
+        words: np.ndarray,
+        sentences: np.ndarray,
+        syllables: np.ndarray,
+        polysyllables: np.ndarray,
+        difficult: np.ndarray,
+    ) -> None:
+        self._characters = np.asarray(characters, dtype=np.float64)
+        self._words = np.asarray(words, dtype=np.float64)
+        self._sentences = np.asarray(sentences, dtype=np.float64)
+        self._syllables = np.asarray(syllables, dtype=np.float64)
+        self._polysyllables = np.asarray(polysyllables, dtype=np.float64)
+        self._difficult = np.asarray(difficult, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def get(self, name: str) -> np.ndarray:
+        """Returns a readability feature by its canonical name, e.g. 'Gunning fog'."""
+        words_per_sentence = self._ratio(self._words, self._sentences)
+        syllables_per_word = self._ratio(self._syllables, self._words)
+        if name == "automated_readibility_index":
+            characters_per_word = self._ratio(self._characters, self._words)
+            return 4.71 * characters_per_word + 0.5 * words_per_sentence - 21.43
+        elif name == "Coleman-Liau index":
+            letters = 100 * self._ratio(self._characters, self._words)
+            sentences = 100 * self._ratio(self._sentences, self._words)
+            return 0.0588 * letters - 0.296 * sentences - 15.8
+        elif name == "Dale-Chall readability score":
+            difficult = self._ratio(self._difficult, self._words)
+            score = 15.79 * difficult + 0.0496 * words_per_sentence
+            return np.where(difficult > 0.05, score + 3.6365, score)
+        elif name == "Difficult word count":
+            return self._difficult
+        elif name == "Flesch reading ease":
+            return 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+        elif name == "Flesch-Kincaid grade":
+            return 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+        elif name == "Gunning fog":
+            return 0.4 * (words_per_sentence + 100 * self._ratio(self._polysyllables, self._words))
+        elif name == "Linsear write formula":
+            easy = self._words - self._polysyllables
+            score = self._ratio(easy + 3 * self._polysyllables, self._sentences)
+            return np.where(score > 20, score / 2, score / 2 - 1)
+        elif name == "Smog index":
+            polysyllables = self._polysyllables * self._ratio(30, self._sentences)
+            return 1.043 * np.sqrt(polysyllables) + 3.1291
+        elif name == "Syllables count":
+            return self._syllables
+        raise KeyError("{} is not a readability feature.".format(name))
+
+    def _ratio(self, numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        """Divides, with NaN where the denominator is zero."""
+        numerator = np.broadcast_to(np.asarray(numerator, dtype=np.float64), denominator.shape)
+        return np.divide(
+            numerator,
+            denominator,
+            out=np.full(denominator.shape, np.nan),
+            where=denominator > 0,
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                   READABILITY ANALYZER                                           #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ReadabilityAnalyzer:
+    """Computes ReadabilityStatistics from the shared tokenization.
+
+    Words are lowercased and stripped to letters and digits in one vectorized pass, then
+    dictionary encoded. Syllables and difficulty are evaluated once per unique word, using
+    the SyllableLexicon memo, and gathered back to the tokens.
+
+    Args:
+        lexicon (SyllableLexicon): Syllable memo table. Defaults to the configured table.
+        easy_words (set): The Dale-Chall list of familiar words. Defaults to the configured
+            list. If no list is available, words of three or more syllables are difficult.
+    """
+
+    def __init__(self, lexicon: SyllableLexicon = None, easy_words: set = None) -> None:
+        config = DataConfig().config.get("readability", {})
+        if lexicon is None:
+            filepath = config.get("syllables")
+            lexicon = SyllableLexicon(resolve_path(filepath) if filepath else None)
+        self._lexicon = lexicon
+        self._easy_words = easy_words if easy_words is not None else self._load_easy_words(config)
+
+    @property
+    def lexicon(self) -> SyllableLexicon:
+        return self._lexicon
+
+    def analyze(self, tokens, sentences) -> ReadabilityStatistics:
+        """Returns the statistics for a Tokenization and the Sentences of the same texts."""
+        return self.compute(tokens.words, tokens.word_offsets, sentences.counts)
+
+    def compute(
+        self, words: pa.Array, word_offsets: np.ndarray, sentence_counts: np.ndarray
+    ) -> ReadabilityStatistics:
+        """Computes the statistics from flat word tokens.
+
+        Args:
+            words (pa.Array): Flat array of word tokens in corpus order.
+            word_offsets (np.ndarray): Offsets of the first word of each discourse, plus the total.
+            sentence_counts (np.ndarray): Number of sentences in each discourse.
+        """
+        cleaned = pc.replace_substring_regex(
+            pc.utf8_lower(words), pattern=_NON_WORD, replacement=""
+        )
+        encoded = pc.dictionary_encode(cleaned)
+        vocabulary = encoded.dictionary.to_numpy(zero_copy_only=False)
+        indices = encoded.indices.to_numpy(zero_copy_only=False)
+
+        lengths = np.array([len(word) for word in vocabulary], dtype=np.int64)
+        syllables = self._lexicon.lookup(vocabulary)
+        if self._easy_words:
+            easy = np.array([word in self._easy_words for word in vocabulary], dtype=bool)
+            difficult = ~easy & (syllables >= 2)
+        else:
+            difficult = syllables >= 3
+        if self._lexicon.modified:
+            self._lexicon.save()
+
+        def total(values: np.ndarray) -> np.ndarray:
+            return RaggedArray(values[indices], word_offsets).sum()
+
+        return ReadabilityStatistics(
+            characters=total(lengths),
+            words=total(lengths > 0),
+            sentences=sentence_counts,
+            syllables=total(syllables),
+            polysyllables=total(syllables >= 3),
+            difficult=total(difficult),
+        )
+
+    def _load_easy_words(self, config: dict) -> set:
+        filepath = config.get("easy_words")
+        filepath = resolve_path(filepath) if filepath else None
+        if filepath and os.path.exists(filepath):
+            with open(filepath, "r") as file:
+                return {line.strip().lower() for line in file if line.strip()}
+        logger.warning("Dale-Chall word list not found. Words of 3+ syllables are difficult.")
+        return set()
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+def build_readability(context) -> ReadabilityStatistics:
+    """Builds the 'readability' intermediate from the shared words and sentences."""
+    return ReadabilityAnalyzer().analyze(context.get("tokens"), context.get("sentences"))
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    READABILITY FEATURE                                           #
+# ------------------------------------------------------------------------------------------------ #
+class ReadabilityFeature(FeatureExtractor):
+    """Base class for readability features, all read from the shared 'readability' intermediate."""
+
+    def __init__(self) -> None:
+        super(ReadabilityFeature, self).__init__()
+        self._category = "readability"
+
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
+
+        Args:
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
+        """
+        statistics = self._get_context(texts, context).get("readability")
+        return statistics.get(self._name)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                   AUTOMATED READABILITY INDEX                                    #
+# ------------------------------------------------------------------------------------------------ #
+class AutomatedReadabilityIndex(ReadabilityFeature):
+    """Automated Readability Index, from characters per word and words per sentence"""
+
+    def __init__(self) -> None:
+        super(AutomatedReadabilityIndex, self).__init__()
+        self._name = "automated_readibility_index"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        COLEMAN-LIAU INDEX                                        #
+# ------------------------------------------------------------------------------------------------ #
+class ColemanLiauIndex(ReadabilityFeature):
+    """Coleman-Liau index, from letters and sentences per 100 words"""
+
+    def __init__(self) -> None:
+        super(ColemanLiauIndex, self).__init__()
+        self._name = "Coleman-Liau index"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         DALE-CHALL SCORE                                         #
+# ------------------------------------------------------------------------------------------------ #
+class DaleChallScore(ReadabilityFeature):
+    """Dale-Chall readability score, from the share of difficult words"""
+
+    def __init__(self) -> None:
+        super(DaleChallScore, self).__init__()
+        self._name = "Dale-Chall readability score"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         DIFFICULT WORDS                                          #
+# ------------------------------------------------------------------------------------------------ #
+class DifficultWords(ReadabilityFeature):
+    """Counts words outside the Dale-Chall list of familiar words"""
+
+    def __init__(self) -> None:
+        super(DifficultWords, self).__init__()
+        self._name = "Difficult word count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       FLESCH READING EASE                                        #
+# ------------------------------------------------------------------------------------------------ #
+class FleschReadingEase(ReadabilityFeature):
+    """Flesch reading ease"""
+
+    def __init__(self) -> None:
+        super(FleschReadingEase, self).__init__()
+        self._name = "Flesch reading ease"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       FLESCH-KINCAID GRADE                                       #
+# ------------------------------------------------------------------------------------------------ #
+class FleschKincaidGrade(ReadabilityFeature):
+    """Flesch-Kincaid grade level"""
+
+    def __init__(self) -> None:
+        super(FleschKincaidGrade, self).__init__()
+        self._name = "Flesch-Kincaid grade"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                           GUNNING FOG                                            #
+# ------------------------------------------------------------------------------------------------ #
+class GunningFog(ReadabilityFeature):
+    """Gunning fog index"""
+
+    def __init__(self) -> None:
+        super(GunningFog, self).__init__()
+        self._name = "Gunning fog"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          LINSEAR WRITE                                           #
+# ------------------------------------------------------------------------------------------------ #
+class LinsearWrite(ReadabilityFeature):
+    """Linsear Write formula"""
+
+    def __init__(self) -> None:
+        super(LinsearWrite, self).__init__()
+        self._name = "Linsear write formula"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                            SMOG INDEX                                            #
+# ------------------------------------------------------------------------------------------------ #
+class SmogIndex(ReadabilityFeature):
+    """SMOG index"""
+
+    def __init__(self) -> None:
+        super(SmogIndex, self).__init__()
+        self._name = "Smog index"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                            SYLLABLES                                             #
+# ------------------------------------------------------------------------------------------------ #
+class Syllables(ReadabilityFeature):
+    """Counts syllables"""
+
+    def __init__(self) -> None:
+        super(Syllables, self).__init__()
+        self._name = "Syllables count"
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /registry.py                                                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 04:50:00 pm                                                #
+# Modified   : Saturday October 17th 2026 01:14:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Registry of feature extractor metadata. Extractors are imported and constructed on demand."""
+import importlib
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ExtractorSpec:
+    """Metadata describing a feature extractor without importing or constructing it.
+
+    Args:
+        name (str): The canonical name of the feature, e.g. 'word_count'.
+        module (str): Dotted path of the module defining the extractor class.
+        klass (str): Name of the extractor class.
+        category (str): The feature category, e.g. 'length'.
+        cost (int): Relative cost of extraction, used to schedule expensive work first.
+        requires (list): Shared intermediates consumed by the extractor, e.g. ['tokens'].
+        version (int): Implementation version. Increment it whenever a change to the extractor
+            alters its output, so that cached values are invalidated.
+        quality (str): Minimum spaCy model tier the extractor needs, e.g. 'sm' or 'md'. None
+            for extractors that do not use spaCy annotations.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        module: str,
+        klass: str,
+        category: str,
+        cost: int = 1,
+        requires: list = None,
+        version: int = 1,
+        quality: str = None,
+    ) -> None:
+        self._name = name
+        self._module = module
+        self._klass = klass
+        self._category = category
+        self._cost = cost
+        self._requires = list(requires or [])
+        self._version = version
+        self._quality = quality
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def module(self) -> str:
+        return self._module
+
+    @property
+    def klass(self) -> str:
+        return self._klass
+
+    @property
+    def category(self) -> str:
+        return self._category
+
+    @property
+    def cost(self) -> int:
+        return self._cost
+
+    @property
+    def requires(self) -> list:
+        return self._requires
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def quality(self) -> str:
+        return self._quality
+
+    def load(self) -> type:
+        """Imports the module and returns the extractor class."""
+        return getattr(importlib.import_module(self._module), self._klass)
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ExtractorRegistry:
+    """Catalog of ExtractorSpecs keyed by canonical feature name."""
+
+    def __init__(self) -> None:
+        self._specs = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    @property
+    def categories(self) -> list:
+        return list(dict.fromkeys(spec.category for spec in self._specs.values()))
+
+    def register(self, spec: ExtractorSpec) -> None:
+        """Adds an extractor to the registry."""
+        if spec.name in self._specs:
+            logger.warning("Extractor {} is already registered. Replacing.".format(spec.name))
+        self._specs[spec.name] = spec
+
+    def get(self, name: str) -> ExtractorSpec:
+        """Returns the spec for the named extractor."""
+        try:
+            return self._specs[name]
+        except KeyError as e:
+            logger.error("Extractor {} is not registered.".format(name))
+            raise KeyError(e)
+
+    def list_extractors(self, category: str = None) -> list:
+        """Returns the names of registered extractors, optionally for a single category."""
+        return [
+            name
+            for name, spec in self._specs.items()
+            if category is None or spec.category == category
+        ]
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        CATALOG                                                   #
+# ------------------------------------------------------------------------------------------------ #
+REGISTRY = ExtractorRegistry()
+
+
+def register_extractor(
+    name: str,
+    module: str,
+    klass: str,
+    category: str,
+    cost: int = 1,
+    requires: list = None,
+    version: int = 1,
+    quality: str = None,
+) -> None:
+    """Registers an extractor in the default registry."""
+    REGISTRY.register(
+        ExtractorSpec(
+            name=name,
+            module=module,
+            klass=klass,
+            category=category,
+            cost=cost,
+            requires=requires,
+            version=version,
+            quality=quality,
+        )
+    )
+
+
+# ------------------------------------------------------------------------------------------------ #
+_LENGTH = "aes.features.extraction.length"
+
+for _name, _klass in [
+    ("alphabetic_character_count", "AlphaCharacters"),
+    ("number_character_count", "NumberCharacters"),
+    ("special_character_count", "SpecialCharacters"),
+    ("punctuation_count", "Punctuation"),
+    ("commas_count", "Commas"),
+    ("exclamation_mark_count", "ExclamationMarks"),
+    ("question_mark_count", "QuestionMarks"),
+]:
+    register_extractor(_name, _LENGTH, _klass, "length", cost=1, requires=["characters"])
+
+for _name, _klass in [
+    ("word_count", "WordCount"),
+    ("word_count_gt_5", "WordCountGT5"),
+    ("word_count_gt_6", "WordCountGT6"),
+    ("word_count_gt_7", "WordCountGT7"),
+    ("word_count_gt_8", "WordCountGT8"),
+    ("avg_word_length", "AvgWordLength"),
+    ("std_word_length", "StdWordLength"),
+    ("vocabulary_size", "VocabularySize"),
+]:
+    register_extractor(_name, _LENGTH, _klass, "length", cost=2, requires=["tokens"])
+
+register_extractor("lemmas_count", _LENGTH, "Lemmas", "length", cost=3, requires=["vocabulary"])
+
+for _name, _klass in [
+    ("sentence_count", "SentenceCount"),
+    ("avg_sentence_length", "AvgSentenceLength"),
+    ("std_sentence_length", "StdSentenceLength"),
+]:
+    register_extractor(_name, _LENGTH, _klass, "length", cost=10, requires=["sentences"])
+
+_SYNTACTIC = "aes.features.extraction.syntactic"
+
+# Features reading only part-of-speech tags need the small pipeline, those reading the
+# dependency parse the medium one.
+for _name, _klass, _quality in [
+    ("noun_count", "NounCount", "sm"),
+    ("verb_count", "VerbCount", "sm"),
+    ("adjective_count", "AdjectiveCount", "sm"),
+    ("adverb_count", "AdverbCount", "sm"),
+    ("conjunction_count", "ConjunctionCount", "sm"),
+    ("type_token_ratio", "TypeTokenRatio", "sm"),
+    ("existential_there_count", "ExistentialThere", "sm"),
+    ("superlative_count", "Superlatives", "sm"),
+    ("verb_compliment_counts", "VerbComplements", "md"),
+    ("noun_complement_counts", "NounComplements", "md"),
+    ("adjective_complement_counts", "AdjectiveComplements", "md"),
+    ("that_relative_clause_count", "ThatRelativeClauses", "md"),
+    ("wh_relative_clause_count", "WhRelativeClauses", "md"),
+    ("pre_quallifier_count", "PreQualifiers", "md"),
+    ("pre_quantifier_count", "PreQuantifiers", "sm"),
+    ("post_determiner_count", "PostDeterminers", "sm"),
+    ("demonstrative_determiner_count", "DemonstrativeDeterminers", "md"),
+    ("singular_article_count", "SingularArticles", "md"),
+    ("definite_article_count", "DefiniteArticles", "sm"),
+    ("indefinite_article_count", "IndefiniteArticles", "sm"),
+    ("singular_determiner_count", "SingularDeterminers", "md"),
+    ("plural_determiner_count", "PluralDeterminers", "md"),
+    ("double_conjunction_count", "DoubleConjunctions", "md"),
+    ("attributive_adjective_count", "AttributiveAdjectives", "md"),
+    ("post_noun_modifying_prepositional_phrase", "PostNounPrepositionalPhrases", "md"),
+]:
+    register_extractor(
+        _name, _SYNTACTIC, _klass, "syntactic", cost=50, requires=["syntax"], quality=_quality
+    )
+
+_READABILITY = "aes.features.extraction.readability"
+
+for _name, _klass in [
+    ("automated_readibility_index", "AutomatedReadabilityIndex"),
+    ("Coleman-Liau index", "ColemanLiauIndex"),
+    ("Dale-Chall readability score", "DaleChallScore"),
+    ("Difficult word count", "DifficultWords"),
+    ("Flesch reading ease", "FleschReadingEase"),
+    ("Flesch-Kincaid grade", "FleschKincaidGrade"),
+    ("Gunning fog", "GunningFog"),
+    ("Linsear write formula", "LinsearWrite"),
+    ("Smog index", "SmogIndex"),
+    ("Syllables count", "Syllables"),
+]:
+    register_extractor(_name, _READABILITY, _klass, "readability", cost=5, requires=["readability"])
+
+_WORD = "aes.features.extraction.word"
+
+for _name, _klass in [
+    ("spelling_error_count", "SpellingErrors"),
+    ("spelling_error_ratio", "SpellingErrorRatio"),
+]:
+    register_extractor(_name, _WORD, _klass, "word", cost=5, requires=["spelling"])
+
+for _name, _klass in [
+    ("bigram_count", "Bigrams"),
+    ("trigram_count", "Trigrams"),
+    ("stemmed_bigram_count", "StemmedBigrams"),
+    ("stemmed_trigram_count", "StemmedTrigrams"),
+]:
+    register_extractor(_name, _WORD, _klass, "word", cost=5, requires=["ngrams"])
+
+_SEMANTIC = "aes.features.extraction.semantic"
+
+for _name, _klass in [
+    ("similarity", "Similarity"),
+    ("histogram_based", "HistogramBased"),
+]:
+    register_extractor(_name, _SEMANTIC, _klass, "semantic", cost=20, requires=["exemplars"])
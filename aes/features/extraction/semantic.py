@@ -11,8 +11,556 @@
 # URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Wednesday August 10th 2022 06:28:27 pm                                              #
-# Modified   : Wednesday August 10th 2022 06:28:31 pm                                              #
+# Modified   : Saturday October 17th 2026 01:14:00 am                                              #
 # ------------------------------------------------------------------------------------------------ #
 # License    : BSD 3-clause "New" or "Revised" License                                             #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
+"""Exemplar similarity features backed by a local inverted file (IVF) nearest neighbour index."""
+import os
+import hashlib
+import numpy as np
+import pandas as pd
+from scipy import sparse
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig, DataConfig, resolve_path
+from aes.utils.io import YamlIO
+from aes.features.extraction.base import FeatureExtractor
+from aes.features.extraction.columnar import TextColumn, hash_strings, mix_hashes, to_numpy
+from aes.features.extraction.context import ExtractionContext
+from aes.features.extraction.ngrams import NgramEngine
+from aes.features.extraction.vocabulary import InternedTokens
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+# Effectiveness labels of the exemplars searched by the semantic features.
+EFFECTIVE = "Effective"
+INEFFECTIVE = "Ineffective"
+_ARRAYS = ["centroids", "vectors", "keys", "offsets"]
+# Rows of queries multiplied against an inverted list at a time, bounding temporary memory.
+_CHUNK_SIZE = 4096
+# ------------------------------------------------------------------------------------------------ #
+#                                        TEXT EMBEDDER                                             #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class TextEmbedder:
+    """Embeds discourses as dense unit vectors of hashed word unigrams and bigrams.
+
+    Unigram and bigram counts are taken from the NgramEngine, damped with log(1 + count), and
+    projected to a few hundred dimensions with a sparse random sign projection. Each n-gram
+    column is sent to n_hashes dimensions chosen by hashing the column, so the projection is
+    never materialized and the embedding of a discourse does not depend on the corpus. Inner
+    products of the unit vectors approximate the cosine similarity of the n-gram profiles.
+
+    Args:
+        dimension (int): Length of the embeddings.
+        n_hashes (int): Nonzero entries per n-gram in the projection.
+        seed (int): Seed of the projection.
+    """
+
+    def __init__(self, dimension: int = 256, n_hashes: int = 4, seed: int = 0) -> None:
+        self._dimension = dimension
+        self._n_hashes = n_hashes
+        self._seed = seed
+        self._engine = NgramEngine(orders=(1, 2))
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def embed(self, tokens: InternedTokens) -> np.ndarray:
+        """Returns a float32 matrix with one unit row per discourse. Empty discourses are zero."""
+        counts = self._engine.count(tokens)
+        matrix = (counts[(1, False)].matrix + counts[(2, False)].matrix).astype(np.float32)
+        matrix.data = np.log1p(matrix.data)
+
+        columns, indices = np.unique(matrix.indices, return_inverse=True)
+        matrix = sparse.csr_matrix(
+            (matrix.data, indices.ravel(), matrix.indptr), shape=(matrix.shape[0], len(columns))
+        )
+        vectors = np.asarray((matrix @ self._projection(columns)).todense(), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+    def _projection(self, columns: np.ndarray) -> sparse.csr_matrix:
+        rows = np.repeat(np.arange(len(columns)), self._n_hashes)
+        keys = columns.astype(np.uint64).repeat(self._n_hashes) * np.uint64(self._n_hashes)
+        offsets = np.tile(np.arange(self._n_hashes, dtype=np.uint64), len(columns))
+        keys = mix_hashes(keys + offsets)
+        keys = mix_hashes(keys ^ np.uint64(self._seed))
+        dimensions = (keys % np.uint64(self._dimension)).astype(np.int64)
+        signs = np.where((keys >> np.uint64(32)) & np.uint64(1), 1.0, -1.0).astype(np.float32)
+        return sparse.csr_matrix(
+            (signs / np.sqrt(self._n_hashes), (rows, dimensions)),
+            shape=(len(columns), self._dimension),
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          IVF INDEX                                               #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class IVFIndex:
+    """Inverted file index for approximate maximum inner product search over unit vectors.
+
+    The vectors are clustered with spherical k-means. Each vector is stored in the inverted
+    list of its nearest centroid, and a query is compared only with the vectors in the
+    n_probe lists whose centroids are nearest to it. Each list is scored for every query
+    probing it with one matrix product. The index is a directory of NumPy arrays opened with
+    memory mapping:
+
+    - centroids: unit centroid of each list.
+    - vectors, keys: the vectors sorted by list, and a key identifying each, e.g. a text hash.
+    - offsets: start of each list in vectors, plus the total.
+
+    Args:
+        directory (str): Directory containing the index.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self._directory = directory
+        self._arrays = {
+            name: np.load(os.path.join(directory, name + ".npy"), mmap_mode="r")
+            for name in _ARRAYS
+        }
+
+    def __len__(self) -> int:
+        return len(self._arrays["keys"])
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def n_lists(self) -> int:
+        return len(self._arrays["centroids"])
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self._arrays["vectors"]
+
+    @property
+    def keys(self) -> np.ndarray:
+        return self._arrays["keys"]
+
+    @classmethod
+    def build(
+        cls,
+        vectors: np.ndarray,
+        keys: np.ndarray,
+        directory: str,
+        n_lists: int = None,
+        n_iter: int = 10,
+        seed: int = 0,
+    ) -> "IVFIndex":
+        """Clusters the vectors and writes the index to the directory.
+
+        Args:
+            vectors (np.ndarray): Unit vectors, one per row.
+            keys (np.ndarray): A uint64 key per vector, returned by search.
+            directory (str): Output directory.
+            n_lists (int): Number of inverted lists. Defaults to the square root of the number
+                of vectors.
+            n_iter (int): Number of k-means iterations.
+            seed (int): Seed of the initial centroids.
+        """
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        n = len(vectors)
+        n_lists = max(1, min(n_lists or int(round(np.sqrt(n))), n))
+        rng = np.random.default_rng(seed)
+        centroids = vectors[rng.choice(n, size=n_lists, replace=False)].copy()
+        for _ in range(n_iter):
+            assignment = cls._assign(vectors, centroids)
+            members = sparse.csr_matrix(
+                (np.ones(n, dtype=np.float32), (assignment, np.arange(n))), shape=(n_lists, n)
+            )
+            sums = np.asarray(members @ vectors)
+            norms = np.linalg.norm(sums, axis=1)
+            occupied = norms > 0
+            centroids[occupied] = sums[occupied] / norms[occupied, None]
+
+        assignment = cls._assign(vectors, centroids)
+        order = np.argsort(assignment, kind="stable")
+        arrays = {
+            "centroids": centroids,
+            "vectors": vectors[order],
+            "keys": np.asarray(keys, dtype=np.uint64)[order],
+            "offsets": np.concatenate(([0], np.cumsum(np.bincount(assignment, minlength=n_lists)))),
+        }
+        os.makedirs(directory, exist_ok=True)
+        for name, array in arrays.items():
+            np.save(os.path.join(directory, name + ".npy"), array)
+        logger.debug("Built IVF index of {} vectors in {} lists.".format(n, n_lists))
+        return cls(directory)
+
+    def search(
+        self, queries: np.ndarray, k: int = 10, n_probe: int = 8, exclude: np.ndarray = None
+    ) -> tuple:
+        """Finds the approximate k nearest vectors to each query by inner product.
+
+        Args:
+            queries (np.ndarray): Unit query vectors, one per row.
+            k (int): Number of neighbours.
+            n_probe (int): Number of inverted lists searched per query.
+            exclude (np.ndarray): Optional key per query. Vectors with the query's key are
+                skipped, so that a discourse is not its own neighbour.
+
+        Returns:
+            Tuple of (similarities, positions), each of shape (len(queries), k), sorted by
+            decreasing similarity. Missing neighbours have similarity NaN and position -1.
+        """
+        queries = np.ascontiguousarray(queries, dtype=np.float32)
+        n = len(queries)
+        similarities = np.full((n, k), -np.inf, dtype=np.float32)
+        positions = np.full((n, k), -1, dtype=np.int64)
+        if n == 0 or len(self) == 0:
+            return np.full((n, k), np.nan, dtype=np.float32), positions
+
+        n_probe = min(n_probe, self.n_lists)
+        scores = queries @ self._arrays["centroids"].T
+        probes = np.argpartition(-scores, n_probe - 1, axis=1)[:, :n_probe]
+        probed = np.zeros(scores.shape, dtype=bool)
+        probed[np.arange(n)[:, None], probes] = True
+
+        offsets = self._arrays["offsets"]
+        for list_id in range(self.n_lists):
+            start, end = offsets[list_id], offsets[list_id + 1]
+            members = np.flatnonzero(probed[:, list_id])
+            if start == end or len(members) == 0:
+                continue
+            vectors = np.asarray(self._arrays["vectors"][start:end])
+            keys = np.asarray(self._arrays["keys"][start:end])
+            for chunk in range(0, len(members), _CHUNK_SIZE):
+                rows = members[chunk : chunk + _CHUNK_SIZE]
+                scores = queries[rows] @ vectors.T
+                if exclude is not None:
+                    scores[exclude[rows][:, None] == keys[None, :]] = -np.inf
+                candidates = np.broadcast_to(np.arange(start, end), scores.shape)
+                scores = np.concatenate([similarities[rows], scores], axis=1)
+                candidates = np.concatenate([positions[rows], candidates], axis=1)
+                if scores.shape[1] > k:
+                    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                    scores = np.take_along_axis(scores, top, axis=1)
+                    candidates = np.take_along_axis(candidates, top, axis=1)
+                similarities[rows], positions[rows] = scores, candidates
+
+        order = np.argsort(-similarities, axis=1, kind="stable")
+        similarities = np.take_along_axis(similarities, order, axis=1)
+        positions = np.take_along_axis(positions, order, axis=1)
+        missing = ~np.isfinite(similarities)
+        similarities[missing], positions[missing] = np.nan, -1
+        return similarities, positions
+
+    @staticmethod
+    def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Returns the nearest centroid of each vector."""
+        return np.concatenate(
+            [
+                np.argmax(vectors[i : i + 65536] @ centroids.T, axis=1)
+                for i in range(0, len(vectors), 65536)
+            ]
+            or [np.empty(0, dtype=np.int64)]
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     EXEMPLAR NEIGHBOURS                                          #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ExemplarNeighbours:
+    """Similarities of each discourse to its nearest effective and ineffective exemplars.
+
+    Args:
+        effective (np.ndarray): Similarities to the k nearest Effective exemplars of the same
+            discourse type, shape (n, k), NaN where there are fewer than k.
+        ineffective (np.ndarray): Likewise for the Ineffective exemplars.
+    """
+
+    def __init__(self, effective: np.ndarray, ineffective: np.ndarray) -> None:
+        self._effective = effective
+        self._ineffective = ineffective
+
+    def __len__(self) -> int:
+        return len(self._effective)
+
+    @property
+    def effective(self) -> np.ndarray:
+        return self._effective
+
+    @property
+    def ineffective(self) -> np.ndarray:
+        return self._ineffective
+
+    @property
+    def similarity(self) -> np.ndarray:
+        """Mean similarity to the effective exemplars less that to the ineffective exemplars."""
+        return _nanmean(self._effective) - _nanmean(self._ineffective)
+
+    @property
+    def effective_share(self) -> np.ndarray:
+        """Share of Effective exemplars among the k nearest exemplars of either label."""
+        k = self._effective.shape[1]
+        similarities = np.concatenate([self._effective, self._ineffective], axis=1)
+        similarities = np.where(np.isnan(similarities), -np.inf, similarities)
+        nearest = np.argsort(-similarities, axis=1, kind="stable")[:, :k]
+        found = np.isfinite(np.take_along_axis(similarities, nearest, axis=1))
+        effective = (nearest < k) & found
+        counts = found.sum(axis=1)
+        return np.divide(
+            effective.sum(axis=1), counts, out=np.full(len(counts), np.nan), where=counts > 0
+        )
+
+
+def _nanmean(values: np.ndarray) -> np.ndarray:
+    """Row means ignoring NaN. Rows without values are NaN."""
+    counts = np.sum(~np.isnan(values), axis=1)
+    totals = np.nansum(values, axis=1, dtype=np.float64)
+    return np.divide(totals, counts, out=np.full(len(counts), np.nan), where=counts > 0)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       EXEMPLAR INDEX                                             #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ExemplarIndex:
+    """IVF indexes of labelled exemplar embeddings, one per discourse type and label.
+
+    Only the Effective and Ineffective exemplars are indexed. Each discourse is compared with
+    exemplars of its own discourse type. The index.yml file maps each discourse type and label
+    to the directory of its IVFIndex, and records a fingerprint of the indexed exemplars.
+
+    Args:
+        directory (str): Directory containing the index.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self._directory = directory
+        filepath = os.path.join(directory, "index.yml")
+        if not os.path.exists(filepath):
+            msg = (
+                "No exemplar index found in {}. Build it from the labelled training data with "
+                "ExemplarIndex.from_data() before extracting semantic features.".format(directory)
+            )
+            logger.error(msg)
+            raise FileNotFoundError(msg)
+        index = YamlIO().read(filepath)
+        self._groups = index["groups"]
+        self._fingerprint = index.get("fingerprint")
+        self._indexes = {}
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def categories(self) -> list:
+        return list(self._groups.keys())
+
+    @property
+    def fingerprint(self) -> str:
+        """Digest of the indexed exemplars, which changes whenever the index is rebuilt from
+        different data. Computed from the stored arrays for indexes that do not record one."""
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for category in sorted(self._groups):
+                for label in sorted(self._groups[category]):
+                    index = self.index(category, label)
+                    _update(digest, category, label, index.vectors, index.keys)
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    @classmethod
+    def build(
+        cls,
+        embeddings: np.ndarray,
+        categories: TextColumn,
+        labels: TextColumn,
+        keys: np.ndarray,
+        directory: str,
+        **kwargs,
+    ) -> "ExemplarIndex":
+        """Builds an IVFIndex for each discourse type and label.
+
+        Args:
+            embeddings (np.ndarray): Unit embedding of each exemplar.
+            categories (TextColumn): Discourse type of each exemplar.
+            labels (TextColumn): Effectiveness label of each exemplar.
+            keys (np.ndarray): A uint64 key per exemplar, e.g. the hash of its text.
+            directory (str): Output directory.
+            **kwargs: Passed to IVFIndex.build.
+        """
+        categories, labels = to_numpy(categories), to_numpy(labels)
+        groups = {}
+        digest = hashlib.blake2b(digest_size=16)
+        for category in sorted(set(categories)):
+            for label in (EFFECTIVE, INEFFECTIVE):
+                rows = np.flatnonzero((categories == category) & (labels == label))
+                if len(rows) == 0:
+                    continue
+                subdirectory = "{}/{}".format(category, label).replace(" ", "_").lower()
+                index = IVFIndex.build(
+                    embeddings[rows], keys[rows], os.path.join(directory, subdirectory), **kwargs
+                )
+                _update(digest, category, label, index.vectors, index.keys)
+                groups.setdefault(category, {})[label] = subdirectory
+        YamlIO().write(
+            {"groups": groups, "fingerprint": digest.hexdigest()},
+            os.path.join(directory, "index.yml"),
+        )
+        logger.info("Built exemplar index of {} groups in {}.".format(len(groups), directory))
+        return cls(directory)
+
+    @classmethod
+    def from_data(
+        cls,
+        data: pd.DataFrame,
+        directory: str,
+        text_col: str = "discourse_text",
+        category_col: str = "discourse_type",
+        target_col: str = "discourse_effectiveness",
+        **kwargs,
+    ) -> "ExemplarIndex":
+        """Embeds the labelled discourses in a DataFrame and builds the index from them."""
+        context = ExtractionContext(data[text_col])
+        keys = hash_strings(to_numpy(data[text_col]).tolist())
+        embeddings = context.get("embeddings")
+        return cls.build(
+            embeddings, data[category_col], data[target_col], keys, directory, **kwargs
+        )
+
+    def index(self, category: str, label: str) -> IVFIndex:
+        """Returns the IVFIndex of a discourse type and label, or None if there is none."""
+        subdirectory = self._groups.get(category, {}).get(label)
+        if subdirectory is None:
+            return None
+        if subdirectory not in self._indexes:
+            self._indexes[subdirectory] = IVFIndex(os.path.join(self._directory, subdirectory))
+        return self._indexes[subdirectory]
+
+    def neighbours(
+        self,
+        embeddings: np.ndarray,
+        categories: TextColumn,
+        keys: np.ndarray = None,
+        k: int = 10,
+        n_probe: int = 8,
+    ) -> ExemplarNeighbours:
+        """Searches the exemplars of each discourse's type for its nearest neighbours.
+
+        Args:
+            embeddings (np.ndarray): Unit embedding of each discourse.
+            categories (TextColumn): Discourse type of each discourse.
+            keys (np.ndarray): Optional key of each discourse. Exemplars with the same key are
+                skipped, so that a discourse in the exemplar set is not compared with itself.
+            k (int): Number of neighbours of each label.
+            n_probe (int): Number of inverted lists searched per query.
+        """
+        categories = to_numpy(categories)
+        results = {}
+        for label in (EFFECTIVE, INEFFECTIVE):
+            similarities = np.full((len(embeddings), k), np.nan, dtype=np.float32)
+            for category in set(categories):
+                index = self.index(category, label)
+                if index is None:
+                    continue
+                rows = np.flatnonzero(categories == category)
+                exclude = None if keys is None else keys[rows]
+                similarities[rows] = index.search(embeddings[rows], k, n_probe, exclude)[0]
+            results[label] = similarities
+        return ExemplarNeighbours(results[EFFECTIVE], results[INEFFECTIVE])
+
+
+def _update(digest, category: str, label: str, vectors: np.ndarray, keys: np.ndarray) -> None:
+    """Adds an IVFIndex of a discourse type and label to the digest of an ExemplarIndex."""
+    digest.update("{}\x1f{}\x1f{}\x1f".format(category, label, len(keys)).encode("utf-8"))
+    digest.update(np.ascontiguousarray(keys, dtype=np.uint64).tobytes())
+    digest.update(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+def exemplar_fingerprint() -> str:
+    """Returns the fingerprint of the configured exemplar index."""
+    config = DataConfig().config.get("semantic", {})
+    return ExemplarIndex(resolve_path(config.get("index"))).fingerprint
+
+
+def build_embeddings(context) -> np.ndarray:
+    """Builds the 'embeddings' intermediate from the interned tokens."""
+    return TextEmbedder().embed(context.get("vocabulary"))
+
+
+def build_exemplars(context) -> ExemplarNeighbours:
+    """Builds the 'exemplars' intermediate by searching the configured exemplar index.
+
+    The index path in the data configuration is relative to the project root.
+    """
+    if context.categories is None:
+        msg = "Semantic features require the discourse type of each text."
+        logger.error(msg)
+        raise ValueError(msg)
+    config = DataConfig().config.get("semantic", {})
+    texts = to_numpy(context.texts).tolist()
+    return ExemplarIndex(resolve_path(config.get("index"))).neighbours(
+        context.get("embeddings"),
+        context.categories,
+        keys=hash_strings(texts),
+        k=config.get("k", 10),
+        n_probe=config.get("n_probe", 8),
+    )
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       SEMANTIC FEATURE                                           #
+# ------------------------------------------------------------------------------------------------ #
+class SemanticFeature(FeatureExtractor):
+    """Base class for semantic features, all read from the shared 'exemplars' intermediate."""
+
+    def __init__(self) -> None:
+        super(SemanticFeature, self).__init__()
+        self._category = "semantic"
+
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
+
+        Args:
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
+        """
+        return getattr(self._get_context(texts, context).get("exemplars"), self._attribute)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          SIMILARITY                                              #
+# ------------------------------------------------------------------------------------------------ #
+class Similarity(SemanticFeature):
+    """Mean similarity to the nearest Effective exemplars less that to the Ineffective ones."""
+
+    def __init__(self) -> None:
+        super(Similarity, self).__init__()
+        self._name = "similarity"
+        self._attribute = "similarity"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       HISTOGRAM BASED                                            #
+# ------------------------------------------------------------------------------------------------ #
+class HistogramBased(SemanticFeature):
+    """Share of Effective exemplars in the label histogram of the nearest exemplars."""
+
+    def __init__(self) -> None:
+        super(HistogramBased, self).__init__()
+        self._name = "histogram_based"
+        self._attribute = "effective_share"
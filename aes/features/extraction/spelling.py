@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /spelling.py                                                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:17:05 am                                              #
+# Modified   : Saturday October 17th 2026 01:11:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Memory-mapped symmetric-delete spelling index and per-discourse spelling statistics."""
+import os
+from itertools import combinations
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig, DataConfig, resolve_path
+from aes.utils.io import YamlIO
+from aes.features.extraction.columnar import hash_strings
+from aes.features.extraction.ragged import RaggedArray
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+_ARRAYS = [
+    "word_keys",
+    "word_ids",
+    "delete_keys",
+    "delete_ids",
+    "posting_offsets",
+    "postings",
+    "text",
+    "text_offsets",
+]
+# ------------------------------------------------------------------------------------------------ #
+
+
+def normalize(words: pa.Array) -> pa.Array:
+    """Lowercases words and strips every character that is not a letter."""
+    return pc.replace_substring_regex(pc.utf8_lower(words), pattern="[^a-z]", replacement="")
+
+
+def deletes(words: list, distance: int) -> tuple:
+    """Returns every string obtained by deleting up to distance characters from each word.
+
+    Words of equal length are stacked into a byte matrix, so the loop runs over the sets of
+    deleted positions of each length rather than over the words. Words must be ASCII, as
+    returned by normalize.
+
+    Args:
+        words (list): Normalized words.
+        distance (int): Largest number of characters deleted.
+
+    Returns:
+        Tuple of the 64 bit hash of each delete and the position of the word it came from.
+        Each delete appears once per word.
+    """
+    lengths = np.fromiter((len(word) for word in words), dtype=np.int64, count=len(words))
+    keys, owners = [], []
+    for length in np.unique(lengths):
+        rows = np.flatnonzero(lengths == length)
+        text = "".join(words[i] for i in rows).encode()
+        matrix = np.frombuffer(text, dtype=np.uint8).reshape(len(rows), length)
+        for n in range(min(distance, length) + 1):
+            for positions in combinations(range(length), n):
+                kept = np.ascontiguousarray(np.delete(matrix, positions, axis=1))
+                variants = kept.view("S{}".format(length - n)).ravel() if length > n else None
+                strings = [b"" for _ in rows] if variants is None else variants.tolist()
+                keys.append(hash_strings([variant.decode() for variant in strings]))
+                owners.append(rows)
+    if not keys:
+        return np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int64)
+    keys, owners = np.concatenate(keys), np.concatenate(owners)
+    order = np.lexsort((keys, owners))
+    keys, owners = keys[order], owners[order]
+    unique = np.ones(len(keys), dtype=bool)
+    unique[1:] = (keys[1:] != keys[:-1]) | (owners[1:] != owners[:-1])
+    return keys[unique], owners[unique]
+
+
+def edit_distance(a: str, b: str, bound: int = None) -> int:
+    """Optimal string alignment distance: insertions, deletions, substitutions, transpositions.
+
+    Args:
+        a (str): First string.
+        b (str): Second string.
+        bound (int): If given, stops as soon as the distance must exceed bound and returns
+            bound + 1.
+    """
+    if bound is not None and abs(len(a) - len(b)) > bound:
+        return bound + 1
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if bound is not None and min(current) > bound:
+            return bound + 1
+        previous2, previous = previous, current
+    return previous[len(b)]
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    OPEN ADDRESSING TABLE                                         #
+# ------------------------------------------------------------------------------------------------ #
+
+
+def _build_table(keys: np.ndarray) -> tuple:
+    """Inserts unique nonzero keys into a linear probing table at a load factor of at most 0.5.
+
+    Keys are inserted in vectorized rounds. In round r every pending key tries the slot r
+    places past its home slot, so each key ends at the position a probing lookup reaches.
+
+    Returns:
+        Tuple of the table of keys, zero where empty, and the position of each slot's key in keys.
+    """
+    capacity = 1 << max(int(2 * len(keys) - 1).bit_length(), 4)
+    mask = np.uint64(capacity - 1)
+    table = np.zeros(capacity, dtype=np.uint64)
+    positions = np.full(capacity, -1, dtype=np.int64)
+    pending = np.arange(len(keys), dtype=np.int64)
+    probe = np.uint64(0)
+    while len(pending):
+        slots = ((keys[pending] + probe) & mask).astype(np.int64)
+        free = table[slots] == 0
+        slots, claimants = slots[free], pending[free]
+        slots, first = np.unique(slots, return_index=True)
+        winners = claimants[first]
+        table[slots] = keys[winners]
+        positions[slots] = winners
+        pending = np.setdiff1d(pending, winners, assume_unique=True)
+        probe += np.uint64(1)
+    return table, positions
+
+
+def _find(table: np.ndarray, values: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """Looks up keys in a linear probing table, vectorized over the keys.
+
+    Returns:
+        The value stored with each key, or -1 for keys not in the table.
+    """
+    mask = np.uint64(len(table) - 1)
+    result = np.full(len(keys), -1, dtype=np.int64)
+    pending = np.arange(len(keys), dtype=np.int64)
+    probe = np.uint64(0)
+    while len(pending):
+        slots = ((keys[pending] + probe) & mask).astype(np.int64)
+        stored = table[slots]
+        found = stored == keys[pending]
+        result[pending[found]] = values[slots[found]]
+        pending = pending[~found & (stored != 0)]
+        probe += np.uint64(1)
+    return result
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      SPELLING INDEX                                              #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class SpellingIndex:
+    """Dictionary of correctly spelled words with O(1) membership and bounded edit lookups.
+
+    The index is a directory of NumPy arrays opened with memory mapping, so it is loaded
+    lazily and shared by every process reading it.
+
+    - word_keys, word_ids: linear probing table from a word's hash to its id.
+    - delete_keys, delete_ids: linear probing table from the hash of each string obtained by
+      deleting up to max_edit_distance characters from a word, to its postings.
+    - posting_offsets, postings: ids of the words that produce each delete.
+    - text, text_offsets: UTF-8 bytes of every word, used to verify candidates.
+
+    A word is looked up with the symmetric-delete method. The deletes of the word are
+    hashed and found in the delete table, and only the words sharing a delete are compared
+    with the word by edit distance.
+
+    Args:
+        directory (str): Directory containing the index.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self._directory = directory
+        self._max_edit_distance = YamlIO().read(os.path.join(directory, "index.yml"))[
+            "max_edit_distance"
+        ]
+        self._arrays = {
+            name: np.load(os.path.join(directory, name + ".npy"), mmap_mode="r")
+            for name in _ARRAYS
+        }
+
+    def __len__(self) -> int:
+        return len(self._arrays["text_offsets"]) - 1
+
+    def __contains__(self, word: str) -> bool:
+        return bool(self.contains([word])[0])
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def max_edit_distance(self) -> int:
+        return self._max_edit_distance
+
+    @classmethod
+    def build(cls, words: list, directory: str, max_edit_distance: int = 2) -> "SpellingIndex":
+        """Builds an index from a list of words and writes it to the directory.
+
+        Args:
+            words (list): Correctly spelled words. They are normalized with normalize.
+            directory (str): Output directory.
+            max_edit_distance (int): Largest edit distance supported by lookup.
+        """
+        words = normalize(pa.array(list(words), type=pa.string()))
+        words = sorted({word for word in words.to_pylist() if word})
+        encoded = [word.encode() for word in words]
+        lengths = np.array([len(word) for word in encoded], dtype=np.int64)
+        arrays = {
+            "text": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+            "text_offsets": np.concatenate(([0], np.cumsum(lengths))),
+        }
+        word_keys = hash_strings(words)
+        arrays["word_keys"], arrays["word_ids"] = _build_table(word_keys)
+
+        delete_keys, owners = deletes(words, max_edit_distance)
+        unique, inverse = np.unique(delete_keys, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        arrays["postings"] = np.asarray(owners, dtype=np.int32)[order]
+        arrays["posting_offsets"] = np.concatenate(
+            ([0], np.cumsum(np.bincount(inverse, minlength=len(unique))))
+        )
+        arrays["delete_keys"], arrays["delete_ids"] = _build_table(unique)
+
+        os.makedirs(directory, exist_ok=True)
+        for name, array in arrays.items():
+            np.save(os.path.join(directory, name + ".npy"), array)
+        YamlIO().write(
+            {"max_edit_distance": max_edit_distance, "words": len(words)},
+            os.path.join(directory, "index.yml"),
+        )
+        logger.info("Built spelling index of {} words in {}.".format(len(words), directory))
+        return cls(directory)
+
+    def word(self, i: int) -> str:
+        """Returns the word with the given id."""
+        offsets = self._arrays["text_offsets"]
+        return bytes(self._arrays["text"][offsets[i] : offsets[i + 1]]).decode()
+
+    def contains(self, words: list) -> np.ndarray:
+        """Returns whether each normalized word is in the dictionary."""
+        return self._ids(words) >= 0
+
+    def _ids(self, words: list) -> np.ndarray:
+        """Returns the id of each word, or -1 if absent.
+
+        The hash table only narrows a word to one candidate, which is compared with the word
+        byte by byte, so a hash collision cannot make an unknown word a member.
+        """
+        ids = _find(self._arrays["word_keys"], self._arrays["word_ids"], hash_strings(words))
+        found = np.flatnonzero(ids >= 0)
+        if not len(found):
+            return ids
+        text, offsets = self._arrays["text"], self._arrays["text_offsets"]
+        encoded = [words[i].encode() for i in found]
+        lengths = np.array([len(word) for word in encoded], dtype=np.int64)
+        matched = lengths == np.diff(offsets)[ids[found]]
+        query = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        segment = np.repeat(np.arange(len(found)), lengths)
+        starts = np.repeat(offsets[ids[found]] - np.cumsum(lengths) + lengths, lengths)
+        positions = np.minimum(starts + np.arange(len(query)), len(text) - 1)
+        differs = np.bincount(segment, weights=text[positions] != query, minlength=len(found))
+        ids[found[~matched | (differs > 0)]] = -1
+        return ids
+
+    def lookup(self, words: list, max_edit_distance: int = None) -> np.ndarray:
+        """Returns the edit distance from each word to the nearest dictionary word.
+
+        Args:
+            words (list): Normalized words.
+            max_edit_distance (int): Largest distance searched. Defaults to the index maximum.
+
+        Returns:
+            Array of distances, 0 for dictionary words and -1 where no dictionary word is
+            within max_edit_distance.
+        """
+        distance = self._max_edit_distance if max_edit_distance is None else max_edit_distance
+        distance = min(distance, self._max_edit_distance)
+        result = np.where(self.contains(words), 0, -1)
+        offsets, postings = self._arrays["posting_offsets"], self._arrays["postings"]
+        lengths = np.diff(self._arrays["text_offsets"])
+        unknown = np.flatnonzero(result < 0)
+        keys, owners = deletes([words[i] for i in unknown], distance)
+        found = _find(self._arrays["delete_keys"], self._arrays["delete_ids"], keys)
+        hit = found >= 0
+        found, owners = found[hit], owners[hit]
+        groups = np.searchsorted(owners, np.arange(len(unknown) + 1))
+        for k, i in enumerate(unknown):
+            word, shared = words[i], found[groups[k] : groups[k + 1]]
+            if not len(shared):
+                continue
+            candidates = np.unique(
+                np.concatenate([postings[offsets[j] : offsets[j + 1]] for j in shared])
+            )
+            # Words whose length differs by more than the distance cannot be within it.
+            difference = np.abs(lengths[candidates] - len(word))
+            near = difference <= distance
+            candidates = candidates[near][np.argsort(difference[near], kind="stable")]
+            best = distance + 1
+            for candidate in candidates:
+                best = min(best, edit_distance(word, self.word(candidate), bound=best - 1))
+                if best == 1:
+                    break
+            result[i] = best if best <= distance else -1
+        return result
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      SPELLING COUNTS                                             #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class SpellingCounts:
+    """Words checked and spelling errors found in each discourse.
+
+    Args:
+        words (np.ndarray): Number of alphabetic words in each discourse.
+        errors (np.ndarray): Number of misspelled words in each discourse.
+    """
+
+    def __init__(self, words: np.ndarray, errors: np.ndarray) -> None:
+        self._words = words
+        self._errors = errors
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    @property
+    def words(self) -> np.ndarray:
+        return self._words
+
+    @property
+    def errors(self) -> np.ndarray:
+        return self._errors
+
+    @property
+    def ratio(self) -> np.ndarray:
+        return np.divide(
+            self._errors,
+            self._words,
+            out=np.zeros(len(self._words), dtype=np.float64),
+            where=self._words > 0,
+        )
+
+
+class SpellingChecker:
+    """Counts spelling errors in the shared tokenization, checking each unique word once.
+
+    A word is a spelling error when it is not in the dictionary but a dictionary word is
+    within max_edit_distance of it. Words with no dictionary word nearby, such as names and
+    foreign words, are not counted.
+
+    Args:
+        index (SpellingIndex): The dictionary index. Defaults to the configured index, which
+            is built from the configured word list on first use.
+    """
+
+    def __init__(self, index: SpellingIndex = None) -> None:
+        self._index = index if index is not None else self._load_index()
+
+    @property
+    def index(self) -> SpellingIndex:
+        return self._index
+
+    def check(self, words: pa.Array, word_offsets: np.ndarray) -> SpellingCounts:
+        """Counts words and spelling errors per discourse.
+
+        Args:
+            words (pa.Array): Flat array of word tokens in corpus order.
+            word_offsets (np.ndarray): Offsets of the first word of each discourse, plus the total.
+        """
+        encoded = pc.dictionary_encode(normalize(words))
+        vocabulary = encoded.dictionary.to_pylist()
+        indices = encoded.indices.to_numpy(zero_copy_only=False)
+
+        is_word = np.array([len(word) > 0 for word in vocabulary], dtype=bool)
+        distances = np.full(len(vocabulary), -1, dtype=np.int64)
+        candidates = np.flatnonzero(is_word)
+        distances[candidates] = self._index.lookup([vocabulary[i] for i in candidates])
+        is_error = distances > 0
+        return SpellingCounts(
+            words=RaggedArray(is_word[indices], word_offsets).sum().astype(np.int64),
+            errors=RaggedArray(is_error[indices], word_offsets).sum().astype(np.int64),
+        )
+
+    def _load_index(self) -> SpellingIndex:
+        """Opens the configured index, building it from the dictionary on first use. Both
+        paths in the data configuration are relative to the project root."""
+        config = DataConfig().config["spelling"]
+        directory = resolve_path(config["index"])
+        if not os.path.exists(os.path.join(directory, "index.yml")):
+            with open(resolve_path(config["dictionary"]), "r") as file:
+                words = [line.split()[0] for line in file if line.strip()]
+            return SpellingIndex.build(words, directory, config["max_edit_distance"])
+        return SpellingIndex(directory)
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+def build_spelling(context) -> SpellingCounts:
+    """Builds the 'spelling' intermediate from the shared tokenization."""
+    tokens = context.get("tokens")
+    return SpellingChecker().check(tokens.words, tokens.word_offsets)
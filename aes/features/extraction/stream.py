@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /stream.py                                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 11:20:00 pm                                                #
+# Modified   : Saturday October 17th 2026 01:12:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Bounded-memory feature extraction streamed from one Parquet file to another."""
+import os
+from typing import Iterator, Union
+import pyarrow as pa
+import pyarrow.parquet as pq
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig
+from aes.utils.io import ParquetIO
+from aes.data.dataset import Dataset
+from aes.features.extraction.planner import ExtractionPlanner
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+class StreamingExtractor:
+    """Extracts features batch by batch from a Parquet file and appends them to an output file.
+
+    Only the identifier, text and, where the source has it, category columns are read, one
+    record batch at a time. Each batch of features is written to the output Parquet file as
+    soon as it is computed. Peak memory is therefore bounded by batch_size rather than by the
+    size of the corpus.
+
+    Args:
+        names (list): Canonical names of the features to extract.
+        batch_size (int): Maximum number of rows per record batch.
+        max_workers (int): Threads used by the ExtractionPlanner within each batch.
+        idvar (str): The identifier column carried into the output.
+        text_col (str): The column containing the discourse texts.
+        category_col (str): The column containing the discourse types, required by the
+            semantic features. Read only if the source has it.
+        compression (str): Parquet compression codec for the output file.
+    """
+
+    def __init__(
+        self,
+        names: list,
+        batch_size: int = 10000,
+        max_workers: int = 4,
+        idvar: str = "discourse_id",
+        text_col: str = "discourse_text",
+        category_col: str = "discourse_type",
+        compression: str = "snappy",
+    ) -> None:
+        self._names = list(names)
+        self._batch_size = batch_size
+        self._idvar = idvar
+        self._text_col = text_col
+        self._category_col = category_col
+        self._compression = compression
+        self._planner = ExtractionPlanner(names=self._names, max_workers=max_workers)
+
+    @property
+    def names(self) -> list:
+        return self._names
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    def extract(self, source: Union[str, Dataset], destination: str) -> int:
+        """Streams the source through the extraction plan into the destination file.
+
+        Args:
+            source (Union[str, Dataset]): Path to a Parquet file, or a Dataset backed by one.
+            destination (str): Path of the output Parquet file. It is overwritten, or removed
+                if the source has no rows.
+
+        Returns:
+            The number of rows written.
+        """
+        os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+        writer, rows = None, 0
+        try:
+            for batch in self._batches(source):
+                table = self._extract_batch(batch)
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        destination, table.schema, compression=self._compression
+                    )
+                writer.write_table(table.cast(writer.schema))
+                rows += table.num_rows
+                logger.debug("Wrote {} rows to {}.".format(rows, destination))
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is None:
+            logger.warning("No rows were read from {}. Nothing was written.".format(source))
+            # Features of an earlier run must not be mistaken for those of this source.
+            if os.path.exists(destination):
+                os.remove(destination)
+        return rows
+
+    def _batches(self, source: Union[str, Dataset]) -> Iterator[pa.RecordBatch]:
+        filepath = source.filepath if isinstance(source, Dataset) else source
+        columns = [self._idvar, self._text_col]
+        if self._category_col in pq.read_schema(filepath).names:
+            columns.append(self._category_col)
+        if isinstance(source, Dataset):
+            return source.iter_batches(batch_size=self._batch_size, columns=columns)
+        return ParquetIO().iter_batches(source, batch_size=self._batch_size, columns=columns)
+
+    def _extract_batch(self, batch: pa.RecordBatch) -> pa.Table:
+        """Runs the plan over one batch and returns the identifiers and features as a table."""
+        index = batch.schema.get_field_index
+        categories = (
+            batch.column(index(self._category_col))
+            if self._category_col in batch.schema.names
+            else None
+        )
+        results = self._planner.run(batch.column(index(self._text_col)), categories=categories)
+        arrays = [batch.column(index(self._idvar))]
+        arrays.extend(pa.array(results[name]) for name in self._names)
+        return pa.Table.from_arrays(arrays, names=[self._idvar] + self._names)
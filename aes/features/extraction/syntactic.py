@@ -11,9 +11,655 @@
 # URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Wednesday August 10th 2022 06:28:46 pm                                              #
-# Modified   : Thursday August 11th 2022 04:00:37 am                                               #
+# Modified   : Saturday October 17th 2026 12:37:23 am                                              #
 # ------------------------------------------------------------------------------------------------ #
 # License    : BSD 3-clause "New" or "Revised" License                                             #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
+"""Defines Syntactic Features computed from a single spaCy parse of each discourse."""
+import numpy as np
+import pandas as pd
+import logging
+import logging.config
 
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig, SpacyConfig
+from aes.data.docbin import DocCache, model_version
+from aes.data.essays import DiscourseSpans
+from aes.features.extraction.base import FeatureExtractor
+from aes.features.extraction.columnar import TextColumn, to_numpy
+from aes.features.extraction.context import ExtractionContext
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+# Token attributes exported from each Doc, in column order.
+ATTRIBUTES = ["POS", "TAG", "DEP", "HEAD", "LOWER"]
+# Pipeline components that do not contribute to the exported attributes.
+UNUSED_COMPONENTS = ["ner", "lemmatizer", "textcat", "entity_ruler", "entity_linker"]
+
+SYNTACTIC_FEATURES = [
+    "noun_count",
+    "verb_count",
+    "adjective_count",
+    "adverb_count",
+    "conjunction_count",
+    "type_token_ratio",
+    "existential_there_count",
+    "superlative_count",
+    "verb_compliment_counts",
+    "noun_complement_counts",
+    "adjective_complement_counts",
+    "that_relative_clause_count",
+    "wh_relative_clause_count",
+    "pre_quallifier_count",
+    "pre_quantifier_count",
+    "post_determiner_count",
+    "demonstrative_determiner_count",
+    "singular_article_count",
+    "definite_article_count",
+    "indefinite_article_count",
+    "singular_determiner_count",
+    "plural_determiner_count",
+    "double_conjunction_count",
+    "attributive_adjective_count",
+    "post_noun_modifying_prepositional_phrase",
+]
+
+ARTICLES = ["a", "an", "the"]
+DEMONSTRATIVES = ["this", "that", "these", "those"]
+POST_DETERMINERS = ["many", "few", "several", "other", "last", "next", "first", "same", "little"]
+WH_TAGS = ["WDT", "WP", "WP$", "WRB"]
+# ------------------------------------------------------------------------------------------------ #
+
+
+def _hash(values: list) -> np.ndarray:
+    """Returns the ids spaCy stores for tag, dependency label and lowercase strings.
+
+    Labels that are spaCy symbols, e.g. 'det', are stored as the symbol id, and all other
+    strings as their string store hash.
+    """
+    from spacy.strings import get_string_id
+
+    return np.array([get_string_id(value) for value in values], dtype=np.uint64)
+
+
+def _pos(values: list) -> np.ndarray:
+    """Returns the symbol ids of universal part of speech tags."""
+    from spacy.parts_of_speech import IDS
+
+    return np.array([IDS[value] for value in values], dtype=np.uint64)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          DOC ARRAY                                               #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class DocArray:
+    """Token attributes of a collection of Docs concatenated into a single array.
+
+    Args:
+        array (np.ndarray): Matrix with one row per token and one column per attribute in
+            ATTRIBUTES, as returned by Doc.to_array.
+        offsets (np.ndarray): Start of each Doc's tokens, followed by the total token count.
+    """
+
+    def __init__(self, array: np.ndarray, offsets: np.ndarray) -> None:
+        self._array = array
+        self._offsets = offsets
+
+    @classmethod
+    def from_docs(cls, docs: list) -> "DocArray":
+        """Exports each Doc once with Doc.to_array and concatenates the results."""
+        arrays = [doc.to_array(ATTRIBUTES).reshape(-1, len(ATTRIBUTES)) for doc in docs]
+        counts = np.array([len(array) for array in arrays], dtype=np.int64)
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        if arrays:
+            array = np.concatenate(arrays).astype(np.uint64, copy=False)
+        else:
+            array = np.empty((0, len(ATTRIBUTES)), dtype=np.uint64)
+        return cls(array, offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @property
+    def array(self) -> np.ndarray:
+        return self._array
+
+    @property
+    def offsets(self) -> np.ndarray:
+        return self._offsets
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.diff(self._offsets)
+
+    @property
+    def segment(self) -> np.ndarray:
+        """Position of the Doc each token belongs to."""
+        return np.repeat(np.arange(len(self), dtype=np.intp), self.counts)
+
+    @property
+    def pos(self) -> np.ndarray:
+        return self._array[:, 0]
+
+    @property
+    def tag(self) -> np.ndarray:
+        return self._array[:, 1]
+
+    @property
+    def dep(self) -> np.ndarray:
+        return self._array[:, 2]
+
+    @property
+    def head(self) -> np.ndarray:
+        """Position of each token's syntactic head in the concatenated array."""
+        relative = self._array[:, 3].view(np.int64)
+        return np.arange(len(relative), dtype=np.int64) + relative
+
+    @property
+    def lower(self) -> np.ndarray:
+        return self._array[:, 4]
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      SYNTACTIC COUNTS                                            #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class SyntacticCounts:
+    """Syntactic feature values for a collection of discourses.
+
+    Args:
+        values (np.ndarray): Matrix with one row per discourse and one column per feature in
+            SYNTACTIC_FEATURES.
+    """
+
+    def __init__(self, values: np.ndarray) -> None:
+        self._values = values
+        self._columns = {name: i for i, name in enumerate(SYNTACTIC_FEATURES)}
+
+    def __len__(self) -> int:
+        return self._values.shape[0]
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    def get(self, name: str) -> np.ndarray:
+        """Returns the values for a feature by its canonical name, e.g. 'noun_count'."""
+        return self._values[:, self._columns[name]]
+
+    def to_frame(self, index: pd.Index = None) -> pd.DataFrame:
+        return pd.DataFrame(self._values, index=index, columns=SYNTACTIC_FEATURES)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     SYNTACTIC ANALYZER                                           #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class SyntacticAnalyzer:
+    """Parses texts once with spaCy and computes every syntactic feature with NumPy masks.
+
+    Each text is parsed once and its Doc exported with Doc.to_array. Every feature is then a
+    boolean mask over the concatenated token array, summed per discourse with a segmented
+    bincount, so there is no per feature pass over tokens in Python.
+
+    Args:
+        model (str): Name of the spaCy pipeline. Defaults to models.trained in the spaCy
+            configuration.
+        batch_size (int): Number of texts per batch in nlp.pipe.
+        n_process (int): Number of processes used by nlp.pipe.
+        cache (DocCache): Optional cache of parsed Docs. Texts already parsed by the same
+            model are read from the cache without loading the model.
+    """
+
+    def __init__(
+        self,
+        model: str = None,
+        batch_size: int = 256,
+        n_process: int = 1,
+        cache: DocCache = None,
+    ) -> None:
+        self._model = model or SpacyConfig().config["models"]["trained"]
+        self._batch_size = batch_size
+        self._n_process = n_process
+        self._cache = cache
+        self._nlp = None
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    def parse(self, texts: TextColumn) -> DocArray:
+        """Parses each text once and returns the concatenated token attributes."""
+        texts = to_numpy(texts)
+        if self._cache is None:
+            return DocArray.from_docs(self._pipe(texts))
+        key = self._cache.key(texts, self._model, exclude=UNUSED_COMPONENTS)
+        if key in self._cache:
+            return DocArray.from_docs(self._cache.load(key))
+        metadata = {"model": self._model, "version": model_version(self._model)}
+        return DocArray.from_docs(self._cache.save(key, self._pipe(texts), metadata=metadata))
+
+    def parse_spans(self, spans: DiscourseSpans) -> DocArray:
+        """Parses each essay once and returns the token attributes of the discourses in it."""
+        texts = np.array(spans.texts, dtype=object)
+        if self._cache is None:
+            return DocArray.from_docs(spans.slice(self._pipe(texts)))
+        key = self._cache.key(texts, self._model, exclude=UNUSED_COMPONENTS, ids=spans.unit_ids)
+        if key in self._cache:
+            return DocArray.from_docs(spans.slice(self._cache.load(key)))
+        metadata = {"model": self._model, "version": model_version(self._model)}
+        docs = self._cache.save(key, self._pipe(texts), metadata=metadata)
+        return DocArray.from_docs(spans.slice(docs))
+
+    def count(self, docs: DocArray) -> SyntacticCounts:
+        """Computes every syntactic feature for each Doc in the array."""
+        masks = self._masks(docs)
+        segment, n = docs.segment, len(docs)
+        values = np.zeros((n, len(SYNTACTIC_FEATURES)), dtype=np.float64)
+        for column, name in enumerate(SYNTACTIC_FEATURES):
+            if name in masks:
+                values[:, column] = np.bincount(segment, weights=masks[name], minlength=n)
+        values[:, SYNTACTIC_FEATURES.index("type_token_ratio")] = self._type_token_ratio(docs)
+        return SyntacticCounts(values)
+
+    def _pipe(self, texts: np.ndarray):
+        nlp = self._load()
+        return nlp.pipe(texts, batch_size=self._batch_size, n_process=self._n_process)
+
+    def _load(self):
+        if self._nlp is None:
+            import spacy
+
+            self._nlp = spacy.load(self._model, exclude=UNUSED_COMPONENTS)
+            logger.debug("Loaded spaCy pipeline {}.".format(self._model))
+        return self._nlp
+
+    def _masks(self, docs: DocArray) -> dict:
+        pos, tag, dep, lower = docs.pos, docs.tag, docs.dep, docs.lower
+        head = docs.head
+        position = np.arange(len(pos), dtype=np.int64)
+        head_pos, head_tag, head_dep = pos[head], tag[head], dep[head]
+        # The previous token, where it belongs to the same Doc.
+        previous = np.maximum(position - 1, 0)
+        has_previous = np.ones(len(pos), dtype=bool)
+        has_previous[docs.offsets[:-1][docs.counts > 0]] = False
+
+        def isin(values: np.ndarray, labels: np.ndarray) -> np.ndarray:
+            return np.isin(values, labels)
+
+        nouns = _pos(["NOUN", "PROPN"])
+        determiner = isin(dep, _hash(["det"]))
+        article = isin(lower, _hash(ARTICLES)) & isin(pos, _pos(["DET"]))
+        relative = isin(head_dep, _hash(["relcl"]))
+        that = isin(lower, _hash(["that"]))
+        return {
+            "noun_count": isin(pos, nouns),
+            "verb_count": isin(pos, _pos(["VERB"])),
+            "adjective_count": isin(pos, _pos(["ADJ"])),
+            "adverb_count": isin(pos, _pos(["ADV"])),
+            "conjunction_count": isin(pos, _pos(["CCONJ", "SCONJ"])),
+            "existential_there_count": isin(tag, _hash(["EX"])),
+            "superlative_count": isin(tag, _hash(["JJS", "RBS"])),
+            "verb_compliment_counts": isin(dep, _hash(["ccomp", "xcomp"]))
+            & isin(head_pos, _pos(["VERB", "AUX"])),
+            "noun_complement_counts": isin(dep, _hash(["acl", "ccomp"])) & isin(head_pos, nouns),
+            "adjective_complement_counts": isin(dep, _hash(["ccomp", "xcomp"]))
+            & isin(head_pos, _pos(["ADJ"])),
+            "that_relative_clause_count": that & isin(tag, _hash(["WDT"])) & relative,
+            "wh_relative_clause_count": ~that & isin(tag, _hash(WH_TAGS)) & relative,
+            "pre_quallifier_count": isin(dep, _hash(["advmod"]))
+            & isin(head_pos, _pos(["ADJ", "ADV"]))
+            & (head > position),
+            "pre_quantifier_count": isin(tag, _hash(["PDT"])),
+            "post_determiner_count": has_previous
+            & isin(pos[previous], _pos(["DET"]))
+            & (isin(pos, _pos(["NUM"])) | isin(lower, _hash(POST_DETERMINERS))),
+            "demonstrative_determiner_count": determiner & isin(lower, _hash(DEMONSTRATIVES)),
+            "singular_article_count": article & isin(head_tag, _hash(["NN", "NNP"])),
+            "definite_article_count": article & isin(lower, _hash(["the"])),
+            "indefinite_article_count": article & isin(lower, _hash(["a", "an"])),
+            "singular_determiner_count": determiner & isin(head_tag, _hash(["NN", "NNP"])),
+            "plural_determiner_count": determiner & isin(head_tag, _hash(["NNS", "NNPS"])),
+            "double_conjunction_count": isin(dep, _hash(["preconj"])),
+            "attributive_adjective_count": isin(dep, _hash(["amod"])) & isin(pos, _pos(["ADJ"])),
+            "post_noun_modifying_prepositional_phrase": isin(dep, _hash(["prep"]))
+            & isin(head_pos, nouns)
+            & (head < position),
+        }
+
+    def _type_token_ratio(self, docs: DocArray) -> np.ndarray:
+        """Distinct lowercase word forms divided by the number of words, per Doc."""
+        words = ~np.isin(docs.pos, _pos(["PUNCT", "SPACE", "SYM"]))
+        segment, lower = docs.segment[words], docs.lower[words]
+        order = np.lexsort((lower, segment))
+        segment, lower = segment[order], lower[order]
+        first = np.ones(len(segment), dtype=bool)
+        first[1:] = (segment[1:] != segment[:-1]) | (lower[1:] != lower[:-1])
+        types = np.bincount(segment[first], minlength=len(docs))
+        tokens = np.bincount(segment, minlength=len(docs))
+        return np.divide(types, tokens, out=np.zeros(len(docs)), where=tokens > 0)
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+def build_parse(context) -> DocArray:
+    """Builds the 'parse' intermediate: one spaCy parse of every text, as a DocArray.
+
+    When the context locates the texts within their essays, the essays are parsed instead
+    and each text is a slice of its essay's parse.
+    """
+    analyzer = SyntacticAnalyzer(model=context.model, cache=DocCache())
+    if context.spans is not None:
+        return analyzer.parse_spans(context.spans)
+    return analyzer.parse(context.texts)
+
+
+def build_syntax(context) -> SyntacticCounts:
+    """Builds the 'syntax' intermediate: every syntactic feature computed from the parse."""
+    return SyntacticAnalyzer().count(context.get("parse"))
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     SYNTACTIC FEATURE                                            #
+# ------------------------------------------------------------------------------------------------ #
+class SyntacticFeature(FeatureExtractor):
+    """Base class for syntactic features, all read from the shared 'syntax' intermediate."""
+
+    def __init__(self) -> None:
+        super(SyntacticFeature, self).__init__()
+        self._category = "syntactic"
+
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
+
+        Args:
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
+        """
+        counts = self._get_context(texts, context).get("syntax")
+        return counts.get(self._name)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                            NOUN COUNT                                            #
+# ------------------------------------------------------------------------------------------------ #
+class NounCount(SyntacticFeature):
+    """Counts nouns and proper nouns"""
+
+    def __init__(self) -> None:
+        super(NounCount, self).__init__()
+        self._name = "noun_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                            VERB COUNT                                            #
+# ------------------------------------------------------------------------------------------------ #
+class VerbCount(SyntacticFeature):
+    """Counts main verbs"""
+
+    def __init__(self) -> None:
+        super(VerbCount, self).__init__()
+        self._name = "verb_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         ADJECTIVE COUNT                                          #
+# ------------------------------------------------------------------------------------------------ #
+class AdjectiveCount(SyntacticFeature):
+    """Counts adjectives"""
+
+    def __init__(self) -> None:
+        super(AdjectiveCount, self).__init__()
+        self._name = "adjective_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                           ADVERB COUNT                                           #
+# ------------------------------------------------------------------------------------------------ #
+class AdverbCount(SyntacticFeature):
+    """Counts adverbs"""
+
+    def __init__(self) -> None:
+        super(AdverbCount, self).__init__()
+        self._name = "adverb_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        CONJUNCTION COUNT                                         #
+# ------------------------------------------------------------------------------------------------ #
+class ConjunctionCount(SyntacticFeature):
+    """Counts coordinating and subordinating conjunctions"""
+
+    def __init__(self) -> None:
+        super(ConjunctionCount, self).__init__()
+        self._name = "conjunction_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         TYPE TOKEN RATIO                                         #
+# ------------------------------------------------------------------------------------------------ #
+class TypeTokenRatio(SyntacticFeature):
+    """Ratio of distinct lowercase word forms to words"""
+
+    def __init__(self) -> None:
+        super(TypeTokenRatio, self).__init__()
+        self._name = "type_token_ratio"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        EXISTENTIAL THERE                                         #
+# ------------------------------------------------------------------------------------------------ #
+class ExistentialThere(SyntacticFeature):
+    """Counts existential 'there'"""
+
+    def __init__(self) -> None:
+        super(ExistentialThere, self).__init__()
+        self._name = "existential_there_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                           SUPERLATIVES                                           #
+# ------------------------------------------------------------------------------------------------ #
+class Superlatives(SyntacticFeature):
+    """Counts superlative adjectives and adverbs"""
+
+    def __init__(self) -> None:
+        super(Superlatives, self).__init__()
+        self._name = "superlative_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         VERB COMPLEMENTS                                         #
+# ------------------------------------------------------------------------------------------------ #
+class VerbComplements(SyntacticFeature):
+    """Counts clausal complements of verbs"""
+
+    def __init__(self) -> None:
+        super(VerbComplements, self).__init__()
+        self._name = "verb_compliment_counts"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         NOUN COMPLEMENTS                                         #
+# ------------------------------------------------------------------------------------------------ #
+class NounComplements(SyntacticFeature):
+    """Counts clausal complements of nouns"""
+
+    def __init__(self) -> None:
+        super(NounComplements, self).__init__()
+        self._name = "noun_complement_counts"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      ADJECTIVE COMPLEMENTS                                       #
+# ------------------------------------------------------------------------------------------------ #
+class AdjectiveComplements(SyntacticFeature):
+    """Counts clausal complements of adjectives"""
+
+    def __init__(self) -> None:
+        super(AdjectiveComplements, self).__init__()
+        self._name = "adjective_complement_counts"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      THAT RELATIVE CLAUSES                                       #
+# ------------------------------------------------------------------------------------------------ #
+class ThatRelativeClauses(SyntacticFeature):
+    """Counts relative clauses introduced by 'that'"""
+
+    def __init__(self) -> None:
+        super(ThatRelativeClauses, self).__init__()
+        self._name = "that_relative_clause_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       WH RELATIVE CLAUSES                                        #
+# ------------------------------------------------------------------------------------------------ #
+class WhRelativeClauses(SyntacticFeature):
+    """Counts relative clauses introduced by a wh-word"""
+
+    def __init__(self) -> None:
+        super(WhRelativeClauses, self).__init__()
+        self._name = "wh_relative_clause_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          PRE QUALIFIERS                                          #
+# ------------------------------------------------------------------------------------------------ #
+class PreQualifiers(SyntacticFeature):
+    """Counts qualifiers preceding an adjective or adverb, e.g. 'very'"""
+
+    def __init__(self) -> None:
+        super(PreQualifiers, self).__init__()
+        self._name = "pre_quallifier_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         PRE QUANTIFIERS                                          #
+# ------------------------------------------------------------------------------------------------ #
+class PreQuantifiers(SyntacticFeature):
+    """Counts predeterminers, e.g. 'all' in 'all the'"""
+
+    def __init__(self) -> None:
+        super(PreQuantifiers, self).__init__()
+        self._name = "pre_quantifier_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         POST DETERMINERS                                         #
+# ------------------------------------------------------------------------------------------------ #
+class PostDeterminers(SyntacticFeature):
+    """Counts numerals and quantifiers following a determiner"""
+
+    def __init__(self) -> None:
+        super(PostDeterminers, self).__init__()
+        self._name = "post_determiner_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    DEMONSTRATIVE DETERMINERS                                     #
+# ------------------------------------------------------------------------------------------------ #
+class DemonstrativeDeterminers(SyntacticFeature):
+    """Counts demonstrative determiners"""
+
+    def __init__(self) -> None:
+        super(DemonstrativeDeterminers, self).__init__()
+        self._name = "demonstrative_determiner_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        SINGULAR ARTICLES                                         #
+# ------------------------------------------------------------------------------------------------ #
+class SingularArticles(SyntacticFeature):
+    """Counts articles modifying a singular noun"""
+
+    def __init__(self) -> None:
+        super(SingularArticles, self).__init__()
+        self._name = "singular_article_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        DEFINITE ARTICLES                                         #
+# ------------------------------------------------------------------------------------------------ #
+class DefiniteArticles(SyntacticFeature):
+    """Counts definite articles"""
+
+    def __init__(self) -> None:
+        super(DefiniteArticles, self).__init__()
+        self._name = "definite_article_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       INDEFINITE ARTICLES                                        #
+# ------------------------------------------------------------------------------------------------ #
+class IndefiniteArticles(SyntacticFeature):
+    """Counts indefinite articles"""
+
+    def __init__(self) -> None:
+        super(IndefiniteArticles, self).__init__()
+        self._name = "indefinite_article_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       SINGULAR DETERMINERS                                       #
+# ------------------------------------------------------------------------------------------------ #
+class SingularDeterminers(SyntacticFeature):
+    """Counts determiners modifying a singular noun"""
+
+    def __init__(self) -> None:
+        super(SingularDeterminers, self).__init__()
+        self._name = "singular_determiner_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        PLURAL DETERMINERS                                        #
+# ------------------------------------------------------------------------------------------------ #
+class PluralDeterminers(SyntacticFeature):
+    """Counts determiners modifying a plural noun"""
+
+    def __init__(self) -> None:
+        super(PluralDeterminers, self).__init__()
+        self._name = "plural_determiner_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       DOUBLE CONJUNCTIONS                                        #
+# ------------------------------------------------------------------------------------------------ #
+class DoubleConjunctions(SyntacticFeature):
+    """Counts correlative conjunctions, e.g. 'either ... or'"""
+
+    def __init__(self) -> None:
+        super(DoubleConjunctions, self).__init__()
+        self._name = "double_conjunction_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      ATTRIBUTIVE ADJECTIVES                                      #
+# ------------------------------------------------------------------------------------------------ #
+class AttributiveAdjectives(SyntacticFeature):
+    """Counts adjectives modifying a noun"""
+
+    def __init__(self) -> None:
+        super(AttributiveAdjectives, self).__init__()
+        self._name = "attributive_adjective_count"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                 POST NOUN PREPOSITIONAL PHRASES                                  #
+# ------------------------------------------------------------------------------------------------ #
+class PostNounPrepositionalPhrases(SyntacticFeature):
+    """Counts prepositional phrases following and modifying a noun"""
+
+    def __init__(self) -> None:
+        super(PostNounPrepositionalPhrases, self).__init__()
+        self._name = "post_noun_modifying_prepositional_phrase"
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tokens.py                                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 11:20:00 am                                                #
+# Modified   : Saturday October 17th 2026 12:46:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Word and sentence artifacts shared by the word and sentence feature extractors."""
+import numpy as np
+import pyarrow as pa
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.features.extraction.columnar import TextColumn, to_numpy, split_tokens, token_lengths
+from aes.features.extraction.ragged import RaggedArray
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      TOKENIZATION                                                #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class Tokenization:
+    """Word and sentence boundaries for a column of discourse texts.
+
+    Words are the tokens obtained by splitting each text on single spaces. They are stored
+    flat, in corpus order, with word_offsets delimiting the words of each discourse. Word
+    lengths and word ids are exposed as RaggedArrays so that per-discourse statistics are
+    computed for the whole corpus with segmented reductions.
+
+    Args:
+        texts (TextColumn): The texts that were tokenized.
+        words (pa.Array): Flat array of word tokens.
+        word_offsets (np.ndarray): Offsets of the first word of each discourse, plus the total.
+    """
+
+    def __init__(self, texts: TextColumn, words: pa.Array, word_offsets: np.ndarray) -> None:
+        self._texts = texts
+        self._words = words
+        self._word_offsets = word_offsets
+        self._word_lengths = None
+        self._word_ids = None
+        self._word_starts = None
+
+    def __len__(self) -> int:
+        return len(self._word_offsets) - 1
+
+    # -------------------------------------------------------------------------------------------- #
+    @property
+    def words(self) -> pa.Array:
+        return self._words
+
+    @property
+    def word_offsets(self) -> np.ndarray:
+        return self._word_offsets
+
+    @property
+    def word_counts(self) -> np.ndarray:
+        return np.diff(self._word_offsets)
+
+    @property
+    def word_lengths(self) -> RaggedArray:
+        """Length in characters of each word."""
+        if self._word_lengths is None:
+            self._word_lengths = RaggedArray(token_lengths(self._words), self._word_offsets)
+        return self._word_lengths
+
+    @property
+    def word_ids(self) -> RaggedArray:
+        """Corpus level integer id of each word. Equal words share an id."""
+        if self._word_ids is None:
+            indices = self._words.dictionary_encode().indices
+            ids = indices.to_numpy(zero_copy_only=False).astype(np.int64)
+            self._word_ids = RaggedArray(ids, self._word_offsets)
+        return self._word_ids
+
+    @property
+    def word_starts(self) -> RaggedArray:
+        """Character offset of each word within its discourse."""
+        if self._word_starts is None:
+            widths = self.word_lengths.values + 1
+            exclusive = np.cumsum(widths) - widths
+            counts = self.word_counts
+            first = exclusive[self._word_offsets[:-1][counts > 0]]
+            starts = exclusive - np.repeat(first, counts[counts > 0])
+            self._word_starts = RaggedArray(starts, self._word_offsets)
+        return self._word_starts
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       SENTENCES                                                  #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class Sentences:
+    """Sentence boundaries for a column of discourse texts.
+
+    Holds only the sentence offsets and lengths, with offsets delimiting the sentences of each
+    discourse, so it is independent of the word Tokenization and either can be freed while
+    the other is in use.
+
+    Args:
+        starts (RaggedArray): Character offset of the start of each sentence in its discourse.
+        ends (RaggedArray): Character offset of the end of each sentence in its discourse.
+        lengths (RaggedArray): Number of NLTK word tokens in each sentence.
+    """
+
+    def __init__(self, starts: RaggedArray, ends: RaggedArray, lengths: RaggedArray) -> None:
+        self._starts = starts
+        self._ends = ends
+        self._lengths = lengths
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    @property
+    def offsets(self) -> np.ndarray:
+        return self._lengths.offsets
+
+    @property
+    def counts(self) -> np.ndarray:
+        return self._lengths.counts
+
+    @property
+    def lengths(self) -> RaggedArray:
+        return self._lengths
+
+    @property
+    def starts(self) -> RaggedArray:
+        return self._starts
+
+    @property
+    def ends(self) -> RaggedArray:
+        return self._ends
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        TOKENIZER                                                 #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class Tokenizer:
+    """Produces the Tokenization and Sentences artifacts for a column of texts."""
+
+    def tokenize(self, texts: TextColumn) -> Tokenization:
+        """Tokenizes the texts into words.
+
+        Args:
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+        """
+        words, segment = split_tokens(texts)
+        counts = np.bincount(segment, minlength=len(texts))
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        return Tokenization(texts=texts, words=words, word_offsets=offsets)
+
+    def segment(self, texts: TextColumn) -> Sentences:
+        """Segments the texts into sentences with the NLTK punkt tokenizer.
+
+        Args:
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+        """
+        from nltk.tokenize import sent_tokenize, word_tokenize
+
+        counts, starts, ends, lengths = [], [], [], []
+        for text in to_numpy(texts):
+            sentences = sent_tokenize(text)
+            cursor = 0
+            for sentence in sentences:
+                start = text.find(sentence, cursor)
+                start = cursor if start < 0 else start
+                cursor = start + len(sentence)
+                starts.append(start)
+                ends.append(cursor)
+                lengths.append(len(word_tokenize(sentence, preserve_line=True)))
+            counts.append(len(sentences))
+
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        return Sentences(
+            starts=RaggedArray(np.array(starts, dtype=np.int64), offsets),
+            ends=RaggedArray(np.array(ends, dtype=np.int64), offsets),
+            lengths=RaggedArray(np.array(lengths, dtype=np.int64), offsets),
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+def build_tokens(context) -> Tokenization:
+    """Builds the 'tokens' intermediate for an ExtractionContext."""
+    return Tokenizer().tokenize(context.texts)
+
+
+def build_sentences(context) -> Sentences:
+    """Builds the 'sentences' intermediate for an ExtractionContext."""
+    return Tokenizer().segment(context.texts)
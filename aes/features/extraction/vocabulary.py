@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /vocabulary.py                                                                      #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:22:03 am                                              #
+# Modified   : Saturday October 17th 2026 01:11:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Corpus vocabulary interning each surface form once, with memoized stems and lemmas."""
+import os
+import re
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from typing import Callable
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig, DataConfig, resolve_path
+from aes.features.extraction.columnar import hash_strings
+from aes.features.extraction.ragged import RaggedArray
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+# Normalizations stored for each surface form. Every table interns the empty string as id 0.
+KINDS = ["normalized", "stem", "lemma"]
+_NON_ALPHANUMERIC = re.compile("[^a-z0-9]")
+# ------------------------------------------------------------------------------------------------ #
+
+
+def normalize(form: str) -> str:
+    """Lowercases a surface form and strips it to letters and digits."""
+    return _NON_ALPHANUMERIC.sub("", form.lower())
+
+
+def _qualname(function: Callable) -> str:
+    """Identifies a normalization function so that persisted tables can be checked against it."""
+    module = getattr(function, "__module__", None) or type(function).__module__
+    return "{}.{}".format(module, getattr(function, "__qualname__", repr(function)))
+
+
+def _default_stemmer() -> Callable:
+    from nltk.stem.porter import PorterStemmer
+
+    return PorterStemmer().stem
+
+
+def _default_lemmatizer(stemmer: Callable) -> Callable:
+    """Returns the WordNet lemmatizer, or the stemmer if the WordNet corpus is not installed."""
+    from nltk.corpus import wordnet
+    from nltk.stem import WordNetLemmatizer
+
+    try:
+        wordnet.ensure_loaded()
+    except LookupError:
+        logger.warning("WordNet corpus is not installed. Lemmas fall back to stems.")
+        return stemmer
+    return WordNetLemmatizer().lemmatize
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     INTERNED TOKENS                                              #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class InternedTokens:
+    """Token stream of a corpus stored as int32 vocabulary ids.
+
+    Args:
+        vocabulary (Vocabulary): The vocabulary the ids refer to.
+        ids (RaggedArray): Vocabulary id of each token, delimited by discourse.
+    """
+
+    def __init__(self, vocabulary: "Vocabulary", ids: RaggedArray) -> None:
+        self._vocabulary = vocabulary
+        self._ids = ids
+        self._views = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def vocabulary(self) -> "Vocabulary":
+        return self._vocabulary
+
+    @property
+    def ids(self) -> RaggedArray:
+        return self._ids
+
+    def view(self, kind: str) -> RaggedArray:
+        """Returns the normalized, stem or lemma id of each word.
+
+        Tokens that normalize to the empty string, i.e. punctuation, are dropped and the
+        offsets recomputed, so the views of every kind share the same offsets.
+
+        Args:
+            kind (str): One of 'normalized', 'stem' or 'lemma'.
+        """
+        if kind not in self._views:
+            values = self._vocabulary.ids(kind)[self._ids.values]
+            keep = self._vocabulary.ids("normalized")[self._ids.values] != 0
+            counts = RaggedArray(keep, self._ids.offsets).sum().astype(np.int64)
+            self._views[kind] = RaggedArray.from_counts(values[keep], counts)
+        return self._views[kind]
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        VOCABULARY                                                #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class Vocabulary:
+    """Interning table mapping each surface form to an int32 id and its normalizations.
+
+    Each new surface form is normalized, stemmed and lemmatized exactly once. Normalized
+    forms, stems and lemmas are themselves interned, so that downstream extractors gather
+    integer ids, or the hashes of the interned strings, instead of processing strings per
+    token. The table is persisted as Parquet and reloaded in later runs. Tables written with
+    a different stemmer or lemmatizer are ignored.
+
+    Args:
+        filepath (str): Path to the persisted table. If None, the table is kept in memory only.
+        stemmer (Callable): Maps a normalized form to its stem. Defaults to the Porter stemmer.
+        lemmatizer (Callable): Maps a normalized form to its lemma. Defaults to the WordNet
+            lemmatizer, or to the stemmer if the WordNet corpus is not installed.
+    """
+
+    def __init__(
+        self, filepath: str = None, stemmer: Callable = None, lemmatizer: Callable = None
+    ) -> None:
+        self._filepath = filepath
+        self._stemmer = stemmer or _default_stemmer()
+        self._lemmatizer = lemmatizer or _default_lemmatizer(self._stemmer)
+        self._metadata = {
+            b"stemmer": _qualname(self._stemmer).encode(),
+            b"lemmatizer": _qualname(self._lemmatizer).encode(),
+        }
+
+        self._forms = {}
+        self._strings = {kind: {} for kind in KINDS}
+        self._ids = {kind: [] for kind in KINDS}
+        self._arrays = {}
+        self._hashes = {}
+        self._added = []
+        for kind in KINDS:
+            self._strings[kind][""] = 0
+
+        table = self._read()
+        if table is not None:
+            for row in zip(*(table.column(name).to_pylist() for name in ["form"] + KINDS)):
+                self._add(*row)
+
+    def __len__(self) -> int:
+        return len(self._forms)
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    # -------------------------------------------------------------------------------------------- #
+    def encode(self, words: pa.Array) -> np.ndarray:
+        """Returns the int32 id of each word, interning surface forms not yet in the vocabulary.
+
+        Args:
+            words (pa.Array): Flat array of word tokens.
+        """
+        encoded = pc.dictionary_encode(words)
+        indices = encoded.indices.to_numpy(zero_copy_only=False)
+        forms = encoded.dictionary.to_pylist()
+        ids = np.empty(len(forms), dtype=np.int32)
+        for i, form in enumerate(forms):
+            form_id = self._forms.get(form)
+            if form_id is None:
+                form_id = self._intern(form)
+            ids[i] = form_id
+        return ids[indices]
+
+    def intern(self, words: pa.Array, word_offsets: np.ndarray) -> InternedTokens:
+        """Encodes a token stream delimited by discourse.
+
+        Args:
+            words (pa.Array): Flat array of word tokens in corpus order.
+            word_offsets (np.ndarray): Offsets of the first word of each discourse, plus the total.
+        """
+        return InternedTokens(self, RaggedArray(self.encode(words), word_offsets))
+
+    def ids(self, kind: str) -> np.ndarray:
+        """Returns, for each surface form id, the id of its normalized form, stem or lemma."""
+        array = self._arrays.get(kind)
+        if array is None or len(array) != len(self._forms):
+            array = self._arrays[kind] = np.array(self._ids[kind], dtype=np.int32)
+        return array
+
+    def strings(self, kind: str) -> list:
+        """Returns the interned normalized forms, stems or lemmas in id order."""
+        return list(self._strings[kind])
+
+    def hashes(self, kind: str) -> np.ndarray:
+        """Returns the stable 64 bit hash of each interned normalized form, stem or lemma."""
+        hashes = self._hashes.get(kind)
+        if hashes is None or len(hashes) != len(self._strings[kind]):
+            hashes = self._hashes[kind] = hash_strings(self.strings(kind))
+        return hashes
+
+    def save(self) -> None:
+        """Writes the forms added since the table was loaded, merged with the stored table."""
+        if not self._filepath or not self._added:
+            return
+        names = ["form"] + KINDS
+        rows = self._added
+        table = self._read()
+        if table is not None:
+            stored = set(table.column("form").to_pylist())
+            rows = [row for row in rows if row[0] not in stored]
+        added = pa.table(
+            {name: pa.array(column, pa.string()) for name, column in zip(names, zip(*rows))}
+            if rows
+            else {name: pa.array([], pa.string()) for name in names}
+        )
+        table = added if table is None else pa.concat_tables([table, added])
+        os.makedirs(os.path.dirname(self._filepath) or ".", exist_ok=True)
+        staging = "{}.{}".format(self._filepath, os.getpid())
+        pq.write_table(table.replace_schema_metadata(self._metadata), staging)
+        os.replace(staging, self._filepath)
+        logger.debug("Saved {} new forms to {}.".format(len(rows), self._filepath))
+        self._added = []
+
+    # -------------------------------------------------------------------------------------------- #
+    def _intern(self, form: str) -> int:
+        normalized = normalize(form)
+        if normalized:
+            row = (form, normalized, self._stemmer(normalized), self._lemmatizer(normalized))
+        else:
+            row = (form, "", "", "")
+        self._added.append(row)
+        return self._add(*row)
+
+    def _add(self, form: str, *normalizations: str) -> int:
+        form_id = self._forms[form] = len(self._forms)
+        for kind, string in zip(KINDS, normalizations):
+            strings = self._strings[kind]
+            self._ids[kind].append(strings.setdefault(string, len(strings)))
+        return form_id
+
+    def _read(self) -> pa.Table:
+        """Reads the persisted table, or returns None if it is missing or was built differently."""
+        if not self._filepath or not os.path.exists(self._filepath):
+            return None
+        table = pq.read_table(self._filepath)
+        metadata = table.schema.metadata or {}
+        if any(metadata.get(key) != value for key, value in self._metadata.items()):
+            logger.warning(
+                "Vocabulary {} was built with other normalizers. Ignoring.".format(self._filepath)
+            )
+            return None
+        return table.replace_schema_metadata(None)
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+def build_vocabulary(context) -> InternedTokens:
+    """Builds the 'vocabulary' intermediate: the shared tokenization as vocabulary ids.
+
+    The vocabulary filepath in the data configuration is relative to the project root.
+    """
+    tokens = context.get("tokens")
+    filepath = DataConfig().config.get("vocabulary", {}).get("filepath")
+    vocabulary = Vocabulary(resolve_path(filepath) if filepath else None)
+    interned = vocabulary.intern(tokens.words, tokens.word_offsets)
+    vocabulary.save()
+    return interned
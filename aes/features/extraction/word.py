@@ -11,8 +11,154 @@
 # URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Wednesday August 10th 2022 06:28:17 pm                                              #
-# Modified   : Wednesday August 10th 2022 06:28:21 pm                                              #
+# Modified   : Saturday October 17th 2026 12:55:00 am                                              #
 # ------------------------------------------------------------------------------------------------ #
 # License    : BSD 3-clause "New" or "Revised" License                                             #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
+"""Defines Word Features and Behaviors for Extraction and Summarization"""
+import numpy as np
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import LogConfig
+from aes.features.extraction.base import FeatureExtractor
+from aes.features.extraction.columnar import TextColumn
+from aes.features.extraction.context import ExtractionContext
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       SPELLING ERRORS                                            #
+# ------------------------------------------------------------------------------------------------ #
+class SpellingErrors(FeatureExtractor):
+    """Counts misspelled words
+
+    A word is misspelled when it is not in the dictionary but a dictionary word is within
+    the configured max_edit_distance of it. Out of dictionary words with no dictionary word
+    nearby, such as names and foreign words, are not counted as errors.
+    """
+
+    def __init__(self) -> None:
+        super(SpellingErrors, self).__init__()
+        self._name = "spelling_error_count"
+        self._category = "word"
+
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
+
+        Args:
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
+        """
+        return self._get_context(texts, context).get("spelling").errors
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    SPELLING ERROR RATIO                                          #
+# ------------------------------------------------------------------------------------------------ #
+class SpellingErrorRatio(FeatureExtractor):
+    """Proportion of words that are misspelled"""
+
+    def __init__(self) -> None:
+        super(SpellingErrorRatio, self).__init__()
+        self._name = "spelling_error_ratio"
+        self._category = "word"
+
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
+
+        Args:
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
+        """
+        return self._get_context(texts, context).get("spelling").ratio
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         NGRAM FEATURE                                            #
+# ------------------------------------------------------------------------------------------------ #
+class NgramFeature(FeatureExtractor):
+    """Base class for n-gram features, read from the shared 'ngrams' intermediate.
+
+    The feature is the number of distinct n-grams of length _order in the discourse, over
+    words or, if _stemmed, over Porter stems.
+    """
+
+    def __init__(self) -> None:
+        super(NgramFeature, self).__init__()
+        self._category = "word"
+        self._order = None
+        self._stemmed = False
+
+    def extract_batch(
+        self, texts: TextColumn, context: ExtractionContext = None, **kwargs
+    ) -> np.ndarray:
+        """Extracts the feature from a column of texts.
+
+        Args:
+            texts (TextColumn): Arrow string array, NumPy object array or pandas Series of texts.
+            context (ExtractionContext): Intermediates shared with the other extractors in the run.
+        """
+        ngrams = self._get_context(texts, context).get("ngrams")
+        return ngrams[(self._order, self._stemmed)].distinct
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                             BIGRAMS                                              #
+# ------------------------------------------------------------------------------------------------ #
+class Bigrams(NgramFeature):
+    """Counts distinct word bigrams"""
+
+    def __init__(self) -> None:
+        super(Bigrams, self).__init__()
+        self._name = "bigram_count"
+        self._order = 2
+        self._stemmed = False
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                             TRIGRAMS                                             #
+# ------------------------------------------------------------------------------------------------ #
+class Trigrams(NgramFeature):
+    """Counts distinct word trigrams"""
+
+    def __init__(self) -> None:
+        super(Trigrams, self).__init__()
+        self._name = "trigram_count"
+        self._order = 3
+        self._stemmed = False
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         STEMMED BIGRAMS                                          #
+# ------------------------------------------------------------------------------------------------ #
+class StemmedBigrams(NgramFeature):
+    """Counts distinct bigrams of Porter stems"""
+
+    def __init__(self) -> None:
+        super(StemmedBigrams, self).__init__()
+        self._name = "stemmed_bigram_count"
+        self._order = 2
+        self._stemmed = True
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         STEMMED TRIGRAMS                                         #
+# ------------------------------------------------------------------------------------------------ #
+class StemmedTrigrams(NgramFeature):
+    """Counts distinct trigrams of Porter stems"""
+
+    def __init__(self) -> None:
+        super(StemmedTrigrams, self).__init__()
+        self._name = "stemmed_trigram_count"
+        self._order = 3
+        self._stemmed = True
@@ -11,20 +11,26 @@
 # URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Tuesday August 9th 2022 07:49:32 pm                                                 #
-# Modified   : Monday August 15th 2022 04:59:41 pm                                                 #
+# Modified   : Saturday October 17th 2026 01:00:00 am                                              #
 # ------------------------------------------------------------------------------------------------ #
 # License    : BSD 3-clause "New" or "Revised" License                                             #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 """Feature Extraction Module."""
+import numpy as np
 import pandas as pd
 import logging
 import logging.config
 
 # ------------------------------------------------------------------------------------------------ #
-from aes.utils.config import LogConfig
+from aes.utils.config import LogConfig, DataConfig
+from aes.utils.memory import compact_dtypes, memory_report
 from aes.features.base import Feature
 from aes.features import FEATURES
+from aes.data.models import ModelSelector
+from aes.features.extraction.base import FeatureExtractorFactory
+from aes.features.extraction.context import ExtractionContext
+from aes.features.extraction.registry import REGISTRY
 
 # ------------------------------------------------------------------------------------------------ #
 logging.config.dictConfig(LogConfig().config)
@@ -35,19 +41,76 @@ logger = logging.getLogger(__name__)
 class FeatureSet:
     """Collection of Feature objects that can be extracted, summarized, and reported.
 
+    Feature values are held in a single preallocated float32 block, one column per feature,
+    with one index of the idvar values shared by all features. The block is stored in column
+    major order and its columns are grouped by category. As a result, each Feature, and each
+    category returned by get_features, is a view into the block rather than a copy.
+
+    Features parsed with spaCy use the cheapest installed pipeline meeting the tier each
+    requires. The pipeline is recorded in provenance and in the attrs of get_features.
+
     Args:
-        data (np.array): Numpy array containing the text.
+        data (pd.DataFrame): DataFrame containing the idvar and text columns.
+        selector (ModelSelector): Chooses the spaCy pipeline. Defaults to the configured tiers.
 
     """
 
-    def __init__(self, data: pd.DataFrame) -> None:
+    __dtype = np.float32
+
+    def __init__(self, data: pd.DataFrame, selector: ModelSelector = None) -> None:
         self._data = data  # The training data
-        self._columns = data.columns.to.list()
+        self._columns = data.columns.to_list()
+        self._idvar = DataConfig().config["columns"]["idvar"]
         self._features = {}  # Dictionary of feature objects.
+        self._factory = FeatureExtractorFactory()  # Shared by the features in the set.
+        self._selector = selector
+        self._provenance = {}  # The spaCy pipeline behind each feature that used one.
         self._extracted = False
+        self._index = pd.Index(data[self._idvar])  # Shared by every feature in the set.
+        self._block = None  # Column major matrix of feature values.
+        self._names = []  # Feature names in block column order.
+        self._slices = {}  # Category to the slice of block columns holding its features.
+
+    @property
+    def index(self) -> pd.Index:
+        return self._index
+
+    @property
+    def block(self) -> np.ndarray:
+        return self._block
+
+    @property
+    def provenance(self) -> dict:
+        """Tier, model and version of the spaCy pipeline producing each feature that uses one."""
+        return self._provenance
+
+    def extract(
+        self, text_col: str = "discourse_text", category_col: str = "discourse_type"
+    ) -> None:
+        """Extracts and updates the data with length, word, syntactic, semantic and readability features.
+
+        A single ExtractionContext and FeatureExtractorFactory are shared by all features, so
+        that intermediates such as the tokenization are computed once for the run and each
+        extractor is constructed once per set. Each feature writes its values directly into
+        its column of the block.
 
-    def extract(self) -> None:
-        """Extracts and updates the data with length, word, syntactic, semantic and readability features."""
+        Args:
+            text_col (str): The column in the data containing the discourse texts.
+            category_col (str): The column containing the discourse types, if present.
+        """
+        self._allocate()
+        model = self._select_model()
+        categories = self._data[category_col] if category_col in self._data.columns else None
+        context = ExtractionContext(self._data[text_col], categories=categories, model=model)
+        for name in self._names:
+            self._features[name].extract(
+                self._data,
+                context=context,
+                factory=self._factory,
+                text_col=text_col,
+                category_col=category_col,
+            )
+        self._extracted = True
 
     def add_feature(self, feature: Feature) -> None:
         """Adds a feature to the FeatureSet
@@ -59,6 +122,7 @@ class FeatureSet:
             logger.warn("Feature {} already added to FeatureSet".format(feature.name))
         else:
             self._features[feature.name] = feature
+            self._extracted = False
 
     def remove_feature(self, name: str) -> None:
         """Removes a feature from the FeatureSet
@@ -68,6 +132,7 @@ class FeatureSet:
         """
         try:
             del self._features[name]
+            self._extracted = False
         except KeyError as e:
             logger.error("Feature {} does not belong to this FeatureSet object.".format(name))
             raise KeyError(e)
@@ -84,17 +149,103 @@ class FeatureSet:
         """
         try:
             return self._features[name]
-        except KeyError as e:
+        except KeyError:
             logging.error("Feature {} does not belong to this FeatureSet object.".format(name))
 
-    def get_features(self, category: str = None) -> pd.DataFrame:
-        """Returns the data with features added.
+    def get_features(self, category: str = None, compact: bool = False) -> pd.DataFrame:
+        """Returns the extracted features as a DataFrame indexed by the idvar.
+
+        By default the DataFrame is a view into the block, so no feature values are copied.
 
         Args:
             category (str): I grouping of features in  ['length', 'word', 'semantic', 'syntactic', 'readability']
+            compact (bool): If True, returns a copy with each feature in its smallest safe
+                dtype, e.g. uint8 or uint16 for counts and float32 for ratios.
 
         """
-        if category and category in FEATURES.keys():
-            features = FEATURES[category]
-            columns = self._columns.axtend(features)
-            return self._data[columns]
+        columns = self._get_slice(category)
+        features = pd.DataFrame(
+            self._block[:, columns], index=self._index, columns=self._names[columns], copy=False
+        )
+        features = self._compact(features) if compact else features
+        features.attrs["provenance"] = {
+            name: self._provenance[name] for name in features.columns if name in self._provenance
+        }
+        return features
+
+    def memory_report(self, category: str = None) -> pd.DataFrame:
+        """Returns the bytes used by each feature in the block and in compact dtypes.
+
+        Args:
+            category (str): Optional feature category, e.g. 'length'. Defaults to all features.
+        """
+        features = self.get_features(category=category)
+        return memory_report(features, self._compact(features))
+
+    def get_array(self, category: str = None) -> np.ndarray:
+        """Returns the extracted features as a zero-copy view of the block.
+
+        Args:
+            category (str): Optional feature category, e.g. 'length'. Defaults to all features.
+
+        """
+        return self._block[:, self._get_slice(category)]
+
+    def _select_model(self) -> str:
+        """Selects the spaCy pipeline for the features that need one and records it."""
+        qualities = {
+            name: REGISTRY.get(name).quality
+            for name in self._names
+            if name in REGISTRY and REGISTRY.get(name).quality
+        }
+        if not qualities:
+            self._provenance = {}
+            return None
+        selector = self._selector if self._selector is not None else ModelSelector()
+        tier = selector.select(qualities.values())
+        self._provenance = {name: tier.provenance() for name in qualities}
+        return tier.model
+
+    def _compact(self, features: pd.DataFrame) -> pd.DataFrame:
+        """Restores the integer dtype of count features before compacting the columns."""
+        dtypes = {
+            name: np.int64
+            for name in features.columns
+            if self._features[name].dtype is not None
+            and np.issubdtype(self._features[name].dtype, np.integer)
+        }
+        return compact_dtypes(features.astype(dtypes))
+
+    def _get_slice(self, category: str = None) -> slice:
+        if not self._extracted:
+            msg = "Features have not been extracted."
+            logger.error(msg)
+            raise RuntimeError(msg)
+        if category is None:
+            return slice(0, len(self._names))
+        try:
+            return self._slices[category]
+        except KeyError as e:
+            logger.error("No {} features belong to this FeatureSet object.".format(category))
+            raise KeyError(e)
+
+    def _allocate(self) -> None:
+        """Preallocates the block and binds each feature to its column."""
+        order = {name: i for i, name in enumerate(n for names in FEATURES.values() for n in names)}
+        categories = list(FEATURES.keys())
+
+        def position(feature: Feature) -> tuple:
+            category = feature.category
+            rank = categories.index(category) if category in categories else len(categories)
+            return (rank, str(category), order.get(feature.name, len(order)), feature.name)
+
+        features = sorted(self._features.values(), key=position)
+        self._names = np.array([feature.name for feature in features], dtype=object)
+        self._block = np.zeros(
+            (len(self._index), len(features)), dtype=FeatureSet.__dtype, order="F"
+        )
+        self._slices = {}
+        for column, feature in enumerate(features):
+            feature.bind(self._index, self._block[:, column])
+            start = self._slices.get(feature.category, slice(column, column)).start
+            self._slices[feature.category] = slice(start, column + 1)
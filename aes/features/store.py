@@ -11,8 +11,445 @@
 # URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Thursday August 11th 2022 06:06:37 am                                               #
-# Modified   : Thursday August 11th 2022 06:06:41 am                                               #
+# Modified   : Saturday October 17th 2026 01:00:00 am                                              #
 # ------------------------------------------------------------------------------------------------ #
 # License    : BSD 3-clause "New" or "Revised" License                                             #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
+"""Local feature store: the partitioned Parquet offline store and the SQLite online store."""
+import os
+import json
+import shutil
+import sqlite3
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import logging
+import logging.config
+
+# ------------------------------------------------------------------------------------------------ #
+from aes.utils.config import ROOT, LogConfig, DataConfig, resolve_path
+from aes.utils.io import YamlIO
+from aes.features import FEATURES
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+#                                      OFFLINE STORE                                               #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class OfflineStore:
+    """Feature tables stored as Parquet, partitioned by feature category and discourse type.
+
+    The layout is <path>/category=<category>/<discourse_type column>=<value>/part-<i>.parquet.
+    Reads go through pyarrow datasets. Only the requested feature columns are read, and the
+    discourse type filter prunes whole partitions. Any other filter is pushed down to the
+    row group statistics. The spaCy pipeline that produced each feature, if any, is kept in
+    the Parquet schema metadata of its category.
+
+    Args:
+        path (str): Root directory of the offline store. Defaults to offline_store.path in
+            the data configuration, relative to the project root.
+    """
+
+    def __init__(self, path: str = None) -> None:
+        config = DataConfig().config
+        self._path = path or resolve_path(config["offline_store"]["path"])
+        self._idvar = config["columns"]["idvar"]
+        self._partition = config["columns"]["category"]
+        self._categories = {
+            name: category for category, names in FEATURES.items() for name in names
+        }
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def categories(self) -> list:
+        """Returns the feature categories present in the store."""
+        if not os.path.isdir(self._path):
+            return []
+        return sorted(
+            directory.split("=", 1)[1]
+            for directory in os.listdir(self._path)
+            if directory.startswith("category=")
+        )
+
+    def features(self, category: str) -> list:
+        """Returns the names of the features stored for a category."""
+        names = self._dataset(category).schema.names
+        return [name for name in names if name not in (self._idvar, self._partition)]
+
+    def provenance(self, category: str) -> dict:
+        """Returns the tier, model and version of the spaCy pipeline behind each feature of a
+        category that used one."""
+        metadata = self._dataset(category).schema.metadata or {}
+        return json.loads(metadata.get(b"provenance", b"{}"))
+
+    def write(self, features: pd.DataFrame, category: str, provenance: dict = None) -> None:
+        """Writes a feature table into the partitions of a category.
+
+        Features already stored for the same discourses and not present in the table are
+        kept. Stored values of the features in the table are replaced.
+
+        Args:
+            features (pd.DataFrame): DataFrame with the idvar and discourse type columns and
+                one column per feature.
+            category (str): The feature category, e.g. 'length'.
+            provenance (dict): The spaCy pipeline behind each feature that used one, as
+                returned by ExtractionPlanner.provenance. Defaults to the 'provenance' entry
+                of features.attrs.
+        """
+        if provenance is None:
+            provenance = features.attrs.get("provenance", {})
+        keys = [self._idvar, self._partition]
+        names = [name for name in features.columns if name not in keys]
+        provenance = {name: dict(provenance[name]) for name in names if name in provenance}
+
+        table = pa.Table.from_pandas(features, preserve_index=False)
+        position = table.schema.get_field_index(self._partition)
+        table = table.set_column(
+            position, self._partition, table.column(position).cast(pa.string())
+        )
+        directory = self._category_path(category)
+        if os.path.isdir(directory):
+            stored = self.provenance(category)
+            stored = {name: value for name, value in stored.items() if name not in names}
+            table = self._annotate(table, {**stored, **provenance})
+            staging = directory + ".staging"
+            self._merge(table, category, staging)
+            shutil.rmtree(directory)
+            os.rename(staging, directory)
+        else:
+            self._write(self._annotate(table, provenance), directory)
+        logger.debug("Wrote {} rows of {} features.".format(table.num_rows, category))
+
+    def read(
+        self,
+        features: list,
+        discourse_types: list = None,
+        filter: ds.Expression = None,
+    ) -> pd.DataFrame:
+        """Reads selected features, optionally restricted to some discourse types.
+
+        Args:
+            features (list): Names of the features to read.
+            discourse_types (list): Discourse types to read. Defaults to all.
+            filter (ds.Expression): Additional predicate pushed down to the Parquet scan.
+
+        Returns:
+            DataFrame with the idvar, the discourse type and the requested features.
+        """
+        if len(features) == 0:
+            return pd.DataFrame(columns=[self._idvar, self._partition])
+
+        expression = filter
+        if discourse_types is not None:
+            selection = ds.field(self._partition).isin(list(discourse_types))
+            expression = selection if expression is None else expression & selection
+
+        result, provenance = None, {}
+        for category, names in self._by_category(features).items():
+            columns = [self._idvar, self._partition] + names
+            table = self._dataset(category).to_table(columns=columns, filter=expression)
+            frame = table.to_pandas()
+            if result is None:
+                result = frame
+            else:
+                result = result.merge(frame, on=[self._idvar, self._partition], how="outer")
+            stored = self.provenance(category)
+            provenance.update({name: stored[name] for name in names if name in stored})
+        result = result[[self._idvar, self._partition] + list(features)]
+        result.attrs["provenance"] = provenance
+        return result
+
+    def _by_category(self, features: list) -> dict:
+        categories = {}
+        for name in features:
+            if name not in self._categories:
+                msg = "Feature {} does not belong to a known category.".format(name)
+                logger.error(msg)
+                raise KeyError(msg)
+            categories.setdefault(self._categories[name], []).append(name)
+        return categories
+
+    def _category_path(self, category: str) -> str:
+        return os.path.join(self._path, "category={}".format(category))
+
+    def _dataset(self, category: str) -> ds.Dataset:
+        directory = self._category_path(category)
+        if not os.path.isdir(directory):
+            raise KeyError("No {} features are stored in {}.".format(category, self._path))
+        partitioning = ds.partitioning(pa.schema([(self._partition, pa.string())]), flavor="hive")
+        return ds.dataset(directory, format="parquet", partitioning=partitioning)
+
+    def _merge(self, table: pa.Table, category: str, directory: str) -> None:
+        """Combines a new table with the stored rows of a category, writing to directory.
+
+        The stored features are read and merged one discourse type partition at a time, so
+        only a single partition of the category is held in memory.
+        """
+        dataset = self._dataset(category)
+        keys = [self._idvar, self._partition]
+        replaced = [name for name in table.column_names if name not in keys]
+        kept = [field for field in dataset.schema if field.name not in table.column_names]
+        schema = pa.schema(list(table.schema) + kept, metadata=table.schema.metadata)
+
+        stored = {
+            ds.get_partition_keys(fragment.partition_expression)[self._partition]
+            for fragment in dataset.get_fragments()
+        }
+        new = set(pc.unique(table.column(self._partition)).to_pylist())
+        for value in sorted(stored | new):
+            rows = table.filter(pc.equal(table.column(self._partition), value)).to_pandas()
+            if value in stored:
+                partition = dataset.to_table(
+                    filter=ds.field(self._partition) == value
+                ).to_pandas()
+                partition = partition.drop(columns=replaced, errors="ignore")
+                rows = partition.merge(rows, on=keys, how="outer")
+            rows = rows.reindex(columns=schema.names)
+            self._write(pa.Table.from_pandas(rows, schema=schema, preserve_index=False), directory)
+
+    def _annotate(self, table: pa.Table, provenance: dict) -> pa.Table:
+        """Records the provenance of the features in the schema metadata of the table."""
+        metadata = dict(table.schema.metadata or {})
+        metadata[b"provenance"] = json.dumps(provenance, sort_keys=True).encode()
+        return table.replace_schema_metadata(metadata)
+
+    def _write(self, table: pa.Table, directory: str) -> None:
+        ds.write_dataset(
+            table,
+            directory,
+            format="parquet",
+            partitioning=ds.partitioning(
+                pa.schema([(self._partition, pa.string())]), flavor="hive"
+            ),
+            basename_template="part-{i}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      ONLINE STORE                                                #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class FeatureStore:
+    """Materializes extracted features into the local online store and serves them by key.
+
+    Feature values are stored one row per discourse in a SQLite table per feature view.
+    New feature columns are added to the table as they are first materialized. Online lookups
+    query the ids in batches and keep recently served rows in an in-process LRU cache. The
+    spaCy pipeline that produced each feature, if any, is recorded in the _provenance table.
+
+    Args:
+        filepath (str): Path to the SQLite online store. Defaults to online_store.path in
+            feature_store.yaml, relative to the project root.
+        batch_size (int): Rows per upsert batch, and ids per lookup query.
+        cache_size (int): Maximum number of rows held in the LRU cache. Zero disables it.
+    """
+
+    __config = os.path.join(ROOT, "feature_store.yaml")
+    __max_variables = 900  # Stays below SQLite's limit of 999 bound parameters per statement.
+
+    def __init__(self, filepath: str = None, batch_size: int = 10000, cache_size: int = 100000):
+        self._filepath = filepath or resolve_path(
+            YamlIO().read(FeatureStore.__config)["online_store"]["path"]
+        )
+        self._batch_size = batch_size
+        self._cache_size = cache_size
+        self._idvar = DataConfig().config["columns"]["idvar"]
+        self._lock = threading.RLock()
+        self._caches = {}
+        self._columns = {}
+
+        if os.path.dirname(self._filepath):
+            os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
+        self._connection = sqlite3.connect(self._filepath, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute(
+                """CREATE TABLE IF NOT EXISTS _provenance (
+                    view TEXT NOT NULL,
+                    feature TEXT NOT NULL,
+                    tier TEXT,
+                    model TEXT NOT NULL,
+                    version TEXT,
+                    PRIMARY KEY (view, feature)
+                )"""
+            )
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def features(self, view: str = "features") -> list:
+        """Returns the names of the features materialized in a view."""
+        return self._get_columns(view)[1:]
+
+    def provenance(self, view: str = "features") -> dict:
+        """Returns the tier, model and version of the spaCy pipeline behind each feature of a
+        view that used one."""
+        rows = self._connection.execute(
+            "SELECT feature, tier, model, version FROM _provenance WHERE view = ?", (view,)
+        ).fetchall()
+        return {
+            feature: {"tier": tier, "model": model, "version": version}
+            for feature, tier, model, version in rows
+        }
+
+    def materialize(
+        self, features: pd.DataFrame, view: str = "features", provenance: dict = None
+    ) -> int:
+        """Upserts a DataFrame of features into the online store.
+
+        Args:
+            features (pd.DataFrame): DataFrame with the idvar column and one column per feature.
+            view (str): Name of the feature view, i.e. the table in the online store.
+            provenance (dict): The spaCy pipeline behind each feature that used one, as
+                returned by ExtractionPlanner.provenance. Defaults to the 'provenance' entry
+                of features.attrs.
+
+        Returns:
+            The number of rows written.
+        """
+        names = [column for column in features.columns if column != self._idvar]
+        if provenance is None:
+            provenance = features.attrs.get("provenance", {})
+        with self._lock:
+            self._create_view(view, names)
+            self._record(view, names, provenance)
+            statement = "INSERT INTO {} ({}) VALUES ({}) ON CONFLICT({}) DO UPDATE SET {}".format(
+                _quote(view),
+                ", ".join(_quote(column) for column in [self._idvar] + names),
+                ", ".join("?" * (len(names) + 1)),
+                _quote(self._idvar),
+                ", ".join("{0} = excluded.{0}".format(_quote(name)) for name in names),
+            )
+            ids = features[self._idvar].astype(str).to_numpy(dtype=object)
+            values = features[names].to_numpy(dtype=float)
+            cache = self._caches.get(view, {})
+            for start in range(0, len(ids), self._batch_size):
+                stop = start + self._batch_size
+                rows = [
+                    (key,) + tuple(None if np.isnan(v) else v for v in row)
+                    for key, row in zip(ids[start:stop], values[start:stop].tolist())
+                ]
+                with self._connection:
+                    self._connection.executemany(statement, rows)
+                for key in ids[start:stop]:
+                    cache.pop(key, None)
+        logger.debug("Materialized {} rows into view {}.".format(len(ids), view))
+        return len(ids)
+
+    def get_online_features(
+        self, discourse_ids: list, features: list = None, view: str = "features"
+    ) -> pd.DataFrame:
+        """Returns the features for the given discourse ids, in the order requested.
+
+        Args:
+            discourse_ids (list): Identifiers of the discourses.
+            features (list): Names of the features to return. Defaults to all features.
+            view (str): Name of the feature view.
+
+        Returns:
+            DataFrame indexed by discourse id. Ids absent from the store have missing values.
+        """
+        ids = [str(key) for key in discourse_ids]
+        with self._lock:
+            columns = self._get_columns(view)
+            cache = self._caches.setdefault(view, OrderedDict())
+            rows = {}
+            for key in ids:
+                if key in cache:
+                    cache.move_to_end(key)
+                    rows[key] = cache[key]
+            missing = list(dict.fromkeys(key for key in ids if key not in rows))
+            for start in range(0, len(missing), FeatureStore.__max_variables):
+                batch = missing[start : start + FeatureStore.__max_variables]
+                statement = "SELECT * FROM {} WHERE {} IN ({})".format(
+                    _quote(view), _quote(self._idvar), ", ".join("?" * len(batch))
+                )
+                for row in self._connection.execute(statement, batch):
+                    rows[row[0]] = row[1:]
+                    self._remember(cache, row[0], row[1:])
+
+        empty = (np.nan,) * (len(columns) - 1)
+        data = pd.DataFrame(
+            [rows.get(key, empty) for key in ids],
+            index=pd.Index(ids, name=self._idvar),
+            columns=columns[1:],
+            dtype=float,
+        )
+        return data if features is None else data[features]
+
+    def _record(self, view: str, names: list, provenance: dict) -> None:
+        """Replaces the provenance of the materialized features."""
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM _provenance WHERE view = ? AND feature = ?",
+                [(view, name) for name in names],
+            )
+            self._connection.executemany(
+                "INSERT INTO _provenance VALUES (?, ?, ?, ?, ?)",
+                [
+                    (view, name, entry.get("tier"), entry["model"], entry.get("version"))
+                    for name, entry in provenance.items()
+                    if name in names
+                ],
+            )
+
+    def _remember(self, cache: OrderedDict, key: str, row: tuple) -> None:
+        if self._cache_size > 0:
+            cache[key] = row
+            if len(cache) > self._cache_size:
+                cache.popitem(last=False)
+
+    def _get_columns(self, view: str) -> list:
+        if view not in self._columns:
+            info = self._connection.execute("PRAGMA table_info({})".format(_quote(view)))
+            self._columns[view] = [row[1] for row in info]
+        if not self._columns[view]:
+            del self._columns[view]
+            raise KeyError("Feature view {} has not been materialized.".format(view))
+        return self._columns[view]
+
+    def _create_view(self, view: str, names: list) -> None:
+        """Creates the view table, or adds any feature columns it does not yet have."""
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS {} ({} TEXT PRIMARY KEY)".format(
+                    _quote(view), _quote(self._idvar)
+                )
+            )
+            self._columns.pop(view, None)
+            existing = self._get_columns(view)
+            added = [name for name in names if name not in existing]
+            for name in added:
+                self._connection.execute(
+                    "ALTER TABLE {} ADD COLUMN {} REAL".format(_quote(view), _quote(name))
+                )
+        if added:
+            # Cached rows no longer match the table's columns.
+            self._columns.pop(view, None)
+            self._caches.pop(view, None)
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+def _quote(identifier: str) -> str:
+    """Quotes an SQL identifier."""
+    return '"{}"'.format(str(identifier).replace('"', '""'))
@@ -10,7 +10,7 @@
 # URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Friday July 29th 2022 12:41:04 am                                                   #
-# Modified   : Monday August 15th 2022 05:42:39 pm                                                 #
+# Modified   : Saturday October 17th 2026 12:50:00 am                                              #
 # ------------------------------------------------------------------------------------------------ #
 # License    : BSD 3-clause "New" or "Revised" License                                             #
 # Copyright  : (c) 2022 John James                                                                 #
@@ -18,64 +18,222 @@
 """Configuration Module"""
 from abc import ABC
 import os
+import copy
+import threading
 from dotenv import load_dotenv
 
 from aes.utils.io import IOFactory
 
 # ------------------------------------------------------------------------------------------------ #
+# Project root, used to resolve the default configuration filepaths when no .env entry exists.
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# ------------------------------------------------------------------------------------------------ #
+
+
+def resolve_path(path: str) -> str:
+    """Returns the path unchanged if absolute, otherwise joined onto the project root.
+
+    Filepaths in the configuration files are relative to the project root, so they must not
+    depend on the working directory of the process reading them.
+    """
+    return path if os.path.isabs(path) else os.path.join(ROOT, path)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    READ ONLY VIEWS                                               #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ReadOnlyDict(dict):
+    """Dictionary view of cached configuration data that rejects mutation.
+
+    It subclasses dict so that consumers such as logging.config.dictConfig accept it. Use
+    Config.to_dict() to obtain a mutable copy.
+    """
+
+    def _readonly(self, *args, **kwargs) -> None:
+        raise TypeError("Configuration data is read-only. Use Config.to_dict() for a copy.")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return thaw(self)
+
+    def __reduce__(self) -> tuple:
+        return (dict, (dict(self),))
+
+
+def freeze(data: object) -> object:
+    """Returns a read-only view of nested configuration data. Lists become tuples."""
+    if isinstance(data, dict):
+        return ReadOnlyDict({k: freeze(v) for k, v in data.items()})
+    elif isinstance(data, (list, tuple)):
+        return tuple(freeze(v) for v in data)
+    return data
+
+
+def thaw(data: object) -> object:
+    """Returns a mutable deep copy of frozen configuration data."""
+    if isinstance(data, dict):
+        return {k: thaw(v) for k, v in data.items()}
+    elif isinstance(data, tuple):
+        return [thaw(v) for v in data]
+    return copy.deepcopy(data)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     CONFIG CACHE                                                 #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ConfigCache:
+    """Process-wide cache of parsed configuration files.
+
+    Each file is parsed once and held as a read-only view. A file is parsed again only when
+    its modification time or size changes on disk.
+    """
+
+    def __init__(self) -> None:
+        self._entries = {}  # filepath -> (mtime_ns, size, data)
+        self._lock = threading.Lock()
+
+    def get(self, filepath: str) -> ReadOnlyDict:
+        """Returns the read-only configuration data for the file, parsing it if stale."""
+        stat = os.stat(filepath)
+        entry = self._entries.get(filepath)
+        if entry is None or entry[:2] != (stat.st_mtime_ns, stat.st_size):
+            with self._lock:
+                entry = self._entries.get(filepath)
+                if entry is None or entry[:2] != (stat.st_mtime_ns, stat.st_size):
+                    data = self._parse(filepath)
+                    entry = (stat.st_mtime_ns, stat.st_size, data)
+                    self._entries[filepath] = entry
+        return entry[2]
+
+    def invalidate(self, filepath: str = None) -> None:
+        """Drops the cached data for a file, or for every file if no filepath is given."""
+        with self._lock:
+            if filepath is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(filepath, None)
+
+    def _parse(self, filepath: str) -> ReadOnlyDict:
+        fileformat = os.path.splitext(filepath)[1].replace(".", "")
+        data = IOFactory().io(fileformat=fileformat).read(filepath)
+        return freeze(data if data is not None else {})
+
+
+_cache = ConfigCache()
+_environment = threading.Event()
+
+
+def _load_environment() -> None:
+    """Loads the .env entries into the environment once per process."""
+    if not _environment.is_set():
+        load_dotenv()
+        _environment.set()
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        CONFIG                                                    #
+# ------------------------------------------------------------------------------------------------ #
 
 
 class Config(ABC):
-    """Base class defining read / write access to configuration files."""
+    """Base class defining read / write access to configuration files.
 
-    def __init__(self, name: str) -> None:
+    Configuration filepaths are read from the environment variable given by name, falling back
+    to the default filepath under the project config directory. The data is served from the
+    process-wide ConfigCache as a read-only view.
+
+    Args:
+        name (str): Environment variable holding the configuration filepath.
+        default (str): Filepath relative to the project root used if the variable is unset.
+    """
+
+    def __init__(self, name: str, default: str = None) -> None:
         self._filepath = None
         self._io = None
-        self._config = None
-        self._initialize(name)
+        self._initialize(name, default)
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
 
     @property
-    def config(self) -> dict:
-        return self._config
+    def config(self) -> ReadOnlyDict:
+        return _cache.get(self._filepath)
 
     @config.setter
     def config(self, config: dict) -> None:
-        self._config = config
-        self.save()
+        self.save(config)
 
-    def load(self) -> list:
-        """Reads data from a yaml file."""
-        self._config = self._io.read(self._filepath)
+    def read(self) -> ReadOnlyDict:
+        """Returns the configuration data."""
+        return self.config
 
-    def save(self) -> None:
+    def to_dict(self) -> dict:
+        """Returns a mutable copy of the configuration data."""
+        return thaw(self.config)
+
+    def load(self) -> ReadOnlyDict:
+        """Reads data from a yaml file, bypassing the cache."""
+        _cache.invalidate(self._filepath)
+        return self.config
+
+    def save(self, config: dict = None) -> None:
         """Writes config data to a yaml file."""
-        self._io.write(data=self._config, filepath=self._filepath)
+        config = thaw(self.config if config is None else config)
+        self._io.write(data=config, filepath=self._filepath)
+        _cache.invalidate(self._filepath)
 
-    def _initialize(self, name: str) -> None:
-        """Initializes the Config object with an io object, a filepath, and the config data."""
+    def _initialize(self, name: str, default: str = None) -> None:
+        """Initializes the Config object with an io object and a filepath."""
 
         # Config filepaths are stored in the environment variables.
-        load_dotenv()
-        self._filepath = os.getenv(name)
+        _load_environment()
+        self._filepath = os.getenv(name) or (default and resolve_path(default))
+        if self._filepath is None:
+            raise ValueError("Configuration filepath {} is not set.".format(name))
 
         # Extract the file format from the filepath
-        fileformat = os.path.splitext(self._filepath)[1].replace(".", " ")
+        fileformat = os.path.splitext(self._filepath)[1].replace(".", "")
 
         # Use the fileformat to obtain an io object.
         self._io = IOFactory().io(fileformat=fileformat)
 
-        # Load the configuration data
-        self._config = self._io.read(self._filepath)
+
+# ------------------------------------------------------------------------------------------------ #
+class DataConfig(Config):
+
+    __CONFIG_NAME = "CONFIG_DATA"
+    __DEFAULT = "config/data.yml"
+
+    def __init__(self) -> None:
+        name = DataConfig.__CONFIG_NAME
+        super(DataConfig, self).__init__(name=name, default=DataConfig.__DEFAULT)
 
 
 # ------------------------------------------------------------------------------------------------ #
 class FP2021Config(Config):
 
     __CONFIG_NAME = "CONFIG_DATA_FP2021"
+    __DEFAULT = "config/fp2021.yml"
 
     def __init__(self) -> None:
         name = FP2021Config.__CONFIG_NAME
-        super(FP2021Config, self).__init__(name=name)
+        super(FP2021Config, self).__init__(name=name, default=FP2021Config.__DEFAULT)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -84,10 +242,11 @@ class FP2021Config(Config):
 class FP2022Config(Config):
 
     __CONFIG_NAME = "CONFIG_DATA_FP2022"
+    __DEFAULT = "config/fp2022.yml"
 
     def __init__(self) -> None:
         name = FP2022Config.__CONFIG_NAME
-        super(FP2022Config, self).__init__(name=name)
+        super(FP2022Config, self).__init__(name=name, default=FP2022Config.__DEFAULT)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -96,10 +255,11 @@ class FP2022Config(Config):
 class LogConfig(Config):
 
     __CONFIG_NAME = "CONFIG_LOG"
+    __DEFAULT = "config/logging.yml"
 
     def __init__(self) -> None:
         config = LogConfig.__CONFIG_NAME
-        super(LogConfig, self).__init__(config)
+        super(LogConfig, self).__init__(config, default=LogConfig.__DEFAULT)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -108,6 +268,21 @@ class LogConfig(Config):
 class SpacyConfig(Config):
 
     __CONFIG_NAME = "CONFIG_SPACY"
+    __DEFAULT = "config/spacy.yml"
 
     def __init__(self) -> None:
         self._config_name = SpacyConfig.__CONFIG_NAME
+        super(SpacyConfig, self).__init__(self._config_name, default=SpacyConfig.__DEFAULT)
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+class VisualConfig(Config):
+
+    __CONFIG_NAME = "CONFIG_VISUAL"
+    __DEFAULT = "config/visual.yml"
+
+    def __init__(self) -> None:
+        name = VisualConfig.__CONFIG_NAME
+        super(VisualConfig, self).__init__(name=name, default=VisualConfig.__DEFAULT)
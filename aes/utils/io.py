@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Sunday August 14th 2022 01:56:55 am                                                 #
-# Modified   : Monday August 15th 2022 05:44:54 pm                                                 #
+# Modified   : Friday October 16th 2026 11:20:00 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : BSD 3-clause "New" or "Revised" License                                             #
 # Copyright  : (c) 2022 John James                                                                 #
@@ -20,8 +20,10 @@ from abc import ABC, abstractmethod
 import os
 import pickle
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import yaml
-from typing import Union
+from typing import Iterator, Union
 
 # ------------------------------------------------------------------------------------------------ #
 
@@ -88,8 +90,10 @@ class CsvIO(IO):
 
 class YamlIO(IO):
     def read(self, filepath: str, **kwargs) -> Union[pd.DataFrame, dict]:
+        # The libyaml based loader is several times faster than the pure Python loader.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         with open(filepath, "r") as file:
-            return yaml.SafeLoader(stream=file)
+            return yaml.load(file, Loader=loader)
 
     def write(self, data: Union[pd.DataFrame, dict], filepath: str, **kwargs) -> None:
 
@@ -119,10 +123,38 @@ class PickleIO(IO):
 # ------------------------------------------------------------------------------------------------ #
 
 
+class ParquetIO(IO):
+    def read(self, filepath: str, **kwargs) -> Union[pd.DataFrame, dict]:
+
+        columns = kwargs.get("columns", None)
+
+        return pd.read_parquet(filepath, engine="pyarrow", columns=columns)
+
+    def write(self, data: Union[pd.DataFrame, dict], filepath: str, **kwargs) -> None:
+
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+        index = kwargs.get("index", None)
+        compression = kwargs.get("compression", "snappy")
+
+        data.to_parquet(filepath, engine="pyarrow", index=index, compression=compression)
+
+    def iter_batches(self, filepath: str, **kwargs) -> Iterator[pa.RecordBatch]:
+        """Reads the file as a stream of record batches, one batch in memory at a time."""
+
+        batch_size = kwargs.get("batch_size", 10000)
+        columns = kwargs.get("columns", None)
+
+        yield from pq.ParquetFile(filepath).iter_batches(batch_size=batch_size, columns=columns)
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
 class IOFactory:
     """IO Factory"""
 
-    __io = {"csv": CsvIO(), "yml": YamlIO(), "pickle": PickleIO()}
+    __io = {"csv": CsvIO(), "yml": YamlIO(), "pickle": PickleIO(), "parquet": ParquetIO()}
 
     def io(self, fileformat: str) -> IO:
         try:
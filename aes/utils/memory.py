@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /memory.py                                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:09:42 am                                              #
+# Modified   : Saturday October 17th 2026 12:53:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Compact dtype selection and memory accounting for DataFrames."""
+import numpy as np
+import pandas as pd
+
+# ------------------------------------------------------------------------------------------------ #
+ARROW_STRING = pd.StringDtype(storage="pyarrow")
+# ------------------------------------------------------------------------------------------------ #
+
+
+def compact_series(series: pd.Series, categorical_threshold: float = 0.5) -> pd.Series:
+    """Returns the series converted to the smallest dtype that holds its values.
+
+    Integer columns, including nullable integers with missing values, become the smallest
+    unsigned or signed integer type of the same kind. Floats always become float32, so a
+    float column is never turned into an integer one. Strings become categoricals when the
+    number of distinct values is at most categorical_threshold times the length, and Arrow
+    backed strings otherwise.
+
+    Args:
+        series (pd.Series): The column to convert.
+        categorical_threshold (float): Maximum ratio of distinct values to rows for a
+            string column to be stored as a categorical.
+    """
+    if pd.api.types.is_bool_dtype(series) or isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    if pd.api.types.is_float_dtype(series):
+        nullable = pd.api.types.is_extension_array_dtype(series)
+        return series.astype("Float32" if nullable else np.float32)
+    if pd.api.types.is_numeric_dtype(series):
+        values = series.dropna()
+        if len(values) == 0:
+            return series
+        downcast = "unsigned" if values.min() >= 0 else "integer"
+        return pd.to_numeric(series, downcast=downcast)
+    if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+        if series.nunique(dropna=True) <= categorical_threshold * len(series):
+            return series.astype("category")
+        return series.astype(ARROW_STRING)
+    return series
+
+
+def compact_dtypes(data: pd.DataFrame, categorical_threshold: float = 0.5) -> pd.DataFrame:
+    """Returns a copy of the DataFrame with each column converted by compact_series."""
+    return pd.DataFrame(
+        {
+            column: compact_series(data[column], categorical_threshold=categorical_threshold)
+            for column in data.columns
+        },
+        index=data.index,
+    )
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """Compares the memory used by each column of two versions of a DataFrame.
+
+    Args:
+        before (pd.DataFrame): The original DataFrame.
+        after (pd.DataFrame): The DataFrame after conversion.
+
+    Returns:
+        DataFrame indexed by column with the dtype and bytes before and after, the reduction
+        factor, and a final 'total' row.
+    """
+    report = pd.DataFrame(
+        {
+            "dtype_before": before.dtypes.astype(str),
+            "bytes_before": before.memory_usage(index=False, deep=True),
+            "dtype_after": after.dtypes.astype(str),
+            "bytes_after": after.memory_usage(index=False, deep=True),
+        }
+    )
+    report.loc["total"] = ["", report["bytes_before"].sum(), "", report["bytes_after"].sum()]
+    report["bytes_before"] = report["bytes_before"].astype(np.int64)
+    report["bytes_after"] = report["bytes_after"].astype(np.int64)
+    report["reduction"] = report["bytes_before"] / report["bytes_after"].clip(lower=1)
+    return report
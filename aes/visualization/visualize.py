@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Tuesday August 2nd 2022 08:08:36 pm                                                 #
-# Modified   : Sunday August 14th 2022 01:55:35 am                                                 #
+# Modified   : Saturday October 17th 2026 12:08:37 am                                              #
 # ------------------------------------------------------------------------------------------------ #
 # License    : BSD 3-clause "New" or "Revised" License                                             #
 # Copyright  : (c) 2022 John James                                                                 #
@@ -88,7 +88,7 @@ class Histogram(Visualizer):
         title: str = None,
         xlab: str = None,
         ylab: str = None,
-    ) -> Union(plt.figure, plt.axes):
+    ) -> Union[plt.figure, plt.axes]:
         """Plots all the data."""
         fig, ax = plt.subplots(1, 1, figsize=self._config["visual"]["figsize"]["medium"])
         fig = sns.distplot(data, x=x)
@@ -165,7 +165,7 @@ class Boxplot(Visualizer):
         title: str = None,
         xlab: str = None,
         ylab: str = None,
-    ) -> Union(plt.figure, plt.axes):
+    ) -> Union[plt.figure, plt.axes]:
         """Plots all the data."""
         fig, ax = plt.subplots(1, 1, figsize=self._config["visual"]["figsize"]["medium"])
         fig = sns.distplot(data, x=x)
@@ -10,13 +10,15 @@
 # URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Friday July 29th 2022 02:25:41 am                                                   #
-# Modified   : Wednesday August 17th 2022 12:40:50 am                                              #
+# Modified   : Saturday October 17th 2026 12:54:00 am                                              #
 # ------------------------------------------------------------------------------------------------ #
 # License    : BSD 3-clause "New" or "Revised" License                                             #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 """Includes fixtures, classes and functions supporting testing."""
+import os
 import pytest
+import yaml
 import pandas as pd
 
 # ------------------------------------------------------------------------------------------------ #
@@ -38,3 +40,43 @@ def data():
 @pytest.fixture(scope="module")
 def test_data_foldere():
     return "tests/testdata"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          CONFIG                                                  #
+# ------------------------------------------------------------------------------------------------ #
+
+
+@pytest.fixture
+def data_config(tmp_path, monkeypatch):
+    """Data configuration whose persisted feature artifacts are written under tmp_path."""
+    with open(os.path.join("config", "data.yml")) as file:
+        config = yaml.safe_load(file)
+    config["vocabulary"]["filepath"] = str(tmp_path / "vocabulary.parquet")
+    config["semantic"]["index"] = str(tmp_path / "exemplar_index")
+    config["readability"]["syllables"] = str(tmp_path / "syllables.pkl")
+    filepath = str(tmp_path / "data.yml")
+    with open(filepath, "w") as file:
+        yaml.safe_dump(config, file)
+    monkeypatch.setenv("CONFIG_DATA", filepath)
+    return config
+
+
+@pytest.fixture
+def spacy_config(tmp_path, monkeypatch):
+    """spaCy configuration whose md and trf tiers are blank pipelines and whose sm tier is
+    not installed. Parsed documents are cached under tmp_path."""
+    spacy = pytest.importorskip("spacy")
+    with open(os.path.join("config", "spacy.yml")) as file:
+        config = yaml.safe_load(file)
+    config["cache"]["directory"] = str(tmp_path / "docbin")
+    os.makedirs(tmp_path / "models")
+    for tier in config["models"]["tiers"]:
+        tier["model"] = str(tmp_path / "models" / tier["name"])
+        if tier["name"] != "sm":
+            spacy.blank("en").to_disk(tier["model"])
+    filepath = str(tmp_path / "spacy.yml")
+    with open(filepath, "w") as file:
+        yaml.safe_dump(config, file)
+    monkeypatch.setenv("CONFIG_SPACY", filepath)
+    return config
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_docbin.py                                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:28:53 am                                              #
+# Modified   : Saturday October 17th 2026 01:10:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+import pytest
+import logging
+import logging.config
+
+from aes.utils.config import LogConfig, ROOT
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+spacy = pytest.importorskip("spacy")
+from spacy.tokens import Doc  # noqa: E402
+from aes.data.docbin import DocCache  # noqa: E402
+
+# ------------------------------------------------------------------------------------------------ #
+TEXTS = ["Dogs bark.", "Cats meow loudly.", "Yes", "No way", "Students should vote!"]
+
+
+@pytest.fixture
+def nlp(tmp_path):
+    if not Doc.has_extension("discourse_id"):
+        Doc.set_extension("discourse_id", default=None)
+    directory = str(tmp_path / "blank_en")
+    spacy.blank("en").to_disk(directory)
+    return directory
+
+
+# ================================================================================================ #
+#                                        TEST DOC CACHE                                            #
+# ================================================================================================ #
+
+
+@pytest.mark.docbin
+class TestDocCache:
+    def test_key(self, nlp, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        cache = DocCache(str(tmp_path / "docbin"))
+        key = cache.key(TEXTS, nlp, exclude=["ner"])
+        assert key == cache.key(list(TEXTS), nlp, exclude=["ner"])
+        assert key != cache.key(TEXTS[:-1] + ["Students should vote."], nlp, exclude=["ner"])
+        assert key != cache.key(TEXTS, nlp, exclude=["ner", "parser"])
+        assert key != cache.key(TEXTS, nlp, exclude=["ner"], ids=range(5))
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_save_load(self, nlp, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        cache = DocCache(str(tmp_path / "docbin"), shard_size=2)
+        key = cache.key(TEXTS, nlp)
+
+        def parse():
+            for i, doc in enumerate(spacy.load(nlp).pipe(TEXTS)):
+                doc._.discourse_id = "d{}".format(i)
+                yield doc
+
+        # A partially consumed save leaves no entry behind.
+        partial = cache.save(key, parse())
+        next(partial)
+        partial.close()
+        assert key not in cache and os.listdir(cache.directory) == []
+
+        docs = list(cache.save(key, parse(), metadata={"model": "blank_en"}))
+        assert key in cache and cache.keys == [key]
+        manifest = cache.manifest(key)
+        assert manifest["docs"] == 5 and manifest["model"] == "blank_en"
+        assert len(manifest["shards"]) == 3 and all(map(os.path.exists, cache.shards(key)))
+
+        assert [len(shard) for shard in cache.iter_shards(key)] == [2, 2, 1]
+        loaded = list(cache.load(key))
+        assert [doc.text for doc in loaded] == [doc.text for doc in docs] == TEXTS
+        assert [doc._.discourse_id for doc in loaded] == ["d0", "d1", "d2", "d3", "d4"]
+
+        cache.invalidate(key)
+        assert key not in cache
+
+        # The configured cache directory is relative to the project root.
+        assert DocCache().directory == os.path.join(ROOT, "data", "interim", "docbin")
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
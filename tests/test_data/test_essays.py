@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_essays.py                                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:37:23 am                                              #
+# Modified   : Saturday October 17th 2026 01:10:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+import pandas as pd
+
+from aes.utils.config import LogConfig, ROOT
+from aes.data.essays import DiscourseSpans, EssayStore, align
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+ESSAY = "Students should vote.  Voting matters\nto everyone. It is a duty."
+
+
+@pytest.fixture
+def discourses(tmp_path):
+    directory = tmp_path / "essays"
+    directory.mkdir()
+    (directory / "e.txt").write_text(ESSAY, encoding="utf-8")
+    data = pd.DataFrame(
+        {
+            "discourse_id": ["a", "b", "c", "d"],
+            "essay_id": ["e", "e", "f", "e"],
+            "discourse_text": [
+                "Students should vote. ",
+                "Voting matters to everyone.",
+                "No essay file.",
+                "It is a duty.",
+            ],
+        }
+    )
+    return data, EssayStore(str(directory))
+
+
+# ================================================================================================ #
+#                                     TEST DISCOURSE SPANS                                         #
+# ================================================================================================ #
+
+
+@pytest.mark.essays
+class TestDiscourseSpans:
+    def test_align(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        offsets = align(ESSAY, ["Students should vote.", "Voting matters to everyone.", "Nope"])
+        assert ESSAY[slice(*offsets[0])] == "Students should vote."
+        # Matched regardless of the newline in the essay.
+        assert ESSAY[slice(*offsets[1])] == "Voting matters\nto everyone."
+        assert offsets[2] is None
+        # A repeated text is found after the previous match.
+        assert align("a b a b", ["a b", "a b"]) == [(0, 3), (4, 7)]
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_from_frame(self, discourses, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        data, essays = discourses
+        spans = DiscourseSpans.from_frame(data, essays=essays)
+        assert len(spans) == 4
+        assert spans.texts == [ESSAY, "No essay file."]
+        assert spans.unit_ids == ["e", "f"]
+        assert spans.units.tolist() == [0, 0, 1, 0]
+        assert spans.aligned.tolist() == [True, True, False, True]
+        assert ESSAY[spans.starts[3]:spans.ends[3]] == "It is a duty."
+
+        # Offsets given with the data are used as they are.
+        data = data.assign(discourse_start=[0, 23, 0, 51], discourse_end=[21, 50, 14, 64])
+        spans = DiscourseSpans.from_frame(data, essays=essays)
+        assert spans.starts.tolist() == [0, 23, 0, 51]
+
+        # The configured essay directory is relative to the project root.
+        assert EssayStore().directory == os.path.join(ROOT, "data", "fp2022", "raw", "train")
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_slice(self, discourses, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        spacy = pytest.importorskip("spacy")
+        nlp = spacy.blank("en")
+        data, essays = discourses
+        spans = DiscourseSpans.from_frame(data, essays=essays)
+        parsed = []
+
+        def pipe():
+            for doc in nlp.pipe(spans.texts):
+                parsed.append(doc)
+                yield doc
+
+        docs = list(spans.slice(pipe()))
+        assert len(parsed) == 2
+        assert [doc.text.rstrip() for doc in docs] == [
+            "Students should vote.",
+            "Voting matters\nto everyone.",
+            "No essay file.",
+            "It is a duty.",
+        ]
+        assert [doc._.discourse_id for doc in docs] == ["a", "b", "c", "d"]
+        assert docs[2]._.essay_id == "f"
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_planner(self, discourses, spacy_config, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        from aes.data.docbin import DocCache
+        from aes.features.extraction.planner import ExtractionPlanner
+
+        data, essays = discourses
+        planner = ExtractionPlanner(names=["noun_count", "word_count"])
+        features = planner.extract(data, essays=essays)
+        assert features["discourse_id"].tolist() == ["a", "b", "c", "d"]
+        assert np.array_equal(features["noun_count"], [0, 0, 0, 0])
+        # The cached parse holds the essay and the discourse without one, not four texts.
+        cache = DocCache()
+        (key,) = cache.keys
+        assert sum(len(docs) for docs in cache.iter_shards(key)) == 2
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_models.py                                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:33:55 am                                              #
+# Modified   : Saturday October 17th 2026 01:00:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import shutil
+import pytest
+import logging
+import logging.config
+import numpy as np
+import pandas as pd
+
+from aes.utils.config import LogConfig
+from aes.data.models import ModelSelector
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+
+
+# ================================================================================================ #
+#                                     TEST MODEL SELECTOR                                          #
+# ================================================================================================ #
+
+
+@pytest.mark.models
+class TestModelSelector:
+    def test_select(self, spacy_config, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        selector = ModelSelector()
+        assert [tier.name for tier in selector.tiers] == ["sm", "md", "trf"]
+        # The sm tier is not installed, so md is the cheapest tier meeting 'sm'.
+        assert selector.select([]).name == "md"
+        assert selector.select(["sm", None]).name == "md"
+        assert selector.select(["sm", "md"]).name == "md"
+        assert selector.select(["trf"]).name == "trf"
+        assert selector.select(["md"]).provenance()["version"] == "0.0.0"
+        with pytest.raises(ValueError):
+            selector.select(["lg"])
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_fallback(self, spacy_config, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        selector = ModelSelector()
+        shutil.rmtree(selector.tier("trf").model)
+        assert selector.select(["trf"]).name == "md"
+        shutil.rmtree(selector.tier("md").model)
+        with pytest.raises(OSError):
+            selector.select(["sm"])
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_planner(self, spacy_config, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        from aes.features.extraction.planner import ExtractionPlanner
+
+        planner = ExtractionPlanner(names=["noun_count", "verb_compliment_counts", "word_count"])
+        assert planner.model.name == "md"
+        provenance = planner.provenance
+        assert sorted(provenance) == ["noun_count", "verb_compliment_counts"]
+        assert provenance["noun_count"]["model"] == spacy_config["models"]["tiers"][1]["model"]
+
+        results = planner.run(["Dogs bark.", "Yes"])
+        assert np.array_equal(results["noun_count"], [0, 0])
+        assert ExtractionPlanner(names=["word_count"]).provenance == {}
+
+        data = pd.DataFrame({"discourse_id": ["a", "b"], "discourse_text": ["Dogs bark.", "Yes"]})
+        assert planner.extract(data).attrs["provenance"] == provenance
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_feature_set(self, spacy_config, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        from aes.features.base import Feature
+        from aes.features.feature_set import FeatureSet
+
+        data = pd.DataFrame({"discourse_id": ["a", "b"], "discourse_text": ["Dogs bark.", "Yes"]})
+        features = FeatureSet(data)
+        features.add_feature(Feature("noun_count", "syntactic"))
+        features.add_feature(Feature("word_count", "length"))
+        features.extract()
+        assert sorted(features.provenance) == ["noun_count"]
+        assert features.provenance["noun_count"]["tier"] == "md"
+        assert features.get_features().attrs["provenance"] == features.provenance
+        assert features.get_features(category="length").attrs["provenance"] == {}
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
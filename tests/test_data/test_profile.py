@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_profile.py                                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:27:04 am                                              #
+# Modified   : Saturday October 17th 2026 01:10:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import shutil
+import pytest
+import logging
+import logging.config
+import pandas as pd
+
+from aes.utils.config import LogConfig
+from aes.data.dataset import Dataset
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+spacy = pytest.importorskip("spacy")
+from aes.data.docbin import DocCache  # noqa: E402
+from aes.data.essays import EssayStore  # noqa: E402
+from aes.data.profile import ProfileBuilder, required_components  # noqa: E402
+
+# ------------------------------------------------------------------------------------------------ #
+TEXTS = ["Dogs bark. Cats meow.", "Students should vote!", "Yes"]
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    filepath = str(tmp_path / "train.csv")
+    pd.DataFrame(
+        {
+            "discourse_id": ["a", "b", "c"],
+            "essay_id": ["e", "e", "f"],
+            "discourse_text": TEXTS,
+            "discourse_type": ["Claim", "Position", "Claim"],
+            "discourse_effectiveness": ["Adequate", "Effective", "Ineffective"],
+        }
+    ).to_csv(filepath, index=False)
+    return Dataset(name="train", stage="raw", filepath=filepath)
+
+
+@pytest.fixture
+def model(tmp_path):
+    directory = str(tmp_path / "blank_en")
+    spacy.blank("en").to_disk(directory)
+    return directory
+
+
+# ================================================================================================ #
+#                                     TEST PROFILE BUILDER                                         #
+# ================================================================================================ #
+
+
+@pytest.mark.profile
+class TestProfileBuilder:
+    def test_required_components(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        assert required_components(["token.text", "token.is_alpha"]) == set()
+        required = required_components(["token.pos_", "token.is_sent_start"])
+        assert {"tagger", "senter", "tok2vec", "transformer"} <= required
+        assert "parser" not in required and "ner" not in required
+        assert "parser" in required_components(["token.dep_"])
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_build(self, dataset, model, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        cache = DocCache(str(tmp_path / "docbin"))
+        builder = ProfileBuilder(n_process=1, batch_size=2, model=model, cache=cache)
+        builder.dataset = dataset
+        builder.build()
+
+        token_data = builder.profile.token_data
+        assert token_data["discourse_id"].tolist()[:6] == ["a"] * 6
+        assert len(token_data) == 6 + 4 + 1
+        # Sentence boundaries come from the sentencizer added in place of the missing senter.
+        assert token_data["is_sent_start"].tolist()[:4] == [True, False, False, True]
+        assert "vocab" not in token_data.columns
+        assert "ner" in builder.disabled and "parser" not in builder.disabled
+        assert builder.throughput > 0
+
+        assert builder.cached is False and len(cache.keys) == 1
+
+        builder.dataset = dataset
+        assert builder.profile is None and builder.throughput is None
+
+        # The second build reads the parsed Docs from the cache.
+        builder.build()
+        assert builder.cached is True
+        assert builder.profile.token_data.equals(token_data)
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_selection(self, dataset, spacy_config, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        builder = ProfileBuilder(n_process=1, batch_size=2)
+        builder.dataset = dataset
+        builder.build()
+        assert builder.model["tier"] == "md"
+
+        # The model is selected again on each build rather than fixed by the first.
+        shutil.rmtree(spacy_config["models"]["tiers"][1]["model"])
+        builder.dataset = dataset
+        builder.build()
+        assert builder.model["tier"] == "trf"
+        assert builder.cached is False
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_build_essays(self, dataset, model, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        directory = tmp_path / "essays"
+        directory.mkdir()
+        (directory / "e.txt").write_text(TEXTS[0] + " " + TEXTS[1], encoding="utf-8")
+        (directory / "f.txt").write_text(TEXTS[2], encoding="utf-8")
+
+        cache = DocCache(str(tmp_path / "docbin"))
+        builder = ProfileBuilder(
+            n_process=1,
+            batch_size=2,
+            model=model,
+            cache=cache,
+            unit="essay",
+            essays=EssayStore(str(directory)),
+        )
+        builder.dataset = dataset
+        builder.build()
+
+        # Two essays are parsed and the three discourses sliced from them.
+        assert builder.spans.unit_ids == ["e", "f"]
+        token_data = builder.profile.token_data
+        assert token_data["discourse_id"].tolist() == ["a"] * 6 + ["b"] * 4 + ["c"]
+        assert token_data["i"].tolist()[6:10] == [0, 1, 2, 3]
+        assert bool(token_data["is_sent_start"].tolist()[6]) is True
+
+        with pytest.raises(ValueError):
+            ProfileBuilder(model=model, cache=cache, unit="sentence")
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_build_offsets(self, model, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        # The essay was edited after the discourse was annotated, so its text cannot be
+        # aligned with the essay and only the offsets given with the data locate it.
+        directory = tmp_path / "essays"
+        directory.mkdir()
+        (directory / "e.txt").write_text("Dogs barked. Cats meow. Students vote!", "utf-8")
+        filepath = str(tmp_path / "train.csv")
+        pd.DataFrame(
+            {
+                "discourse_id": ["a", "b"],
+                "essay_id": ["e", "e"],
+                "discourse_text": TEXTS[:2],
+                "discourse_type": ["Claim", "Position"],
+                "discourse_effectiveness": ["Adequate", "Effective"],
+                "discourse_start": [0, 24],
+                "discourse_end": [23, 38],
+            }
+        ).to_csv(filepath, index=False)
+
+        builder = ProfileBuilder(
+            n_process=1,
+            model=model,
+            cache=DocCache(str(tmp_path / "docbin")),
+            unit="essay",
+            essays=EssayStore(str(directory)),
+        )
+        builder.dataset = Dataset(name="train", stage="raw", filepath=filepath)
+        builder.build()
+        assert builder.spans.aligned.tolist() == [True, True]
+        assert builder.spans.unit_ids == ["e"]
+        assert builder.spans.starts.tolist() == [0, 24]
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_token_table.py                                                                #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:30:47 am                                              #
+# Modified   : Saturday October 17th 2026 01:10:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+
+from aes.utils.config import LogConfig
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+spacy = pytest.importorskip("spacy")
+from spacy.tokens import Doc  # noqa: E402
+from aes.data.token_table import TokenTable  # noqa: E402
+
+# ------------------------------------------------------------------------------------------------ #
+ATTRIBUTES = [
+    "doc._.discourse_id",
+    "token.i",
+    "token.text",
+    "token.pos_",
+    "token.pos",
+    "token.dep_",
+    "token.head",
+    "token.sent",
+    "token.is_sent_start",
+    "token.is_sent_end",
+    "token.is_punct",
+    "token.vocab",
+]
+
+
+@pytest.fixture
+def docs():
+    if not Doc.has_extension("discourse_id"):
+        Doc.set_extension("discourse_id", default=None)
+    vocab = spacy.blank("en").vocab
+    first = Doc(
+        vocab,
+        words=["Dogs", "bark", ".", "Cats", "meow", "."],
+        pos=["NOUN", "VERB", "PUNCT", "NOUN", "VERB", "PUNCT"],
+        deps=["nsubj", "ROOT", "punct", "nsubj", "ROOT", "punct"],
+        heads=[1, 1, 1, 4, 4, 4],
+        sent_starts=[True, False, False, True, False, False],
+    )
+    second = Doc(vocab, words=["Yes"], pos=["INTJ"], deps=["ROOT"], heads=[0])
+    empty = Doc(vocab, words=[])
+    for doc, discourse_id in zip([first, second, empty], ["a", "b", "c"]):
+        doc._.discourse_id = discourse_id
+    return [first, second, empty]
+
+
+# ================================================================================================ #
+#                                       TEST TOKEN TABLE                                           #
+# ================================================================================================ #
+
+
+@pytest.mark.profile
+class TestTokenTable:
+    def test_from_docs(self, docs, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        table = TokenTable.from_docs(docs, ATTRIBUTES)
+        assert len(table) == 7 and table.n_docs == 3
+        assert table.offsets.tolist() == [0, 6, 7, 7]
+        assert "vocab" not in table.columns
+        assert table.column("pos").dtype == np.uint64
+        assert table.column("i").tolist() == [0, 1, 2, 3, 4, 5, 0]
+        assert table.column("sent").tolist() == [0, 0, 0, 3, 3, 3, 0]
+        assert table.column("head").tolist() == [1, 0, -1, 1, 0, -1, 0]
+        assert table.column("is_sent_end").tolist() == [0, 0, 1, 0, 0, 1, 1]
+        assert list(table.decode("dep")) == ["nsubj", "ROOT", "punct"] * 2 + ["ROOT"]
+
+        data = table.to_pandas()
+        tokens = [token for doc in docs for token in doc]
+        assert data["discourse_id"].tolist() == ["a"] * 6 + ["b"]
+        for attribute in ["text", "pos_", "pos", "is_sent_start", "is_sent_end", "is_punct"]:
+            assert data[attribute].tolist() == [getattr(t, attribute) for t in tokens]
+
+        # Docs may be streamed, each read once.
+        streamed = TokenTable.from_docs((doc for doc in docs), ATTRIBUTES)
+        assert streamed.offsets.tolist() == table.offsets.tolist()
+        assert streamed.to_pandas().equals(data)
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_save_open(self, docs, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        table = TokenTable.from_docs(docs, ATTRIBUTES)
+        directory = str(tmp_path / "tokens")
+        table.save(directory)
+
+        opened = TokenTable.open(directory)
+        assert isinstance(opened.column("pos"), np.memmap)
+        assert opened.ids.to_pylist() == ["a", "b", "c"]
+        assert opened.to_pandas().equals(table.to_pandas())
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_cache.py                                                                      #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:00:00 pm                                                #
+# Modified   : Saturday October 17th 2026 01:08:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import sqlite3
+import pandas as pd
+
+from aes.utils.config import LogConfig
+from aes.features.cache import FeatureCache, IncrementalExtractor, content_hash, model_key
+from aes.features.extraction.planner import ExtractionPlanner
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+NAMES = ["alphabetic_character_count", "word_count"]
+
+
+# ================================================================================================ #
+#                                      TEST FEATURE CACHE                                          #
+# ================================================================================================ #
+
+
+@pytest.mark.cache
+class TestFeatureCache:
+    def test_versions(self, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        cache = FeatureCache(filepath=str(tmp_path / "cache.db"), max_size=100)
+        hashes = [content_hash("a"), content_hash("b")]
+        cache.put("word_count", 1, hashes, [1, 2])
+        assert cache.get("word_count", 1, hashes) == {hashes[0]: 1.0, hashes[1]: 2.0}
+        assert cache.dtype("word_count") == "int64"
+        assert cache.get("word_count", 2, hashes) == {}
+        assert len(cache) == 0
+
+        # Values from different spaCy pipelines are kept apart.
+        model = model_key({"tier": "md", "model": "en_core_web_md", "version": "3.8.0"})
+        assert model == "en_core_web_md==3.8.0" and model_key(None) == ""
+        cache.put("noun_count", 2, hashes, [4, 5], model=model)
+        assert cache.get("noun_count", 2, hashes) == {}
+        assert cache.get("noun_count", 2, hashes, model=model) == {hashes[0]: 4, hashes[1]: 5}
+        assert model_key(None, "abc") == "exemplars@abc"
+        assert model_key({"model": "m", "version": "1"}, "abc") == "m==1+exemplars@abc"
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_eviction(self, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        cache = FeatureCache(filepath=str(tmp_path / "cache.db"), max_size=2, check_every=1)
+        hashes = [content_hash(text) for text in "abc"]
+        cache.put("word_count", 1, hashes[:2], [1, 2])
+        cache.get("word_count", 1, hashes[:1])
+        cache.put("word_count", 1, hashes[2:], [3])
+        assert len(cache) == 2
+        assert hashes[1] not in cache.get("word_count", 1, hashes)
+
+        # The size is only checked once check_every values have been inserted.
+        cache = FeatureCache(filepath=str(tmp_path / "lazy.db"), max_size=2, check_every=4)
+        hashes = [content_hash(text) for text in "abcde"]
+        cache.put("word_count", 1, hashes[:3], [1, 2, 3])
+        assert len(cache) == 3
+        cache.put("word_count", 1, hashes[3:], [4, 5])
+        assert len(cache) == 2
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_migration(self, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        filepath = str(tmp_path / "cache.db")
+        connection = sqlite3.connect(filepath)
+        connection.execute(
+            """CREATE TABLE features (text_hash BLOB, extractor TEXT, version INTEGER,
+            value REAL, last_access REAL, PRIMARY KEY (text_hash, extractor, version))"""
+        )
+        connection.execute("INSERT INTO features VALUES (x'00', 'word_count', 1, 1.0, 0.0)")
+        connection.commit()
+        connection.close()
+
+        cache = FeatureCache(filepath=filepath, max_size=10)
+        assert len(cache) == 0
+        cache.put("word_count", 1, [content_hash("a")], [1])
+        assert len(cache) == 1
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_incremental(self, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        cache = FeatureCache(filepath=str(tmp_path / "cache.db"), max_size=100)
+        data = pd.DataFrame(
+            {
+                "discourse_id": ["d1", "d2", "d3"],
+                "discourse_text": ["One two three.", "Four five.", "One two three."],
+            }
+        )
+        extractor = IncrementalExtractor(names=NAMES, cache=cache)
+        first = extractor.extract(data)
+        assert first["word_count"].tolist() == [3, 2, 3]
+        assert len(cache) == 4
+
+        data.loc[1, "discourse_text"] = "Six seven eight nine."
+        second = extractor.extract(data)
+        assert second["word_count"].tolist() == [3, 4, 3]
+        assert second["word_count"].dtype == first["word_count"].dtype
+        assert len(cache) == 6
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_categories(self, tmp_path, monkeypatch, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        seen = []
+        run = ExtractionPlanner.run
+
+        def recording(self, texts, categories=None, spans=None):
+            seen.append(list(categories))
+            return run(self, texts, categories=categories, spans=spans)
+
+        monkeypatch.setattr(ExtractionPlanner, "run", recording)
+        cache = FeatureCache(filepath=str(tmp_path / "cache.db"), max_size=100)
+        data = pd.DataFrame(
+            {
+                "discourse_id": ["d1", "d2", "d3"],
+                "discourse_text": ["One two three.", "One two three.", "Four five."],
+                "discourse_type": ["Lead", "Claim", "Claim"],
+            }
+        )
+        extractor = IncrementalExtractor(names=["word_count"], cache=cache)
+        assert extractor.provenance == {}
+        features = extractor.extract(data)
+        assert features["word_count"].tolist() == [3, 3, 2]
+        # The same text under two discourse types is cached once per type.
+        assert seen == [["Lead", "Claim", "Claim"]]
+        assert len(cache) == 3
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_model(self, tmp_path, spacy_config, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        from aes.data.models import ModelSelector
+
+        cache = FeatureCache(filepath=str(tmp_path / "cache.db"), max_size=100)
+        data = pd.DataFrame(
+            {"discourse_id": ["a", "b"], "discourse_text": ["Dogs bark.", "Yes"]}
+        )
+        tier = ModelSelector().tier("trf")
+        extractor = IncrementalExtractor(["noun_count", "word_count"], cache=cache, model=tier)
+        features = extractor.extract(data)
+        assert features["word_count"].tolist() == [2, 1]
+        assert extractor.provenance["noun_count"]["tier"] == "trf"
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_exemplars(self, tmp_path, data_config, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        from aes.features.extraction.semantic import ExemplarIndex
+
+        exemplars = pd.DataFrame(
+            {
+                "discourse_text": ["Schools should require service", "it is bad", "Dogs bark"],
+                "discourse_type": ["Claim", "Claim", "Claim"],
+                "discourse_effectiveness": ["Effective", "Ineffective", "Ineffective"],
+            }
+        )
+        directory = data_config["semantic"]["index"]
+        first = ExemplarIndex.from_data(exemplars, directory, n_lists=1).fingerprint
+        data = pd.DataFrame(
+            {
+                "discourse_id": ["x"],
+                "discourse_text": ["Schools should require community service"],
+                "discourse_type": ["Claim"],
+            }
+        )
+        cache = FeatureCache(filepath=str(tmp_path / "cache.db"), max_size=100)
+        IncrementalExtractor(["similarity"], cache=cache).extract(data)
+        assert len(cache) == 1
+
+        # Rebuilding the index from other exemplars recomputes the semantic features.
+        exemplars.loc[2, "discourse_effectiveness"] = "Effective"
+        second = ExemplarIndex.from_data(exemplars, directory, n_lists=1).fingerprint
+        assert second != first
+        IncrementalExtractor(["similarity"], cache=cache).extract(data)
+        assert len(cache) == 2
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_charclass.py                                                                  #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 09:00:00 am                                                #
+# Modified   : Friday October 16th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+
+from aes.utils.config import LogConfig
+from aes.features.extraction.charclass import CharacterClassEngine, SYMBOLS
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+TEXTS = [
+    "Hello, world! Is this 2022? a/b\\c ... ....... end.",
+    "",
+    "Café… naïve, 42 $ ...",
+    "x" * 10,
+]
+# ================================================================================================ #
+#                                 TEST CHARACTER CLASS ENGINE                                      #
+# ================================================================================================ #
+
+
+@pytest.mark.length
+class TestCharacterClassEngine:
+    def test_counts(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        counts = CharacterClassEngine(chunksize=2).count(TEXTS)
+        assert len(counts) == len(TEXTS)
+        for i, text in enumerate(TEXTS):
+            assert counts.alpha[i] == sum(ch.isalpha() for ch in text)
+            assert counts.digit[i] == sum(ch.isdigit() for ch in text)
+            for symbol in counts.symbols:
+                assert counts.symbol(symbol)[i] == text.count(SYMBOLS[symbol])
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_features(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        counts = CharacterClassEngine().count(TEXTS)
+        features = counts.to_frame()
+        assert features.shape == (len(TEXTS), 7)
+        assert features["commas_count"].tolist() == [1, 0, 1, 0]
+        assert features["question_mark_count"].tolist() == [1, 0, 0, 0]
+        assert features["special_character_count"].tolist() == [2, 0, 1, 0]
+        assert counts.totals().index[0] == "period"
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_columnar.py                                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:46:00 am                                              #
+# Modified   : Saturday October 17th 2026 01:14:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from aes.utils.config import LogConfig
+from aes.features.extraction.base import FeatureExtractor, FeatureExtractorFactory
+from aes.features.extraction.columnar import hash_strings, mix_hashes, to_arrow, to_numpy
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+TEXTS = ["Students should vote, I think!", None, "Café naïve 42?", "", "One  two"]
+NAMES = [
+    "alphabetic_character_count",
+    "number_character_count",
+    "commas_count",
+    "question_mark_count",
+    "word_count",
+    "word_count_gt_5",
+    "avg_word_length",
+    "std_word_length",
+    "vocabulary_size",
+]
+
+
+def columns() -> dict:
+    """The same texts, with a null, in each supported column type."""
+    return {
+        "arrow": pa.array(TEXTS, type=pa.string()),
+        "chunked": pa.chunked_array([TEXTS[:2], TEXTS[2:]], type=pa.large_string()),
+        "numpy": np.array(TEXTS, dtype=object),
+        "series": pd.Series(TEXTS),
+        "list": list(TEXTS),
+    }
+
+
+# ================================================================================================ #
+#                                     TEST TEXT COLUMNS                                            #
+# ================================================================================================ #
+
+
+@pytest.mark.length
+class TestTextColumns:
+    def test_conversions(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        expected = ["" if text is None else text for text in TEXTS]
+        for kind, texts in columns().items():
+            assert to_arrow(texts).to_pylist() == expected, kind
+            assert to_numpy(texts).tolist() == expected, kind
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_hashes(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        keys = hash_strings(["a", "b", "a", ""])
+        assert keys[0] == keys[2] and keys[0] != keys[1] and keys.all()
+        # Consecutive keys are spread across the low bits without collisions.
+        mixed = mix_hashes(np.arange(4096, dtype=np.uint64))
+        assert len(np.unique(mixed)) == 4096
+        assert np.bincount((mixed % np.uint64(16)).astype(np.int64)).min() > 200
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_extract_batch(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        factory = FeatureExtractorFactory()
+        for name in NAMES:
+            extractor = factory.create_extractor(name)
+            results = {
+                kind: extractor.extract_batch(texts) for kind, texts in columns().items()
+            }
+            expected = results.pop("numpy")
+            assert len(expected) == len(TEXTS)
+            assert expected.flags["C_CONTIGUOUS"]
+            for kind, values in results.items():
+                assert values.dtype == expected.dtype, (name, kind)
+                np.testing.assert_array_equal(values, expected, err_msg=name + " " + kind)
+
+        # Nulls are treated as empty texts.
+        words = factory.create_extractor("word_count").extract_batch(pd.Series(TEXTS))
+        assert words[1] == words[3]
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_kwargs(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        # Options an extractor does not use are ignored by every extractor alike.
+        factory = FeatureExtractorFactory()
+        data = pd.DataFrame({"discourse_id": ["a", "b"], "discourse_text": TEXTS[:2]})
+        for name in ["alphabetic_character_count", "word_count", "word_count_gt_5"]:
+            expected = factory.create_extractor(name).extract(data)
+            assert factory.create_extractor(name).extract(data, other_kw=1).equals(expected)
+
+        # Extractors must provide a vectorized implementation.
+        class Incomplete(FeatureExtractor):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_executor.py                                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:49:00 am                                              #
+# Modified   : Saturday October 17th 2026 01:13:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import pandas as pd
+
+from aes.utils.config import LogConfig
+from aes.data.essays import EssayStore
+from aes.features.extraction.executor import ParallelExtractor
+from aes.features.extraction.planner import ExtractionPlanner
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+FEATURES = ["word_count", "avg_word_length", "vocabulary_size", "number_character_count"]
+
+
+@pytest.fixture
+def grouped():
+    """Discourses of three essays, interleaved so that chunking reorders the rows."""
+    return pd.DataFrame(
+        {
+            "discourse_id": ["d{}".format(i) for i in range(9)],
+            "essay_id": ["e1", "e2", "e3", "e1", "e2", "e3", "e1", "e2", "e3"],
+            "discourse_type": ["Lead", "Claim", "Position"] * 3,
+            "discourse_text": [
+                "Students should vote",
+                "In 2020 turnout rose by 7 percent",
+                None,
+                "It matters",
+                "Young voters",
+                "Schools must teach civics to 12 grades",
+                "Vote now",
+                "One two three four five",
+                "The end",
+            ],
+        }
+    )
+
+
+# ================================================================================================ #
+#                                   TEST PARALLEL EXTRACTOR                                        #
+# ================================================================================================ #
+
+
+@pytest.mark.planner
+class TestParallelExtractor:
+    def test_workers(self, grouped, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        serial = ParallelExtractor(names=FEATURES, workers=1, chunksize=2).extract(grouped)
+        parallel = ParallelExtractor(names=FEATURES, workers=2, chunksize=2).extract(grouped)
+        pd.testing.assert_frame_equal(serial, parallel)
+        assert serial["discourse_id"].tolist() == grouped["discourse_id"].tolist()
+
+        expected = ExtractionPlanner(names=FEATURES).run(grouped["discourse_text"].fillna(""))
+        for name in FEATURES:
+            assert serial[name].tolist() == list(expected[name])
+        assert serial.attrs["provenance"] == {}
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_categories(self, grouped, monkeypatch, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        seen = []
+        run = ExtractionPlanner.run
+
+        def recording(self, texts, categories=None, spans=None):
+            seen.append((list(texts), list(categories)))
+            return run(self, texts, categories=categories, spans=spans)
+
+        monkeypatch.setattr(ExtractionPlanner, "run", recording)
+        ParallelExtractor(names=FEATURES, workers=1, chunksize=2).extract(grouped)
+        assert len(seen) > 1
+        types = dict(zip(grouped["discourse_text"].fillna(""), grouped["discourse_type"]))
+        for texts, categories in seen:
+            assert categories == [types[text] for text in texts]
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_essays(self, grouped, tmp_path, spacy_config, monkeypatch, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        directory = tmp_path / "essays"
+        directory.mkdir()
+        data = grouped.dropna()
+        for essay_id, texts in data.groupby("essay_id")["discourse_text"]:
+            (directory / "{}.txt".format(essay_id)).write_text(" ".join(texts), "utf-8")
+
+        seen = []
+        run = ExtractionPlanner.run
+
+        def recording(self, texts, categories=None, spans=None):
+            seen.append(spans)
+            return run(self, texts, categories=categories, spans=spans)
+
+        monkeypatch.setattr(ExtractionPlanner, "run", recording)
+        names = ["noun_count", "word_count"]
+        extractor = ParallelExtractor(names=names, workers=1, chunksize=2)
+        features = extractor.extract(data, essays=EssayStore(str(directory)))
+        # Each chunk holds whole essays, and its discourses are sliced from their parses.
+        assert len(seen) == 3
+        assert all(spans is not None and spans.aligned.all() for spans in seen)
+        assert features["discourse_id"].tolist() == data["discourse_id"].tolist()
+        expected = run(ExtractionPlanner(names=["word_count"]), data["discourse_text"])
+        assert features["word_count"].tolist() == list(expected["word_count"])
+        assert features.attrs["provenance"] == extractor.provenance
+        assert features.attrs["provenance"]["noun_count"]["tier"] == "md"
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_feature_set.py                                                                #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:08:37 am                                              #
+# Modified   : Saturday October 17th 2026 12:52:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+import pandas as pd
+
+from aes.utils.config import LogConfig
+from aes.features.base import Feature
+from aes.features.feature_set import FeatureSet
+from aes.features.extraction.base import FeatureExtractorFactory
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+
+
+# ================================================================================================ #
+#                                      TEST FEATURE SET                                            #
+# ================================================================================================ #
+
+
+@pytest.mark.feature_set
+class TestFeatureSet:
+    def test_block(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        data = pd.DataFrame(
+            {
+                "discourse_id": ["a", "b", "c"],
+                "discourse_text": ["One two three.", "Hi, world!", "Four, five, six, seven."],
+            }
+        )
+        features = FeatureSet(data)
+        features.add_feature(Feature("avg_word_length", "length"))
+        features.add_feature(Feature("word_count", "length"))
+        features.add_feature(Feature("commas_count", "length"))
+        features.extract()
+
+        assert features.block.dtype == np.float32
+        assert features.block.flags["F_CONTIGUOUS"]
+        # Columns follow the catalogue order, so a category is a contiguous slice.
+        length = features.get_features(category="length")
+        assert length.columns.tolist() == ["word_count", "commas_count", "avg_word_length"]
+        assert length.index.tolist() == ["a", "b", "c"]
+        assert np.shares_memory(length.to_numpy(), features.block)
+        assert np.shares_memory(features.get_array("length"), features.block)
+
+        word_count = features.get_feature("word_count").values
+        assert word_count.tolist() == [3, 2, 4]
+        assert word_count.index is features.index
+        assert features.get_features()["commas_count"].tolist() == [0, 1, 3]
+
+        compact = features.get_features(compact=True)
+        assert compact["commas_count"].dtype == np.uint8
+        assert compact["avg_word_length"].dtype == np.float32
+        assert features.memory_report().loc["word_count", "dtype_after"] == "uint8"
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_columns(self, monkeypatch, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        factories = set()
+        create_extractor = FeatureExtractorFactory.create_extractor
+
+        def recording(self, name):
+            factories.add(id(self))
+            return create_extractor(self, name)
+
+        monkeypatch.setattr(FeatureExtractorFactory, "create_extractor", recording)
+        data = pd.DataFrame({"discourse_id": ["a", "b"], "text": ["One two three.", "Hi, world!"]})
+        features = FeatureSet(data)
+        features.add_feature(Feature("word_count", "length"))
+        features.add_feature(Feature("commas_count", "length"))
+        features.extract(text_col="text")
+
+        assert features.get_features()["word_count"].tolist() == [3, 2]
+        assert len(factories) == 1
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
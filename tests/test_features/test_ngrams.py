@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_ngrams.py                                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:18:32 am                                              #
+# Modified   : Saturday October 17th 2026 12:22:03 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+import pandas as pd
+
+from aes.utils.config import LogConfig
+from aes.features.extraction.columnar import split_tokens
+from aes.features.extraction.ngrams import NgramCounts, NgramEngine
+from aes.features.extraction.planner import ExtractionPlanner
+from aes.features.extraction.vocabulary import Vocabulary
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+TEXTS = ["The cats sat , the cats sat.", "", "One", "Running runs run fast fast"]
+
+
+# ================================================================================================ #
+#                                      TEST NGRAM ENGINE                                           #
+# ================================================================================================ #
+
+
+@pytest.mark.ngrams
+class TestNgramEngine:
+    def test_count(self, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        ngrams = NgramEngine(n_features=2**16).count(*self._tokens(TEXTS))
+
+        bigrams = ngrams[(2, False)]
+        assert bigrams.matrix.shape == (4, 2**16)
+        assert bigrams.totals.tolist() == [5, 0, 0, 4]
+        assert bigrams.distinct.tolist() == [3, 0, 0, 4]
+        assert ngrams[(2, True)].distinct.tolist() == [3, 0, 0, 3]
+        assert ngrams[(3, False)].totals.tolist() == [4, 0, 0, 3]
+
+        filepath = str(tmp_path / "bigrams.npz")
+        bigrams.save(filepath)
+        assert (NgramCounts.load(filepath).matrix != bigrams.matrix).nnz == 0
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_stable_columns(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        # The same n-gram maps to the same column regardless of the rest of the corpus.
+        engine = NgramEngine(orders=(2,))
+        first = engine.count(*self._tokens(["red fox", "blue sky"]))[(2, False)].matrix
+        second = engine.count(*self._tokens(["blue sky"]))[(2, False)].matrix
+        assert first[1].indices.tolist() == second[0].indices.tolist()
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_features(self, data_config, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        data = pd.DataFrame({"discourse_id": ["a", "b", "c", "d"], "discourse_text": TEXTS})
+        names = ["bigram_count", "stemmed_bigram_count", "trigram_count", "stemmed_trigram_count"]
+        features = ExtractionPlanner(names=names).extract(data)
+        assert features["stemmed_bigram_count"].tolist() == [3, 0, 0, 3]
+        assert features["trigram_count"].tolist() == [3, 0, 0, 3]
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def _tokens(self, texts: list) -> tuple:
+        words, segment = split_tokens(texts)
+        offsets = np.concatenate(([0], np.cumsum(np.bincount(segment, minlength=len(texts)))))
+        return (Vocabulary().intern(words, offsets),)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_planner.py                                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 03:30:00 pm                                                #
+# Modified   : Saturday October 17th 2026 12:46:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+
+from aes.utils.config import LogConfig
+from aes.features.extraction.context import ExtractionContext
+from aes.features.extraction.planner import ExtractionPlan, ExtractionPlanner
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+
+
+class CountingExtractor:
+    """Minimal extractor recording which intermediates were held when it ran."""
+
+    def __init__(self, requires: list) -> None:
+        self.requires = requires
+        self.held = None
+
+    def extract_batch(self, texts, context=None, **kwargs) -> np.ndarray:
+        for name in self.requires:
+            context.get(name)
+        self.held = context.intermediates
+        return np.arange(len(texts))
+
+
+# ================================================================================================ #
+#                                    TEST EXTRACTION PLANNER                                       #
+# ================================================================================================ #
+
+
+@pytest.mark.planner
+class TestExtractionPlanner:
+    def test_plan(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        extractors = {
+            "a": CountingExtractor(["tokens"]),
+            "b": CountingExtractor(["sentences"]),
+            "c": CountingExtractor(["characters"]),
+        }
+        plan = ExtractionPlan(extractors)
+        assert sorted(plan.intermediates) == ["characters", "sentences", "tokens"]
+        stages = plan.stages()
+        assert stages[0] == [
+            ("intermediate", "characters"),
+            ("intermediate", "sentences"),
+            ("intermediate", "tokens"),
+        ]
+        assert ("feature", "b") in stages[1]
+        # Sentences do not hold the tokenization, so tokens are freed after their last consumer.
+        assert plan.dependencies(("intermediate", "sentences")) == set()
+        assert plan.consumers(("intermediate", "tokens")) == {("feature", "a")}
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_run(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        extractors = {"a": CountingExtractor(["characters"]), "b": CountingExtractor([])}
+        planner = ExtractionPlanner(names=["b", "a"], extractors=extractors)
+        results = planner.run(np.array(["One text.", "Another text."], dtype=object))
+        assert list(results.keys()) == ["b", "a"]
+        assert results["a"].tolist() == [0, 1]
+        assert "characters" in extractors["a"].held
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_sentences(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        nltk = pytest.importorskip("nltk")
+        try:
+            nltk.data.find("tokenizers/punkt")
+        except LookupError:
+            pytest.skip("The NLTK punkt tokenizer is not installed.")
+
+        context = ExtractionContext(np.array(["One. Two three.", ""], dtype=object))
+        sentences = context.get("sentences")
+        assert context.intermediates == ["sentences"]
+        assert sentences.counts.tolist() == [2, 0]
+        assert sentences.starts.values.tolist() == [0, 5]
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_ragged.py                                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 12:40:00 pm                                                #
+# Modified   : Friday October 16th 2026 12:40:00 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+
+from aes.utils.config import LogConfig
+from aes.features.extraction.ragged import RaggedArray
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+ROWS = [[3, 1, 4, 1, 5], [], [9], [2, 6, 5, 3, 5, 8, 9, 7]]
+# ================================================================================================ #
+#                                     TEST RAGGED ARRAY                                            #
+# ================================================================================================ #
+
+
+@pytest.mark.length
+class TestRaggedArray:
+    def test_reductions(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        values = np.concatenate([np.array(row, dtype=np.int64) for row in ROWS])
+        ragged = RaggedArray.from_counts(values, [len(row) for row in ROWS])
+        assert len(ragged) == len(ROWS)
+        assert ragged[3].tolist() == ROWS[3]
+        assert ragged.sum().tolist() == [sum(row) for row in ROWS]
+        assert np.allclose(ragged.mean(), [np.mean(row) if row else 0 for row in ROWS])
+        assert np.allclose(ragged.std(), [np.std(row) if row else 0 for row in ROWS])
+        assert np.allclose(
+            ragged.std(ddof=1), [np.std(row, ddof=1) if len(row) > 1 else 0 for row in ROWS]
+        )
+        assert ragged.count_greater(4).tolist() == [sum(v > 4 for v in row) for row in ROWS]
+        assert ragged.count_greater([4, 6]).shape == (len(ROWS), 2)
+        assert ragged.nunique().tolist() == [len(set(row)) for row in ROWS]
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_readability.py                                                                #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:14:42 am                                              #
+# Modified   : Saturday October 17th 2026 12:54:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+
+from aes.utils.config import LogConfig
+from aes.features.extraction.columnar import split_tokens
+from aes.features.extraction.readability import (
+    ReadabilityAnalyzer,
+    SyllableLexicon,
+    count_syllables,
+)
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+TEXTS = ["The cat sat. It was happy!", "", "Beautiful education matters."]
+
+
+# ================================================================================================ #
+#                                      TEST READABILITY                                            #
+# ================================================================================================ #
+
+
+@pytest.mark.readability
+class TestReadability:
+    def test_syllables(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        words = ["the", "make", "table", "jumped", "wanted", "beautiful", "education", ""]
+        assert [count_syllables(word) for word in words] == [1, 1, 2, 1, 2, 3, 4, 0]
+        assert [count_syllables(word) for word in ["café", "éclair", "über"]] == [2, 2, 2]
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_lexicon(self, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        filepath = str(tmp_path / "syllables.pkl")
+        lexicon = SyllableLexicon(filepath)
+        assert lexicon.lookup(np.array(["table", "cat"], dtype=object)).tolist() == [2, 1]
+        assert lexicon.modified
+        lexicon.save()
+        assert not lexicon.modified
+        assert len(SyllableLexicon(filepath)) == 2
+
+        # The table is rewritten only when a computation adds new words.
+        analyzer = ReadabilityAnalyzer(lexicon=lexicon, easy_words=set())
+        words, segment = split_tokens(["Table cat."])
+        analyzer.compute(words, np.array([0, len(words)]), np.array([1]))
+        modified = os.stat(filepath).st_mtime_ns
+        os.utime(filepath, ns=(modified - 10**9, modified - 10**9))
+        analyzer.compute(words, np.array([0, len(words)]), np.array([1]))
+        assert os.stat(filepath).st_mtime_ns == modified - 10**9
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_statistics(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        words, segment = split_tokens(TEXTS)
+        offsets = np.concatenate(([0], np.cumsum(np.bincount(segment, minlength=3))))
+        analyzer = ReadabilityAnalyzer(lexicon=SyllableLexicon(), easy_words={"the", "cat"})
+        statistics = analyzer.compute(words, offsets, np.array([2, 0, 1]))
+
+        # 'happy' has two syllables and is not in the list of familiar words.
+        assert statistics.get("Syllables count").tolist() == [7, 0, 9]
+        assert statistics.get("Difficult word count")[[0, 2]].tolist() == [1, 3]
+        flesch = statistics.get("Flesch reading ease")
+        assert flesch[0] == pytest.approx(206.835 - 1.015 * 6 / 2 - 84.6 * 7 / 6)
+        assert np.isnan(flesch[1])
+        ari = statistics.get("automated_readibility_index")
+        assert ari[2] == pytest.approx(4.71 * 25 / 3 + 0.5 * 3 - 21.43)
+        smog = statistics.get("Smog index")
+        assert smog[2] == pytest.approx(1.043 * np.sqrt(2 * 30) + 3.1291)
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_accents(self, data_config, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        words, segment = split_tokens(["Café éclair résumé."])
+        analyzer = ReadabilityAnalyzer(easy_words=set())
+        assert analyzer.lexicon.filepath == data_config["readability"]["syllables"]
+        statistics = analyzer.compute(words, np.array([0, 3]), np.array([1]))
+        syllables = analyzer.lexicon.lookup(np.array(["café", "éclair", "résumé"]))
+        assert syllables.tolist() == [2, 2, 3]
+        assert statistics.get("Syllables count").tolist() == [7]
+        assert statistics.get("automated_readibility_index")[0] == pytest.approx(
+            4.71 * 16 / 3 + 0.5 * 3 - 21.43
+        )
+        assert os.path.exists(data_config["readability"]["syllables"])
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
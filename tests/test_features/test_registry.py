@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_registry.py                                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:49:00 am                                              #
+# Modified   : Saturday October 17th 2026 12:49:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import sys
+import inspect
+import pytest
+import logging
+import logging.config
+import subprocess
+
+from aes.utils.config import LogConfig, ROOT
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+# Run in a fresh interpreter, since the test session itself may already have imported them.
+SCRIPT = """
+import sys
+from aes.features.extraction.base import FeatureExtractorFactory
+
+factory = FeatureExtractorFactory()
+factory.list_extractors()
+factory.get_spec("noun_count")
+factory.create_extractor("word_count")
+heavy = ["spacy", "nltk", "aes.features.extraction.syntactic"]
+print(",".join(name for name in heavy if name in sys.modules))
+"""
+
+
+# ================================================================================================ #
+#                                  TEST EXTRACTOR REGISTRY                                         #
+# ================================================================================================ #
+
+
+@pytest.mark.registry
+class TestExtractorRegistry:
+    def test_lazy_imports(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        result = subprocess.run(
+            [sys.executable, "-c", SCRIPT], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_semantic.py                                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:25:10 am                                              #
+# Modified   : Saturday October 17th 2026 12:56:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+import pandas as pd
+
+from aes.utils.config import LogConfig
+from aes.features.extraction.context import ExtractionContext
+from aes.features.extraction.planner import ExtractionPlanner
+from aes.features.extraction.semantic import ExemplarIndex, IVFIndex, TextEmbedder
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+EXEMPLARS = pd.DataFrame(
+    {
+        "discourse_id": ["a", "b", "c", "d", "e"],
+        "discourse_text": [
+            "Schools should require community service because it builds character",
+            "Community service builds character and schools should require it",
+            "i think it is bad",
+            "it is bad i think so",
+            "Students learn responsibility when they volunteer in their community",
+        ],
+        "discourse_type": ["Claim", "Claim", "Claim", "Claim", "Evidence"],
+        "discourse_effectiveness": [
+            "Effective",
+            "Effective",
+            "Ineffective",
+            "Ineffective",
+            "Adequate",
+        ],
+    }
+)
+
+
+def unit_vectors(n: int, dimension: int = 32, seed: int = 0) -> np.ndarray:
+    vectors = np.random.default_rng(seed).normal(size=(n, dimension)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+# ================================================================================================ #
+#                                        TEST IVF INDEX                                            #
+# ================================================================================================ #
+
+
+@pytest.mark.semantic
+class TestIVFIndex:
+    def test_search(self, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        vectors = unit_vectors(2000)
+        keys = np.arange(1, 2001, dtype=np.uint64)
+        index = IVFIndex.build(vectors, keys, str(tmp_path / "ivf"), n_lists=16)
+        assert len(IVFIndex(index.directory)) == 2000 and index.n_lists == 16
+
+        queries = unit_vectors(50, seed=1)
+        exact = np.sort(queries @ vectors.T, axis=1)[:, ::-1][:, :5]
+        similarities, positions = index.search(queries, k=5, n_probe=16)
+        assert np.allclose(similarities, exact, atol=1e-5)
+        assert np.allclose(similarities[:, 0], np.sum(queries * index.vectors[positions[:, 0]], 1))
+
+        # Probing a quarter of the lists still finds most of the true neighbours.
+        approximate = index.search(queries, k=5, n_probe=4)[0]
+        assert np.mean(np.isin(approximate, exact)) > 0.5
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_exclude(self, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        vectors = unit_vectors(3)
+        keys = np.array([7, 8, 9], dtype=np.uint64)
+        index = IVFIndex.build(vectors, keys, str(tmp_path / "ivf"), n_lists=2)
+        similarities, positions = index.search(vectors, k=3, n_probe=2, exclude=keys)
+        assert not np.any(index.keys[positions[:, :2]] == keys[:, None])
+        assert np.isnan(similarities[:, 2]).all() and (positions[:, 2] == -1).all()
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+
+# ================================================================================================ #
+#                                    TEST SEMANTIC FEATURES                                        #
+# ================================================================================================ #
+
+
+@pytest.mark.semantic
+class TestSemanticFeatures:
+    def test_embed(self, data_config, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        texts = EXEMPLARS["discourse_text"].tolist()[:3] + [""]
+        embeddings = ExtractionContext(texts).get("embeddings")
+        assert embeddings.shape == (4, TextEmbedder().dimension)
+        assert np.allclose(np.linalg.norm(embeddings[:3], axis=1), 1)
+        assert not embeddings[3].any()
+        similarities = embeddings @ embeddings.T
+        assert similarities[0, 1] > similarities[0, 2]
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_features(self, data_config, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        names = ["similarity", "histogram_based"]
+        texts, categories = EXEMPLARS["discourse_text"], EXEMPLARS["discourse_type"]
+        with pytest.raises(FileNotFoundError, match="ExemplarIndex.from_data"):
+            ExtractionPlanner(names=names).run(texts, categories=categories)
+
+        index = ExemplarIndex.from_data(EXEMPLARS, data_config["semantic"]["index"], n_lists=1)
+        assert index.categories == ["Claim"]
+
+        data = pd.DataFrame(
+            {
+                "discourse_id": ["x", "y", "z", "a"],
+                "discourse_text": [
+                    "Schools should require community service",
+                    "i think that it is bad",
+                    "Students should volunteer",
+                    EXEMPLARS["discourse_text"][0],
+                ],
+                "discourse_type": ["Claim", "Claim", "Rebuttal", "Claim"],
+            }
+        )
+        features = ExtractionPlanner(names=names).extract(data)
+        similarity = features["similarity"].to_numpy()
+        assert similarity[0] > 0 > similarity[1]
+        assert np.isnan(similarity[2])
+        # With k larger than the exemplar set, every exemplar of the type is a neighbour. An
+        # exemplar is not its own neighbour, so only one Effective exemplar remains for it.
+        histogram = features["histogram_based"].to_numpy()
+        assert histogram[[0, 1]].tolist() == [0.5, 0.5]
+        assert np.isclose(histogram[3], 1 / 3)
+
+        with pytest.raises(ValueError):
+            ExtractionPlanner(names=names).run(data["discourse_text"])
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_spelling.py                                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:17:05 am                                              #
+# Modified   : Saturday October 17th 2026 01:11:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+import yaml
+
+from aes.utils import config
+from aes.utils.config import LogConfig
+from aes.features.extraction import spelling
+from aes.features.extraction.columnar import hash_strings, split_tokens
+from aes.features.extraction.spelling import (
+    SpellingChecker,
+    SpellingIndex,
+    deletes,
+    edit_distance,
+)
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+WORDS = ["The", "cat", "sat", "on", "of", "mat", "happy", "spelling", "because", "Don't"]
+
+
+@pytest.fixture
+def index(tmp_path):
+    return SpellingIndex.build(WORDS, str(tmp_path / "spelling_index"), max_edit_distance=2)
+
+
+# ================================================================================================ #
+#                                     TEST SPELLING INDEX                                          #
+# ================================================================================================ #
+
+
+@pytest.mark.spelling
+class TestSpellingIndex:
+    def test_index(self, index, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        reopened = SpellingIndex(index.directory)
+        assert len(reopened) == len(WORDS)
+        assert "dont" in reopened and "dog" not in reopened
+        assert reopened.contains(["the", "cat", "dgo"]).tolist() == [True, True, False]
+        distances = reopened.lookup(["becuase", "speling", "hapyp", "xyzzyq", "cat"])
+        assert distances.tolist() == [1, 1, 1, -1, 0]
+        assert edit_distance("spelling", "spellign") == 1
+        assert edit_distance("kitten", "sitting", bound=1) == 2
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_deletes(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        keys, owners = deletes(["cat", "aa", "on"], 1)
+        expected = [("cat", "at", "ct", "ca"), ("aa", "a"), ("on", "n", "o")]
+        for owner, variants in enumerate(expected):
+            assert sorted(keys[owners == owner]) == sorted(hash_strings(list(variants)))
+        assert owners.tolist() == sorted(owners.tolist())
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_collision(self, index, monkeypatch, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        # 'dog' is given the hash of 'cat', so only the stored word tells them apart.
+        def colliding(words):
+            return hash_strings(["cat" if word == "dog" else word for word in words])
+
+        monkeypatch.setattr(spelling, "hash_strings", colliding)
+        assert index.contains(["cat", "dog", "mat"]).tolist() == [True, False, True]
+        assert index.lookup(["dog"]).tolist() == [2]  # Two edits from 'on', not a member.
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_checker(self, index, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        texts = ["The cat sat on teh mat.", "", "Becuase of speling, Zyxwv! 42"]
+        words, segment = split_tokens(texts)
+        offsets = np.concatenate(([0], np.cumsum(np.bincount(segment, minlength=len(texts)))))
+        counts = SpellingChecker(index=index).check(words, offsets)
+        assert counts.words.tolist() == [6, 0, 4]
+        assert counts.errors.tolist() == [1, 0, 2]
+        assert counts.errors.dtype == np.int64 and counts.words.dtype == np.int64
+        assert counts.ratio.tolist() == pytest.approx([1 / 6, 0, 0.5])
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_configured(self, tmp_path, monkeypatch, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        # The configured dictionary and index are found relative to the project root, not
+        # the working directory.
+        with open(os.path.join("config", "data.yml")) as file:
+            data = yaml.safe_load(file)
+        data["spelling"].update({"dictionary": "words.txt", "index": "spelling_index"})
+        (tmp_path / "data.yml").write_text(yaml.safe_dump(data))
+        (tmp_path / "words.txt").write_text("\n".join(WORDS))
+        (tmp_path / "elsewhere").mkdir()
+        monkeypatch.setenv("CONFIG_DATA", str(tmp_path / "data.yml"))
+        monkeypatch.setattr(config, "ROOT", str(tmp_path))
+        monkeypatch.chdir(tmp_path / "elsewhere")
+
+        checker = SpellingChecker()
+        assert checker.index.directory == str(tmp_path / "spelling_index")
+        assert os.listdir(tmp_path / "elsewhere") == []
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
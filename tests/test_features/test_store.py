@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_store.py                                                                      #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:06:06 am                                              #
+# Modified   : Saturday October 17th 2026 01:00:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+import pandas as pd
+
+from aes.utils.config import LogConfig
+from aes.features.store import FeatureStore, OfflineStore
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+PROVENANCE = {"noun_count": {"tier": "md", "model": "en_core_web_md", "version": "3.8.0"}}
+
+
+# ================================================================================================ #
+#                                      TEST OFFLINE STORE                                          #
+# ================================================================================================ #
+
+
+@pytest.mark.store
+class TestOfflineStore:
+    def test_write_read(self, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        store = OfflineStore(path=str(tmp_path / "offline"))
+        features = pd.DataFrame(
+            {
+                "discourse_id": ["a", "b", "c", "d"],
+                "discourse_type": pd.Categorical(["Lead", "Claim", "Claim", "Evidence"]),
+                "word_count": [3, 4, 5, 6],
+                "avg_word_length": [1.0, 2.0, 3.0, 4.0],
+            }
+        )
+        store.write(features, category="length")
+        assert store.categories == ["length"]
+        assert (tmp_path / "offline" / "category=length" / "discourse_type=Claim").is_dir()
+
+        claims = store.read(["word_count"], discourse_types=["Claim"])
+        assert claims.columns.tolist() == ["discourse_id", "discourse_type", "word_count"]
+        assert sorted(claims["discourse_id"]) == ["b", "c"]
+
+        store.write(features[["discourse_id", "discourse_type"]].assign(word_count=9), "length")
+        merged = store.read(["avg_word_length", "word_count"]).sort_values("discourse_id")
+        assert merged["word_count"].tolist() == [9, 9, 9, 9]
+        assert merged["avg_word_length"].tolist() == [1.0, 2.0, 3.0, 4.0]
+
+        # Partitions are merged one at a time. Unwritten partitions keep their stored rows.
+        claims = features[features["discourse_type"] == "Claim"][["discourse_id", "discourse_type"]]
+        store.write(claims.assign(std_word_length=[0.5, 0.25]), "length")
+        merged = store.read(["word_count", "std_word_length"]).sort_values("discourse_id")
+        assert merged["word_count"].tolist() == [9, 9, 9, 9]
+        assert merged["std_word_length"].isna().tolist() == [True, False, False, True]
+
+        empty = store.read([])
+        assert empty.empty
+        assert empty.columns.tolist() == ["discourse_id", "discourse_type"]
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_provenance(self, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        store = OfflineStore(path=str(tmp_path / "offline"))
+        features = pd.DataFrame(
+            {
+                "discourse_id": ["a", "b"],
+                "discourse_type": ["Lead", "Claim"],
+                "noun_count": [1, 2],
+            }
+        )
+        features.attrs["provenance"] = PROVENANCE
+        store.write(features, category="syntactic")
+        assert store.provenance("syntactic") == PROVENANCE
+
+        # Writing other features keeps the provenance of the stored ones.
+        store.write(features[["discourse_id", "discourse_type"]].assign(verb_count=3), "syntactic")
+        assert store.provenance("syntactic") == PROVENANCE
+        assert store.read(["noun_count", "verb_count"]).attrs["provenance"] == PROVENANCE
+
+        # Rewriting a feature without a pipeline drops its provenance.
+        store.write(features.assign(noun_count=0), "syntactic", provenance={})
+        assert store.provenance("syntactic") == {}
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+
+# ================================================================================================ #
+#                                      TEST FEATURE STORE                                          #
+# ================================================================================================ #
+
+
+@pytest.mark.store
+class TestFeatureStore:
+    def test_materialize(self, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        store = FeatureStore(filepath=str(tmp_path / "online_store.db"), batch_size=2)
+        features = pd.DataFrame(
+            {"discourse_id": ["a", "b", "c"], "word_count": [3, 4, 5], "avg_word_length": 1.5}
+        )
+        assert store.materialize(features) == 3
+        assert store.features() == ["word_count", "avg_word_length"]
+
+        online = store.get_online_features(["c", "x", "a"])
+        assert online.index.tolist() == ["c", "x", "a"]
+        assert online.loc["c", "word_count"] == 5
+        assert np.isnan(online.loc["x", "word_count"])
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_upsert(self, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        store = FeatureStore(filepath=str(tmp_path / "online_store.db"), cache_size=1)
+        store.materialize(pd.DataFrame({"discourse_id": ["a", "b"], "word_count": [1, 2]}))
+        assert store.get_online_features(["a"]).loc["a", "word_count"] == 1
+
+        store.materialize(pd.DataFrame({"discourse_id": ["a"], "word_count": [7]}))
+        store.materialize(pd.DataFrame({"discourse_id": ["b"], "sentence_count": [3]}))
+        online = store.get_online_features(["a", "b"], features=["word_count", "sentence_count"])
+        assert online["word_count"].tolist() == [7, 2]
+        assert np.isnan(online.loc["a", "sentence_count"])
+        assert online.loc["b", "sentence_count"] == 3
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_provenance(self, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        filepath = str(tmp_path / "online_store.db")
+        store = FeatureStore(filepath=filepath)
+        features = pd.DataFrame({"discourse_id": ["a"], "noun_count": [1], "word_count": [2]})
+        store.materialize(features, provenance=PROVENANCE)
+        store.close()
+        assert FeatureStore(filepath=filepath).provenance() == PROVENANCE
+
+        store = FeatureStore(filepath=filepath)
+        store.materialize(features[["discourse_id", "noun_count"]])
+        assert store.provenance() == {}
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
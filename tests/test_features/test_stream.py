@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_stream.py                                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 11:20:00 pm                                                #
+# Modified   : Saturday October 17th 2026 01:12:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+import pytest
+import logging
+import logging.config
+import pandas as pd
+
+from aes.utils.config import LogConfig
+from aes.data.dataset import Dataset
+from aes.features.extraction.planner import ExtractionPlanner
+from aes.features.extraction.semantic import ExemplarIndex
+from aes.features.extraction.stream import StreamingExtractor
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+NAMES = ["alphabetic_character_count", "word_count", "avg_word_length"]
+
+
+# ================================================================================================ #
+#                                  TEST STREAMING EXTRACTOR                                        #
+# ================================================================================================ #
+
+
+@pytest.mark.stream
+class TestStreamingExtractor:
+    def test_extract(self, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        data = pd.DataFrame(
+            {
+                "discourse_id": ["d{}".format(i) for i in range(7)],
+                "essay_id": ["e1", "e1", "e2", "e2", "e3", "e3", "e3"],
+                "discourse_text": ["Text number {} here.".format("x" * i) for i in range(7)],
+            }
+        )
+        source = str(tmp_path / "train.parquet")
+        destination = str(tmp_path / "features" / "train.parquet")
+        data.to_parquet(source, index=False)
+        dataset = Dataset(name="train", filepath=source, stream=True)
+        assert dataset.stream
+
+        streamer = StreamingExtractor(names=NAMES, batch_size=3, max_workers=2)
+        assert streamer.extract(dataset, destination) == 7
+
+        expected = ExtractionPlanner(names=NAMES).extract(data)
+        features = pd.read_parquet(destination)
+        assert features.columns.tolist() == ["discourse_id"] + NAMES
+        pd.testing.assert_frame_equal(features, expected, check_dtype=False)
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_categories(self, tmp_path, data_config, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        exemplars = pd.DataFrame(
+            {
+                "discourse_text": ["Schools should require service", "it is bad", "Dogs bark"],
+                "discourse_type": ["Claim", "Claim", "Claim"],
+                "discourse_effectiveness": ["Effective", "Ineffective", "Ineffective"],
+            }
+        )
+        ExemplarIndex.from_data(exemplars, data_config["semantic"]["index"], n_lists=1)
+        data = pd.DataFrame(
+            {
+                "discourse_id": ["x", "y", "z"],
+                "discourse_text": ["Schools should require service", "it is so bad", "Vote"],
+                "discourse_type": ["Claim", "Claim", "Rebuttal"],
+            }
+        )
+        source = str(tmp_path / "train.parquet")
+        destination = str(tmp_path / "features.parquet")
+        data.to_parquet(source, index=False)
+
+        names = ["similarity", "word_count"]
+        assert StreamingExtractor(names=names, batch_size=2).extract(source, destination) == 3
+        expected = ExtractionPlanner(names=names).extract(data)
+        pd.testing.assert_frame_equal(pd.read_parquet(destination), expected, check_dtype=False)
+
+        # A source without rows leaves no features of an earlier run behind.
+        data.iloc[:0].to_parquet(source, index=False)
+        assert StreamingExtractor(names=names).extract(source, destination) == 0
+        assert not os.path.exists(destination)
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_syntactic.py                                                                  #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:12:59 am                                              #
+# Modified   : Saturday October 17th 2026 12:12:59 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+
+from aes.utils.config import LogConfig
+from aes.features.extraction.syntactic import DocArray, SyntacticAnalyzer
+
+spacy = pytest.importorskip("spacy")
+from spacy.tokens import Doc  # noqa: E402
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+
+
+@pytest.fixture
+def docs():
+    vocab = spacy.blank("en").vocab
+    return [
+        Doc(
+            vocab,
+            words="All the three big dogs that I saw ran .".split(),
+            pos="DET DET NUM ADJ NOUN PRON PRON VERB VERB PUNCT".split(),
+            tags="PDT DT CD JJ NNS WDT PRP VBD VBD .".split(),
+            deps="predet det nummod amod nsubj dobj nsubj relcl ROOT punct".split(),
+            heads=[4, 4, 4, 4, 8, 7, 7, 4, 8, 8],
+        ),
+        Doc(vocab, words=[]),
+        Doc(
+            vocab,
+            words="There is a very good reason .".split(),
+            pos="PRON VERB DET ADV ADJ NOUN PUNCT".split(),
+            tags="EX VBZ DT RB JJ NN .".split(),
+            deps="expl ROOT det advmod amod attr punct".split(),
+            heads=[1, 1, 5, 4, 5, 1, 1],
+        ),
+    ]
+
+
+# ================================================================================================ #
+#                                    TEST SYNTACTIC ANALYZER                                       #
+# ================================================================================================ #
+
+
+@pytest.mark.syntactic
+class TestSyntacticAnalyzer:
+    def test_doc_array(self, docs, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        array = DocArray.from_docs(docs)
+        assert len(array) == 3
+        assert array.counts.tolist() == [10, 0, 7]
+        assert array.head[:5].tolist() == [4, 4, 4, 4, 8]
+        assert array.head[10:].tolist() == [11, 11, 15, 14, 15, 11, 11]
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_count(self, docs, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        counts = SyntacticAnalyzer(model="unused").count(DocArray.from_docs(docs))
+        expected = {
+            "noun_count": [1, 0, 1],
+            "verb_count": [2, 0, 1],
+            "adjective_count": [1, 0, 1],
+            "adverb_count": [0, 0, 1],
+            "type_token_ratio": [1, 0, 1],
+            "existential_there_count": [0, 0, 1],
+            "that_relative_clause_count": [1, 0, 0],
+            "wh_relative_clause_count": [0, 0, 0],
+            "pre_quallifier_count": [0, 0, 1],
+            "pre_quantifier_count": [1, 0, 0],
+            "post_determiner_count": [1, 0, 0],
+            "singular_article_count": [0, 0, 1],
+            "definite_article_count": [1, 0, 0],
+            "indefinite_article_count": [0, 0, 1],
+            "singular_determiner_count": [0, 0, 1],
+            "plural_determiner_count": [1, 0, 0],
+            "attributive_adjective_count": [1, 0, 1],
+        }
+        for name, values in expected.items():
+            assert counts.get(name).tolist() == values, name
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
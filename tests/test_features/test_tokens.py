@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_tokens.py                                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:47:00 am                                              #
+# Modified   : Saturday October 17th 2026 12:47:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+
+from aes.utils.config import LogConfig
+from aes.features.extraction.context import ExtractionContext
+from aes.features.extraction.planner import ExtractionPlanner
+from aes.features.extraction.tokens import Tokenizer
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+TEXTS = np.array(["Students should vote. It matters!", "", "One sentence here"], dtype=object)
+WORD_FEATURES = ["word_count", "word_count_gt_5", "avg_word_length", "vocabulary_size"]
+SENTENCE_FEATURES = ["sentence_count", "avg_sentence_length", "std_sentence_length"]
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Counts the calls to Tokenizer.tokenize and Tokenizer.segment."""
+    calls = {"tokenize": 0, "segment": 0}
+    for name in calls:
+        method = getattr(Tokenizer, name)
+
+        def counted(self, texts, method=method, name=name):
+            calls[name] += 1
+            return method(self, texts)
+
+        monkeypatch.setattr(Tokenizer, name, counted)
+    return calls
+
+
+@pytest.fixture
+def punkt():
+    nltk = pytest.importorskip("nltk")
+    try:
+        nltk.data.find("tokenizers/punkt")
+    except LookupError:
+        pytest.skip("The NLTK punkt tokenizer is not installed.")
+
+
+# ================================================================================================ #
+#                                   TEST SHARED TOKENIZATION                                       #
+# ================================================================================================ #
+
+
+@pytest.mark.length
+class TestSharedTokenization:
+    def test_words(self, calls, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        results = ExtractionPlanner(names=WORD_FEATURES).run(TEXTS)
+        assert calls["tokenize"] == 1 and calls["segment"] == 0
+        assert results["word_count"].tolist() == [5, 0, 3]
+
+        # Extractors given the same context reuse its tokenization.
+        from aes.features.extraction.base import FeatureExtractorFactory
+
+        factory = FeatureExtractorFactory()
+        context = ExtractionContext(TEXTS)
+        tokens = context.get("tokens")
+        for name in WORD_FEATURES:
+            factory.create_extractor(name).extract_batch(TEXTS, context=context)
+        assert calls["tokenize"] == 2
+        assert context.get("tokens") is tokens
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_sentences(self, calls, punkt, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        results = ExtractionPlanner(names=WORD_FEATURES + SENTENCE_FEATURES).run(TEXTS)
+        assert calls == {"tokenize": 1, "segment": 1}
+        assert results["sentence_count"].tolist() == [2, 0, 1]
+
+        sentences = Tokenizer().segment(TEXTS)
+        assert sentences.starts[0].tolist() == [0, 22]
+        assert sentences.ends[0].tolist() == [21, 33]
+        assert sentences.lengths[0].tolist() == [4, 3]
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
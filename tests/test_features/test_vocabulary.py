@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_vocabulary.py                                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:22:03 am                                              #
+# Modified   : Saturday October 17th 2026 01:11:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import yaml
+
+from aes.utils import config
+from aes.utils.config import LogConfig
+from aes.features.extraction.planner import ExtractionPlanner
+from aes.features.extraction.vocabulary import Vocabulary
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+LEMMAS = {"cats": "cat", "mice": "mouse", "ran": "run", "running": "run"}
+
+
+def lemmatize(word: str) -> str:
+    return LEMMAS.get(word, word)
+
+
+# ================================================================================================ #
+#                                      TEST VOCABULARY                                             #
+# ================================================================================================ #
+
+
+@pytest.mark.vocabulary
+class TestVocabulary:
+    def test_encode(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        calls = []
+
+        def stem(word: str) -> str:
+            calls.append(word)
+            return word.rstrip("s")
+
+        vocabulary = Vocabulary(stemmer=stem, lemmatizer=lemmatize)
+        ids = vocabulary.encode(pa.array(["Cats", "cats", ",", "Cats", "mice"]))
+        assert ids.dtype == np.int32
+        assert ids.tolist() == [ids[0], ids[1], ids[2], ids[0], ids[4]]
+        assert len(vocabulary) == 4
+        # Each surface form is normalized once, and punctuation is not stemmed at all.
+        assert sorted(calls) == ["cats", "cats", "mice"]
+
+        normalized = vocabulary.ids("normalized")[ids]
+        assert normalized[0] == normalized[1] and normalized[2] == 0
+        assert vocabulary.strings("lemma")[vocabulary.ids("lemma")[ids[4]]] == "mouse"
+
+        vocabulary.encode(pa.array(["cats", "Mice"]))
+        assert len(vocabulary) == 5 and len(calls) == 4
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_persistence(self, tmp_path, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        filepath = str(tmp_path / "vocabulary.parquet")
+        vocabulary = Vocabulary(filepath, lemmatizer=lemmatize)
+        vocabulary.encode(pa.array(["The", "cats", "ran"]))
+        vocabulary.save()
+
+        # A second writer merges its new forms with the stored table.
+        other = Vocabulary(filepath, lemmatizer=lemmatize)
+        assert len(other) == 3
+        other.encode(pa.array(["running", "cats"]))
+        other.save()
+
+        reloaded = Vocabulary(filepath, lemmatizer=lemmatize)
+        assert len(reloaded) == 4
+        ids = reloaded.encode(pa.array(["ran", "running"]))
+        assert len(reloaded) == 4
+        lemmas = reloaded.ids("lemma")[ids]
+        assert lemmas[0] == lemmas[1]
+
+        # Tables built with another lemmatizer are not reused.
+        assert len(Vocabulary(filepath, lemmatizer=str.upper)) == 0
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_view(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        vocabulary = Vocabulary(lemmatizer=lemmatize)
+        words = pa.array(["Cats", ",", "cats", "mice", "!", "ran", "running"])
+        tokens = vocabulary.intern(words, np.array([0, 4, 5, 7]))
+        lemmas = tokens.view("lemma")
+        assert lemmas.offsets.tolist() == [0, 3, 3, 5]
+        assert lemmas.nunique().tolist() == [2, 0, 1]
+        assert tokens.view("normalized").nunique().tolist() == [2, 0, 2]
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_lemmas_count(self, data_config, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        data = pd.DataFrame(
+            {"discourse_id": ["a", "b"], "discourse_text": ["The cats , the cat .", ""]}
+        )
+        features = ExtractionPlanner(names=["lemmas_count"]).extract(data)
+        # The Porter stemmer stands in for the lemmatizer where WordNet is not installed.
+        assert features["lemmas_count"].tolist() == [2, 0]
+        # The vocabulary built during the run is persisted for the next one.
+        vocabulary = Vocabulary(data_config["vocabulary"]["filepath"])
+        size = len(vocabulary)
+        vocabulary.encode(pa.array(["cats", "The"]))
+        assert size > 0 and len(vocabulary) == size
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_configured(self, tmp_path, monkeypatch, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        # The configured vocabulary is persisted relative to the project root, not the
+        # working directory.
+        with open(os.path.join("config", "data.yml")) as file:
+            data = yaml.safe_load(file)
+        data["vocabulary"]["filepath"] = "vocabulary.parquet"
+        (tmp_path / "data.yml").write_text(yaml.safe_dump(data))
+        (tmp_path / "elsewhere").mkdir()
+        monkeypatch.setenv("CONFIG_DATA", str(tmp_path / "data.yml"))
+        monkeypatch.setattr(config, "ROOT", str(tmp_path))
+        monkeypatch.chdir(tmp_path / "elsewhere")
+
+        data = pd.DataFrame({"discourse_id": ["a"], "discourse_text": ["The cats ran ."]})
+        ExtractionPlanner(names=["lemmas_count"]).extract(data)
+        assert (tmp_path / "vocabulary.parquet").exists()
+        assert os.listdir(tmp_path / "elsewhere") == []
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -10,19 +10,20 @@
 # URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Wednesday August 3rd 2022 03:24:48 am                                               #
-# Modified   : Monday August 15th 2022 04:59:41 pm                                                 #
+# Modified   : Saturday October 17th 2026 12:50:00 am                                              #
 # ------------------------------------------------------------------------------------------------ #
 # License    : BSD 3-clause "New" or "Revised" License                                             #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 
+import os
 import inspect
 import pytest
 import logging
 import logging.config
 
 # Enter imports for modules and classes being tested here
-from aes.utils.config import LogConfig
+from aes.utils.config import ROOT, LogConfig, ConfigCache, resolve_path
 
 # ------------------------------------------------------------------------------------------------ #
 logging.config.dictConfig(LogConfig().config)
@@ -45,3 +46,40 @@ class TestConfig:
         assert isinstance(data, dict)
 
         logger.info("Completed {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_read_only(self, caplog):
+        logger.info("\nStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        config = LogConfig()
+        assert config.config is LogConfig().config  # Parsed once and shared.
+        with pytest.raises(TypeError):
+            config.config["version"] = 2
+        data = config.to_dict()
+        data["version"] = 2
+        assert config.config["version"] == 1
+
+        logger.info("Completed {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_invalidation(self, caplog, tmp_path):
+        logger.info("\nStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        filepath = str(tmp_path / "test.yml")
+        with open(filepath, "w") as file:
+            file.write("columns:\n    text: discourse_text\n")
+        cache = ConfigCache()
+        first = cache.get(filepath)
+        assert cache.get(filepath) is first
+        with open(filepath, "w") as file:
+            file.write("columns:\n    text: text\n    idvar: discourse_id\n")
+        assert cache.get(filepath)["columns"]["text"] == "text"
+
+        logger.info("Completed {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_resolve_path(self, caplog, tmp_path, monkeypatch):
+        logger.info("\nStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        monkeypatch.chdir(tmp_path)
+        assert resolve_path("data/features.db") == os.path.join(ROOT, "data/features.db")
+        assert resolve_path(str(tmp_path)) == str(tmp_path)
+
+        logger.info("Completed {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /test_memory.py                                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/AutomatedEssayScoring                              #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:09:42 am                                              #
+# Modified   : Saturday October 17th 2026 12:53:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+import pandas as pd
+
+from aes.utils.config import LogConfig
+from aes.utils.memory import compact_dtypes, memory_report
+
+# ------------------------------------------------------------------------------------------------ #
+logging.config.dictConfig(LogConfig().config)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+
+
+@pytest.mark.memory
+class TestMemory:
+    def test_compact_dtypes(self, caplog):
+        logger.debug("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        data = pd.DataFrame(
+            {
+                "discourse_id": ["a", "b", "c", "d"],
+                "discourse_type": ["Lead", "Claim", "Claim", "Claim"],
+                "commas_count": [0, 1, 2, 255],
+                "word_count": [0, 1, 2, 256],
+                "delta": [-1.0, 0.0, 1.0, 2.0],
+                "missing": pd.array([1, pd.NA, -3, 300], dtype="Int64"),
+                "avg_word_length": [1.5, 2.0, 3.25, np.nan],
+            }
+        )
+        compact = compact_dtypes(data)
+        assert compact["discourse_id"].dtype == pd.StringDtype(storage="pyarrow")
+        assert isinstance(compact["discourse_type"].dtype, pd.CategoricalDtype)
+        assert compact["commas_count"].dtype == np.uint8
+        assert compact["word_count"].dtype == np.uint16
+        # Floats stay floats, even when every value is a whole number.
+        assert compact["delta"].dtype == np.float32
+        assert compact["missing"].dtype == pd.Int16Dtype()
+        assert compact["missing"].isna().tolist() == [False, True, False, False]
+        assert compact["avg_word_length"].dtype == np.float32
+        assert compact["word_count"].tolist() == data["word_count"].tolist()
+
+        report = memory_report(data, compact)
+        assert report.loc["commas_count", "reduction"] == 8
+        assert report.loc["total", "bytes_after"] < report.loc["total", "bytes_before"]
+
+        logger.debug("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))